@@ -1,35 +1,59 @@
 import yaml
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from pydantic import BaseModel, Field, SecretStr
+from typing import Optional, Dict, Any, List
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
 
-from backend.app.core.logging_config import setup_logging  
+from backend.app.core.logging_config import setup_logging
 
 
 class ModelConfig(BaseModel):
     type: str
     class_name: Optional[str] = Field(None, alias="class")
     endpoint: Optional[str] = None
-    api_key: Optional[str] = None
+    api_key: Optional[SecretStr] = None  # Never published to the state store
+    version: Optional[str] = None  # Bump when weights change behind the same class
+    # Prompt template rendered around {review_text}, e.g. "sentiment_user"
+    prompt: Optional[str] = None
+    # Token budget for the rendered prompt; longer reviews are shortened
+    max_input_tokens: Optional[int] = None
+    truncation: str = "head_tail"  # "head_tail" or "truncate" (keep the start only)
+    # "heuristic", "tiktoken[:<encoding>]" or "package.module:ClassName"
+    tokenizer: str = "heuristic"
+
+
+class SchedulerConfig(BaseModel):
+    capacity: int = 8  # Concurrent model calls per process
+    interactive_weight: float = 4.0  # Share of contended slots, relative to bulk
+    bulk_weight: float = 1.0
+    interactive_reserved: int = 2  # Slots bulk analysis can never occupy
+
+
+class WarmupConfig(BaseModel):
+    batches: int = 2  # Synthetic batches per model before readiness; 0 skips
+    batch_size: int = 8
 
 
 class ModelsConfig(BaseModel):
     sentiment: ModelConfig
     language: ModelConfig
+    scheduler: SchedulerConfig = SchedulerConfig()
+    warmup: WarmupConfig = WarmupConfig()
 
 
 class PromptsEngineConfig(BaseModel):
     template_dir: str
     default_version: str
+    reload_interval_seconds: float = 2.0  # Template mtime check interval; 0 disables
+    render_cache_size: int = 1024  # Memoized renders per prompt
 
 
 class PromptsConfig(BaseModel):
     engine: PromptsEngineConfig
 
 
-class LoggingConfig(BaseModel): 
+class LoggingConfig(BaseModel):
     level: str = "INFO"
     console_enabled: bool = True
     console_level: str = "DEBUG"
@@ -38,18 +62,152 @@ class LoggingConfig(BaseModel):
     file_level: str = "INFO"
     rotation: str = "10 MB"
     retention: str = "7 days"
+    # "dev" uses the settings here as they are; "prod" forces INFO sinks, JSON
+    # lines, no diagnose/backtrace and hot-path sampling (see logging_config)
+    profile: str = "dev"
+    json_output: bool = False  # One JSON object per line instead of `format`
+    diagnose: bool = True  # Variable values in tracebacks (slow; may leak data)
+    backtrace: bool = True
+    hot_path_sample_every: int = 1  # Emit 1 in N records per hot-path call site
     format: str = (
         "{time:YYYY-MM-DD HH:mm:ss.SSS} | {level: <8} | {name}:{function}:{line} - {message}"
     )
 
 
+class DashboardConfig(BaseModel):
+    render_mode: str = "clientside"  # "clientside" or "server"
+    # Build the dashboard in the background at startup; false defers it to
+    # the first dashboard request.
+    preload: bool = True
+
+
+class CacheBackendConfig(BaseModel):
+    enabled: bool = True
+    backend: str = "memory"  # "memory", "disk" or "redis"
+    policy: str = "lru"  # "lru", "lfu" or "ttl"
+    max_entries: Optional[int] = 1024
+    max_bytes: Optional[int] = None  # disk only
+    ttl_seconds: Optional[float] = None
+    directory: Optional[str] = None  # disk only; defaults to <cache_dir>/<cache name>
+    redis_url: Optional[str] = None  # redis only
+
+
+class CachesConfig(BaseModel):
+    stats: CacheBackendConfig = CacheBackendConfig(
+        backend="disk", max_entries=32, max_bytes=512 * 1024 * 1024
+    )
+    predictions: CacheBackendConfig = CacheBackendConfig(
+        backend="memory", policy="lfu", max_entries=100_000
+    )
+    figures: CacheBackendConfig = CacheBackendConfig(
+        backend="memory", policy="lru", max_entries=64
+    )
+
+
+class CacheConfig(BaseModel):
+    compression: str = "gzip"  # "none", "gzip" or "zstd" (needs zstandard)
+    compression_level: int = 3
+    # JSON payloads larger than this are stored with the binary (pickle) serializer
+    binary_threshold_bytes: int = 1024 * 1024
+
+
+class DedupConfig(BaseModel):
+    enabled: bool = True
+    near_duplicates: bool = True  # MinHash/LSH on top of exact normalized-text matches
+    threshold: float = 0.85  # Estimated Jaccard similarity of character shingles
+    num_perm: int = 128
+    shingle_size: int = 5
+
+
+class ProgressiveConfig(BaseModel):
+    enabled: bool = True
+    min_rows: int = 5000  # Smaller datasets are analyzed in one pass
+    sample_size: int = 1000  # Stratified (by product) first batch
+    refine_batch_size: int = 5000  # Unique reviews scored between refinements
+    confidence_level: float = 0.95
+    seed: Optional[int] = None
+
+
+class WatcherConfig(BaseModel):
+    enabled: bool = False
+    poll_interval_seconds: float = 2.0
+    # A changed file is ingested once it has been unchanged for this long
+    debounce_seconds: float = 5.0
+    drop_directory: Optional[str] = None  # Extra CSV files to ingest
+    pattern: str = "*.csv"
+
+
+class RollupDimensionConfig(BaseModel):
+    name: str
+    column: str
+    bucket: Optional[str] = None  # "day", "week" or "month" for date columns
+
+
+class RollupsConfig(BaseModel):
+    dimensions: List[RollupDimensionConfig] = [
+        RollupDimensionConfig(name="product", column="product_id")
+    ]
+
+
+class ResultsStoreConfig(BaseModel):
+    backend: str = "sqlite"  # "sqlite" (results_db_file in cache_dir) or "postgres"
+    postgres_dsn: Optional[str] = None  # Defaults to supabase.db_url
+    write_batch_size: int = 5000  # Rows per executemany/COPY chunk
+    pool_size: int = 4  # Postgres connections per process
+    export_batch_size: int = 10000  # Rows per query while streaming an export
+
+
+class TrendsConfig(BaseModel):
+    timestamp_column: Optional[str] = None  # Trends are disabled without one
+    hourly_retention_days: int = 90  # Daily buckets are kept for the full history
+
+
+class AdmissionLimitConfig(BaseModel):
+    max_in_flight: int = 16
+    max_queue: int = 64
+    max_queue_wait_seconds: float = 2.0  # Longer (predicted) waits get a 429
+
+
+class AdmissionConfig(BaseModel):
+    shed_policy: str = (
+        "reject_new"  # "reject_new" or "drop_oldest" when the queue is full
+    )
+    analyze_review: AdmissionLimitConfig = AdmissionLimitConfig()
+    analyze_reviews: AdmissionLimitConfig = AdmissionLimitConfig(
+        max_in_flight=2, max_queue=4, max_queue_wait_seconds=10.0
+    )
+
+
 class BackendConfig(BaseModel):
     host: str
     port: int
     cache_dir: str
     dataset_path: str
     results_cache_file: str
+    results_db_file: str = "review_results.sqlite3"
+    results_store: ResultsStoreConfig = ResultsStoreConfig()
+    cache: CacheConfig = CacheConfig()
     force_reanalyze_on_startup: bool = False
+    mode: str = "dev"  # "dev" (one worker, auto-reload) or "prod" (N workers)
+    workers: int = 1
+    # Processes used by one analysis run; 1 analyzes in-process
+    analysis_workers: int = 1
+    dedup: DedupConfig = DedupConfig()
+    progressive: ProgressiveConfig = ProgressiveConfig()
+    watcher: WatcherConfig = WatcherConfig()
+    rollups: RollupsConfig = RollupsConfig()
+    trends: TrendsConfig = TrendsConfig()
+    admission: AdmissionConfig = AdmissionConfig()
+    # Required in the X-Admin-Token header of /api/v1/admin/*; unset disables them
+    admin_token: Optional[SecretStr] = None
+
+
+class SupabaseConfig(BaseModel):
+    url: Optional[str] = None
+    service_key: Optional[str] = None
+    # Postgres connection string (Project Settings > Database), used by the
+    # postgres results store.
+    db_url: Optional[str] = None
 
 
 class Settings(BaseModel):
@@ -57,7 +215,10 @@ class Settings(BaseModel):
     models: ModelsConfig
     prompts: PromptsConfig
     frontend_base_url: str
-    logging: LoggingConfig 
+    dashboard: DashboardConfig = DashboardConfig()
+    caches: CachesConfig = CachesConfig()
+    supabase: SupabaseConfig = SupabaseConfig()
+    logging: LoggingConfig
 
 
 def load_config() -> Settings:
@@ -72,6 +233,11 @@ def load_config() -> Settings:
     config_data["backend"]["dataset_path"] = str(
         PROJECT_ROOT / config_data["backend"]["dataset_path"]
     )
+    drop_directory = (config_data["backend"].get("watcher") or {}).get("drop_directory")
+    if drop_directory:
+        config_data["backend"]["watcher"]["drop_directory"] = str(
+            PROJECT_ROOT / drop_directory
+        )
     config_data["prompts"]["engine"]["template_dir"] = str(
         PROJECT_ROOT / config_data["prompts"]["engine"]["template_dir"]
     )
@@ -83,7 +249,7 @@ def load_config() -> Settings:
     return loaded_settings
 
 
-settings = load_config()  
+settings = load_config()
 
 # Ensure cache directory exists at runtime
 Path(settings.backend.cache_dir).mkdir(parents=True, exist_ok=True)
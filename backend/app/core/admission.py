@@ -0,0 +1,174 @@
+import asyncio
+import math
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict
+
+from loguru import logger
+
+# Weight of the latest request in the moving average of service time.
+SERVICE_TIME_ALPHA = 0.2
+SHED_POLICIES = ("reject_new", "drop_oldest")
+
+
+class Overloaded(Exception):
+    """Raised when a request is not admitted; maps to HTTP 429."""
+
+    def __init__(self, name: str, reason: str, retry_after: int):
+        super().__init__(f"'{name}' is overloaded ({reason}); retry in {retry_after}s.")
+        self.name = name
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """Bound the in-flight requests and the wait queue of one endpoint.
+
+    Up to ``max_in_flight`` requests run at once and up to ``max_queue`` wait
+    in FIFO order. A request is rejected straight away when the moving
+    average of service time predicts it would wait longer than
+    ``max_queue_wait_seconds``, and rejected when it has waited that long, so
+    accepted requests see a bounded queueing delay. With a full queue,
+    ``shed_policy`` either rejects the newcomer (``reject_new``) or drops
+    the oldest waiter in its favour (``drop_oldest``, which suits clients
+    that give up and retry). Every rejection carries a ``Retry-After``
+    estimate of when the backlog ahead will have drained.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_in_flight: int,
+        max_queue: int,
+        max_queue_wait_seconds: float,
+        shed_policy: str = "reject_new",
+        initial_service_seconds: float = 0.05,
+    ):
+        if shed_policy not in SHED_POLICIES:
+            raise ValueError(
+                f"Unknown shed policy '{shed_policy}'. Use one of {SHED_POLICIES}."
+            )
+        self.name = name
+        self.max_in_flight = max(1, max_in_flight)
+        self.max_queue = max(0, max_queue)
+        self.max_queue_wait_seconds = max_queue_wait_seconds
+        self.shed_policy = shed_policy
+        self.service_seconds = initial_service_seconds
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.rejected: Counter = Counter()
+
+    def estimated_wait(self, position: int) -> float:
+        """Seconds until the request at queue ``position`` (1-based) starts."""
+        return position / self.max_in_flight * self.service_seconds
+
+    def retry_after(self) -> int:
+        return max(1, math.ceil(self.estimated_wait(len(self.waiters) + 1)))
+
+    def _reject(self, reason: str) -> Overloaded:
+        self.rejected[reason] += 1
+        logger.debug(
+            f"Admission '{self.name}': rejected ({reason}), "
+            f"{self.in_flight} in flight, {len(self.waiters)} queued."
+        )
+        return Overloaded(self.name, reason, self.retry_after())
+
+    def _hand_off(self):
+        while self.waiters and self.in_flight < self.max_in_flight:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    async def _wait_for_slot(self):
+        position = len(self.waiters) + 1
+        if self.estimated_wait(position) > self.max_queue_wait_seconds:
+            raise self._reject("predicted_wait")
+        if len(self.waiters) >= self.max_queue:
+            if self.shed_policy != "drop_oldest" or not self.waiters:
+                raise self._reject("queue_full")
+            self.waiters.popleft().set_exception(self._reject("dropped"))
+
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        try:
+            await asyncio.wait_for(
+                asyncio.shield(waiter), timeout=self.max_queue_wait_seconds
+            )
+        except asyncio.TimeoutError:
+            if waiter.done() and waiter.exception() is None:
+                return  # Granted as the timeout fired
+            self._discard(waiter)
+            raise self._reject("timeout") from None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                self._release()
+            else:
+                self._discard(waiter)
+            raise
+
+    def _discard(self, waiter: asyncio.Future):
+        if waiter in self.waiters:
+            self.waiters.remove(waiter)
+        if not waiter.done():
+            waiter.cancel()
+
+    def _release(self):
+        self.in_flight -= 1
+        self._hand_off()
+
+    @asynccontextmanager
+    async def admit(self):
+        """Run the block once admitted; raises Overloaded otherwise."""
+        if self.in_flight < self.max_in_flight and not self.waiters:
+            self.in_flight += 1
+        else:
+            await self._wait_for_slot()
+        self.admitted += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            self.service_seconds += SERVICE_TIME_ALPHA * (
+                elapsed - self.service_seconds
+            )
+            self._release()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "max_queue_wait_seconds": self.max_queue_wait_seconds,
+            "shed_policy": self.shed_policy,
+            "in_flight": self.in_flight,
+            "queued": len(self.waiters),
+            "admitted": self.admitted,
+            "rejected": dict(self.rejected),
+            "service_ms_ewma": round(self.service_seconds * 1000, 3),
+        }
+
+
+_controllers: Dict[str, AdmissionController] = {}
+
+
+def get_admission_controller(name: str) -> AdmissionController:
+    """Return the process-wide controller configured in ``backend.admission``."""
+    from ..config import settings
+
+    if name not in _controllers:
+        config = getattr(settings.backend.admission, name)
+        _controllers[name] = AdmissionController(
+            name,
+            max_in_flight=config.max_in_flight,
+            max_queue=config.max_queue,
+            max_queue_wait_seconds=config.max_queue_wait_seconds,
+            shed_policy=settings.backend.admission.shed_policy,
+        )
+    return _controllers[name]
+
+
+def admission_stats() -> Dict[str, Dict[str, Any]]:
+    return {name: c.stats() for name, c in _controllers.items()}
@@ -0,0 +1,497 @@
+import hashlib
+import os
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+from loguru import logger
+
+from . import serialization
+
+EVICTION_POLICIES = ("lru", "lfu", "ttl")
+
+_SAFE_KEY_RE = re.compile(r"^[A-Za-z0-9_.\-]{1,150}$")
+
+
+class _EntryMeta:
+    __slots__ = ("created", "hits", "size")
+
+    def __init__(self, created: float, size: int = 0):
+        self.created = created
+        self.hits = 0
+        self.size = size
+
+
+class _EvictionIndex:
+    """Entry metadata ordered for eviction under an LRU, LFU or TTL policy.
+
+    The OrderedDict is kept in recency order for LRU and in insertion order
+    for LFU/TTL, so LRU and TTL victims are its first entry. LFU keeps keys in
+    buckets by hit count, each in the order keys reached that count, and the
+    lowest non-empty count, so every operation is O(1); ties go to the entry
+    that has had its count longest.
+    """
+
+    def __init__(self, policy: str):
+        if policy not in EVICTION_POLICIES:
+            raise ValueError(
+                f"Unknown eviction policy '{policy}'. Use one of {EVICTION_POLICIES}."
+            )
+        self.policy = policy
+        self.entries: "OrderedDict[str, _EntryMeta]" = OrderedDict()
+        self.total_size = 0
+        # LFU only: hit count -> keys with that count; None when unknown.
+        self._buckets: "Dict[int, OrderedDict[str, None]]" = {}
+        self._min_hits: Optional[int] = None
+
+    def touch(self, key: str):
+        meta = self.entries[key]
+        if self.policy == "lfu":
+            self._unbucket(key, meta.hits)
+            if self._min_hits == meta.hits and meta.hits not in self._buckets:
+                self._min_hits = meta.hits + 1
+            self._bucket(key, meta.hits + 1)
+        meta.hits += 1
+        if self.policy == "lru":
+            self.entries.move_to_end(key)
+
+    def add(self, key: str, size: int = 0, created: Optional[float] = None):
+        self.remove(key)
+        self.entries[key] = _EntryMeta(created or time.time(), size)
+        self.total_size += size
+        if self.policy == "lfu":
+            self._bucket(key, 0)
+            self._min_hits = 0
+
+    def remove(self, key: str) -> bool:
+        meta = self.entries.pop(key, None)
+        if meta is None:
+            return False
+        self.total_size -= meta.size
+        if self.policy == "lfu":
+            self._unbucket(key, meta.hits)
+            if self._min_hits == meta.hits and meta.hits not in self._buckets:
+                self._min_hits = None
+        return True
+
+    def _bucket(self, key: str, hits: int):
+        self._buckets.setdefault(hits, OrderedDict())[key] = None
+
+    def _unbucket(self, key: str, hits: int):
+        bucket = self._buckets[hits]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[hits]
+
+    def victim(self, keep: Optional[str] = None) -> Optional[str]:
+        """The entry to evict next. ``keep`` (the entry just added) is only
+        returned if it is the last one, so LFU never evicts a new entry
+        because older ones have been hit more often."""
+        if not self.entries:
+            return None
+        if self.policy != "lfu":
+            # LRU: least recently used first. TTL: oldest (closest to expiry)
+            # first. ``keep`` was added last, so it is never first unless alone.
+            return next(iter(self.entries))
+        if self._min_hits is None:
+            self._min_hits = min(self._buckets)
+        for key in self._buckets[self._min_hits]:
+            if key != keep:
+                return key
+        # ``keep`` is alone in the lowest bucket: take the next one up.
+        others = [hits for hits in self._buckets if hits != self._min_hits]
+        return next(iter(self._buckets[min(others)])) if others else keep
+
+    def clear(self):
+        self.entries.clear()
+        self.total_size = 0
+        self._buckets.clear()
+        self._min_hits = None
+
+
+class CacheBackend(ABC):
+    """Key/value cache with a bounded size and an eviction policy."""
+
+    def __init__(
+        self,
+        name: str,
+        policy: str = "lru",
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ):
+        self.name = name
+        self.policy = policy
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _expired(self, created: float) -> bool:
+        return bool(self.ttl_seconds) and time.time() - created > self.ttl_seconds
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        pass
+
+    @abstractmethod
+    def set(self, key: str, value: Any):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        pass
+
+    @abstractmethod
+    def clear(self):
+        pass
+
+    def info(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "backend": type(self).__name__,
+            "policy": self.policy,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class NullCacheBackend(CacheBackend):
+    """Cache that stores nothing; used when a cache is disabled."""
+
+    def get(self, key: str) -> Optional[Any]:
+        self.misses += 1
+        return None
+
+    def set(self, key: str, value: Any):
+        pass
+
+    def delete(self, key: str) -> bool:
+        return False
+
+    def clear(self):
+        pass
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process cache bounded by entry count."""
+
+    def __init__(self, name: str, **kwargs):
+        super().__init__(name, **kwargs)
+        self._values: Dict[str, Any] = {}
+        self._index = _EvictionIndex(self.policy)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            meta = self._index.entries.get(key)
+            if meta is None:
+                self.misses += 1
+                return None
+            if self._expired(meta.created):
+                self._index.remove(key)
+                self._values.pop(key, None)
+                self.misses += 1
+                return None
+            self._index.touch(key)
+            self.hits += 1
+            return self._values[key]
+
+    def set(self, key: str, value: Any):
+        with self._lock:
+            self._index.add(key)
+            self._values[key] = value
+            while self.max_entries and len(self._index.entries) > self.max_entries:
+                victim = self._index.victim(keep=key)
+                self._index.remove(victim)
+                self._values.pop(victim, None)
+                self.evictions += 1
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            self._values.pop(key, None)
+            return self._index.remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+            self._index.clear()
+
+    def info(self) -> Dict[str, Any]:
+        info = super().info()
+        info["entries"] = len(self._index.entries)
+        return info
+
+
+class DiskCacheBackend(CacheBackend):
+    """One file per key in a directory, bounded by total bytes and entry count.
+
+    Files use the framed format from ``core.serialization`` and are written
+    atomically. Safe keys are used as file names as-is; others are hashed.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        directory: str,
+        max_bytes: Optional[int] = None,
+        encode_options: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.encode_options = encode_options or {}
+        self._index = _EvictionIndex(self.policy)
+        self._lock = threading.Lock()
+        self._scan()
+
+    @staticmethod
+    def _file_name(key: str) -> str:
+        if _SAFE_KEY_RE.match(key) and not key.startswith("."):
+            return key
+        return hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / self._file_name(key)
+
+    def _scan(self):
+        files = [
+            p
+            for p in self.directory.iterdir()
+            if p.is_file()
+            and not p.name.startswith(".")
+            and p.suffix not in (".tmp", ".corrupt")
+        ]
+        for path in sorted(files, key=lambda p: p.stat().st_mtime):
+            stat = path.stat()
+            self._index.add(path.name, stat.st_size, created=stat.st_mtime)
+        logger.debug(
+            f"DiskCacheBackend '{self.name}': {len(self._index.entries)} entries, {self._index.total_size} bytes in {self.directory}"
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        file_name = self._file_name(key)
+        path = self.directory / file_name
+        with self._lock:
+            meta = self._index.entries.get(file_name)
+            if meta is None and path.exists():
+                # Written by another process sharing the directory.
+                stat = path.stat()
+                self._index.add(file_name, stat.st_size, created=stat.st_mtime)
+                meta = self._index.entries[file_name]
+            if meta is None or not path.exists():
+                self._index.remove(file_name)
+                self.misses += 1
+                return None
+            if self._expired(meta.created):
+                self._remove_file(file_name)
+                self.misses += 1
+                return None
+            self._index.touch(file_name)
+        try:
+            value = serialization.read_cache_file(path)
+        except Exception as e:
+            quarantine_path = path.with_name(path.name + ".corrupt")
+            logger.error(
+                f"Error reading cache file {path}: {e}. Moving it to {quarantine_path.name}.",
+                exc_info=True,
+            )
+            with self._lock:
+                self._index.remove(file_name)
+            try:
+                os.replace(path, quarantine_path)
+            except OSError as oe:
+                logger.warning(
+                    f"Could not quarantine corrupted cache file {path}: {oe}"
+                )
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        file_name = self._file_name(key)
+        size = serialization.write_cache_file(
+            self.directory / file_name, value, **self.encode_options
+        )
+        with self._lock:
+            self._index.add(file_name, size)
+            self._evict_locked(keep=file_name)
+
+    def _evict_locked(self, keep: Optional[str] = None):
+        while len(self._index.entries) > 1 and (
+            (self.max_entries and len(self._index.entries) > self.max_entries)
+            or (self.max_bytes and self._index.total_size > self.max_bytes)
+        ):
+            victim = self._index.victim(keep=keep)
+            logger.debug(f"DiskCacheBackend '{self.name}': evicting {victim}")
+            self._remove_file(victim)
+            self.evictions += 1
+
+    def _remove_file(self, file_name: str):
+        self._index.remove(file_name)
+        try:
+            (self.directory / file_name).unlink()
+        except FileNotFoundError:
+            pass
+
+    def delete(self, key: str) -> bool:
+        file_name = self._file_name(key)
+        with self._lock:
+            existed = file_name in self._index.entries
+            self._remove_file(file_name)
+        return existed
+
+    def clear(self):
+        with self._lock:
+            for file_name in list(self._index.entries):
+                self._remove_file(file_name)
+
+    def info(self) -> Dict[str, Any]:
+        info = super().info()
+        info.update(
+            {
+                "entries": len(self._index.entries),
+                "bytes": self._index.total_size,
+                "max_bytes": self.max_bytes,
+                "directory": str(self.directory),
+            }
+        )
+        return info
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache in a Redis-compatible server, namespaced by key prefix.
+
+    Any client exposing ``get``/``set``/``delete``/``scan_iter`` works, so a
+    local stand-in (e.g. ``fakeredis.FakeRedis()``) can be passed as
+    ``client``. Redis evicts keys itself: TTLs are set per key, and LRU/LFU
+    follow the server's ``maxmemory-policy`` (``allkeys-lru``/``allkeys-lfu``).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        client: Any = None,
+        url: Optional[str] = None,
+        encode_options: Optional[Dict[str, Any]] = None,
+        **kwargs,
+    ):
+        super().__init__(name, **kwargs)
+        if client is None:
+            try:
+                import redis
+            except ImportError as e:
+                raise RuntimeError(
+                    f"Cache '{name}' uses the redis backend but the 'redis' package is not installed."
+                ) from e
+            client = redis.Redis.from_url(url or "redis://localhost:6379/0")
+        self.client = client
+        self.prefix = f"review-analysis:{name}:"
+        self.encode_options = encode_options or {}
+        if self.policy in ("lru", "lfu"):
+            logger.info(
+                f"RedisCacheBackend '{name}': {self.policy.upper()} eviction is handled by the server's maxmemory-policy (allkeys-{self.policy})."
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(self.prefix + key)
+        if raw is None:
+            self.misses += 1
+            return None
+        try:
+            value = serialization.decode(raw)
+        except Exception as e:
+            logger.error(
+                f"RedisCacheBackend '{self.name}': undecodable value for {key}: {e}"
+            )
+            self.client.delete(self.prefix + key)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        ttl = int(self.ttl_seconds) if self.ttl_seconds else None
+        self.client.set(
+            self.prefix + key,
+            serialization.encode(value, **self.encode_options),
+            ex=ttl,
+        )
+
+    def delete(self, key: str) -> bool:
+        return bool(self.client.delete(self.prefix + key))
+
+    def clear(self):
+        for redis_key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(redis_key)
+
+
+def create_cache_backend(
+    name: str,
+    config,
+    default_directory: Optional[str] = None,
+    encode_options: Optional[Dict[str, Any]] = None,
+) -> CacheBackend:
+    """Build a backend from a ``CacheBackendConfig``."""
+    common = {
+        "policy": config.policy,
+        "max_entries": config.max_entries,
+        "ttl_seconds": config.ttl_seconds,
+    }
+    if not config.enabled:
+        return NullCacheBackend(name, **common)
+    if config.backend == "memory":
+        return MemoryCacheBackend(name, **common)
+    if config.backend == "disk":
+        directory = config.directory or str(Path(default_directory or ".") / name)
+        return DiskCacheBackend(
+            name,
+            directory=directory,
+            max_bytes=config.max_bytes,
+            encode_options=encode_options,
+            **common,
+        )
+    if config.backend == "redis":
+        return RedisCacheBackend(
+            name, url=config.redis_url, encode_options=encode_options, **common
+        )
+    raise ValueError(
+        f"Unknown cache backend '{config.backend}' for cache '{name}'. Use memory, disk or redis."
+    )
+
+
+_cache_instances: Dict[str, CacheBackend] = {}
+_cache_instances_lock = threading.Lock()
+
+
+def get_cache(name: str) -> CacheBackend:
+    """Return the process-wide cache named in ``settings.caches``."""
+    from ..config import settings
+
+    with _cache_instances_lock:
+        if name not in _cache_instances:
+            config = getattr(settings.caches, name)
+            cache_cfg = settings.backend.cache
+            _cache_instances[name] = create_cache_backend(
+                name,
+                config,
+                default_directory=settings.backend.cache_dir,
+                encode_options={
+                    "compression": cache_cfg.compression,
+                    "compression_level": cache_cfg.compression_level,
+                    "binary_threshold_bytes": cache_cfg.binary_threshold_bytes,
+                },
+            )
+            logger.info(
+                f"Cache '{name}' using {type(_cache_instances[name]).__name__} (policy: {config.policy})"
+            )
+        return _cache_instances[name]
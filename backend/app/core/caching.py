@@ -1,37 +1,174 @@
+import asyncio
+import hashlib
 import json
-import joblib
+import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, Optional
+from loguru import logger
 
-from ..config import settings
+from .cache_backends import get_cache
 
-def save_cache(data: Any, file_name: str):
-    cache_path = Path(settings.backend.cache_dir) / file_name
-    try:
-        cache_path.parent.mkdir(parents=True, exist_ok=True) # Ensure dir exists
-        if isinstance(data, (dict, list)) and file_name.endswith(".json"):
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=4)
+# Bytes hashed at the head and tail of the dataset, plus this many evenly
+# spaced blocks in between. Files smaller than the sample are hashed whole.
+FINGERPRINT_EDGE_BYTES = 64 * 1024
+FINGERPRINT_BLOCK_BYTES = 4 * 1024
+FINGERPRINT_MIDDLE_BLOCKS = 16
+
+CACHE_META_KEY = "_cache_meta"
+
+
+def _digest(payload: Any) -> str:
+    raw = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+
+def dataset_fingerprint(dataset_path: str) -> Dict[str, Any]:
+    """Fingerprint a dataset file by size and a sampled content hash.
+
+    The mtime is recorded for diagnostics only: touching or copying the file
+    without changing its contents must not force a re-analysis.
+    """
+    path = Path(dataset_path)
+    if not path.exists():
+        return {"digest": "missing", "size": 0, "mtime": None}
+    stat = path.stat()
+    size = stat.st_size
+    hasher = hashlib.sha1(str(size).encode())
+    with open(path, "rb") as f:
+        sample_total = 2 * FINGERPRINT_EDGE_BYTES + (
+            FINGERPRINT_MIDDLE_BLOCKS * FINGERPRINT_BLOCK_BYTES
+        )
+        if size <= sample_total:
+            hasher.update(f.read())
         else:
-            joblib.dump(data, cache_path)
-        print(f"Data cached successfully to {cache_path}")
+            hasher.update(f.read(FINGERPRINT_EDGE_BYTES))
+            middle_span = size - 2 * FINGERPRINT_EDGE_BYTES - FINGERPRINT_BLOCK_BYTES
+            for i in range(FINGERPRINT_MIDDLE_BLOCKS):
+                offset = FINGERPRINT_EDGE_BYTES + (
+                    middle_span * i // max(1, FINGERPRINT_MIDDLE_BLOCKS - 1)
+                )
+                f.seek(offset)
+                hasher.update(f.read(FINGERPRINT_BLOCK_BYTES))
+            f.seek(size - FINGERPRINT_EDGE_BYTES)
+            hasher.update(f.read(FINGERPRINT_EDGE_BYTES))
+    return {"digest": hasher.hexdigest(), "size": size, "mtime": stat.st_mtime}
+
+
+def models_fingerprint(model_configs: Dict[str, Any]) -> str:
+    """Hash of the serving model types, classes, endpoints and versions
+    (API keys excluded), given ``{kind: ModelConfig}``."""
+    return _digest(
+        {
+            kind: config.model_dump(by_alias=True, exclude={"api_key"})
+            for kind, config in model_configs.items()
+        }
+    )
+
+
+def prompts_fingerprint(prompts: Dict[str, Any]) -> str:
+    """Hash of every loaded prompt's name, version and template text, given
+    ``{key: CompiledPrompt}``."""
+    return _digest(
+        {
+            key: {"version": prompt.version, "template": prompt.template}
+            for key, prompt in prompts.items()
+        }
+    )
+
+
+def build_fingerprint(**components: Any) -> Dict[str, str]:
+    """Build a cache fingerprint from named components.
+
+    Each cache entry is saved with only the components it depends on, so a
+    change to one component invalidates just the entries that use it.
+    Dict components (e.g. ``dataset_fingerprint``) contribute their ``digest``.
+    """
+    return {
+        name: value["digest"] if isinstance(value, dict) else str(value)
+        for name, value in components.items()
+    }
+
+
+def _fingerprint_mismatches(
+    stored: Optional[Dict[str, str]], expected: Dict[str, str]
+) -> Iterable[str]:
+    stored = stored or {}
+    return [name for name, value in expected.items() if stored.get(name) != value]
+
+
+def save_cache(
+    data: Any,
+    file_name: str,
+    fingerprint: Optional[Dict[str, str]] = None,
+    cache_name: str = "stats",
+) -> bool:
+    """Store ``data`` under ``file_name`` in the ``cache_name`` backend."""
+    backend = get_cache(cache_name)
+    if fingerprint is not None:
+        data = {
+            CACHE_META_KEY: {"fingerprint": fingerprint, "created_at": time.time()},
+            "data": data,
+        }
+    try:
+        started = time.perf_counter()
+        backend.set(file_name, data)
+        logger.info(
+            f"Data cached as '{file_name}' in '{cache_name}' cache ({(time.perf_counter() - started) * 1000:.1f} ms)"
+        )
+        return True
+    except Exception as e:
+        logger.error(f"Error saving cache entry '{file_name}': {e}", exc_info=True)
+        return False
+
+
+def load_cache(
+    file_name: str,
+    fingerprint: Optional[Dict[str, str]] = None,
+    cache_name: str = "stats",
+) -> Optional[Any]:
+    """Load a cache entry; with ``fingerprint``, stale entries are invalidated."""
+    backend = get_cache(cache_name)
+    try:
+        started = time.perf_counter()
+        data = backend.get(file_name)
     except Exception as e:
-        print(f"Error saving cache to {cache_path}: {e}")
-
-def load_cache(file_name: str) -> Optional[Any]:
-    cache_path = Path(settings.backend.cache_dir) / file_name
-    if cache_path.exists():
-        try:
-            if file_name.endswith(".json"):
-                 with open(cache_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-            else:
-                data = joblib.load(cache_path)
-            print(f"Data loaded successfully from cache {cache_path}")
-            return data
-        except Exception as e:
-            print(f"Error loading cache from {cache_path}: {e}. Invalidating cache.")
-            try: cache_path.unlink() # Remove corrupted cache
-            except OSError as oe: print(f"Error removing corrupted cache file {cache_path}: {oe}")
-            return None
-    return None
+        logger.error(f"Error loading cache entry '{file_name}': {e}", exc_info=True)
+        return None
+    if data is None:
+        return None
+    logger.info(
+        f"Data loaded from '{cache_name}' cache entry '{file_name}' in {(time.perf_counter() - started) * 1000:.1f} ms"
+    )
+
+    is_envelope = isinstance(data, dict) and CACHE_META_KEY in data
+    if fingerprint is None:
+        return data["data"] if is_envelope else data
+
+    stored = data[CACHE_META_KEY].get("fingerprint") if is_envelope else None
+    changed = list(_fingerprint_mismatches(stored, fingerprint))
+    if changed:
+        logger.info(
+            f"Cache entry '{file_name}' is stale (changed: {', '.join(changed)}). Invalidating."
+        )
+        backend.delete(file_name)
+        return None
+    return data["data"]
+
+
+async def save_cache_async(
+    data: Any,
+    file_name: str,
+    fingerprint: Optional[Dict[str, str]] = None,
+    cache_name: str = "stats",
+) -> bool:
+    """``save_cache`` in a worker thread, keeping the event loop free."""
+    return await asyncio.to_thread(save_cache, data, file_name, fingerprint, cache_name)
+
+
+async def load_cache_async(
+    file_name: str,
+    fingerprint: Optional[Dict[str, str]] = None,
+    cache_name: str = "stats",
+) -> Optional[Any]:
+    """``load_cache`` in a worker thread, keeping the event loop free."""
+    return await asyncio.to_thread(load_cache, file_name, fingerprint, cache_name)
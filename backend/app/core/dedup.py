@@ -0,0 +1,208 @@
+import hashlib
+import re
+import unicodedata
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ..config import DedupConfig
+
+# Shingles are hashed with a polynomial over their code points, mixed with the
+# splitmix64 finalizer, then permuted by multiply-add-shift hashing; all uint64
+# arithmetic wraps, so no modulo (or Python loop per shingle) is needed.
+_SHINGLE_BASE = np.uint64(0x100000001B3)
+_MIX_MULTIPLIERS = (np.uint64(0xBF58476D1CE4E5B9), np.uint64(0x94D049BB133111EB))
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """Case-fold, strip punctuation and collapse whitespace.
+
+    Text made only of punctuation or symbols (e.g. emoji) keeps them, so such
+    reviews are not all collapsed into one empty key.
+    """
+    text = unicodedata.normalize("NFKC", text).casefold()
+    stripped = _NON_WORD_RE.sub(" ", text)
+    if stripped.strip():
+        text = stripped
+    return _WHITESPACE_RE.sub(" ", text).strip()
+
+
+def text_key(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def lsh_params(threshold: float, num_perm: int) -> Tuple[int, int]:
+    """Pick ``(bands, rows)`` with ``bands * rows <= num_perm`` whose LSH
+    S-curve midpoint ``(1 / bands) ** (1 / rows)`` is closest to ``threshold``."""
+    best = (num_perm, 1)
+    best_error = float("inf")
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        error = abs((1 / bands) ** (1 / rows) - threshold)
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class MinHasher:
+    """MinHash signatures over character shingles of normalized text."""
+
+    def __init__(self, num_perm: int = 128, shingle_size: int = 5, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        rng = np.random.default_rng(seed)
+        # Odd multipliers, so each permutation is a bijection on uint64.
+        self._a = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64) * 2 + 1
+        self._b = rng.integers(0, 1 << 63, size=num_perm, dtype=np.uint64)
+
+    def shingle_hashes(self, normalized: str) -> np.ndarray:
+        """64-bit hashes of every ``shingle_size``-character window (the whole
+        text if it is shorter). Repeated shingles are kept: they do not
+        change a minimum."""
+        codes = np.frombuffer(normalized.encode("utf-32-le"), dtype=np.uint32)
+        codes = codes.astype(np.uint64)
+        k = self.shingle_size
+        windows = max(1, len(codes) - k + 1)
+        hashes = np.zeros(windows, dtype=np.uint64)
+        for offset in range(min(k, len(codes))):
+            hashes *= _SHINGLE_BASE
+            hashes += codes[offset : offset + windows]
+        for multiplier in _MIX_MULTIPLIERS:
+            hashes ^= hashes >> np.uint64(31)
+            hashes *= multiplier
+        hashes ^= hashes >> np.uint64(31)
+        return hashes
+
+    def signature(self, normalized: str) -> np.ndarray:
+        permuted = np.multiply.outer(self._a, self.shingle_hashes(normalized))
+        permuted += self._b[:, None]
+        # The high half of a*x+b is the permuted value; the minimum's high
+        # half is the minimum of the high halves.
+        return permuted.min(axis=1) >> np.uint64(32)
+
+
+@dataclass
+class DedupResult:
+    """Rows grouped by duplicate cluster.
+
+    ``groups`` lists row indices per cluster, representative (first seen)
+    row first, in order of first appearance.
+    """
+
+    groups: List[List[int]] = field(default_factory=list)
+    exact_duplicates: int = 0
+    near_duplicates: int = 0
+
+    @property
+    def rows(self) -> int:
+        return sum(len(g) for g in self.groups)
+
+
+class _UnionFind:
+    def __init__(self, size: int):
+        self.parent = list(range(size))
+
+    def find(self, i: int) -> int:
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i: int, j: int):
+        ri, rj = self.find(i), self.find(j)
+        if ri != rj:
+            # Keep the earliest text as the root so it stays the representative.
+            self.parent[max(ri, rj)] = min(ri, rj)
+
+
+class Deduplicator:
+    """Collapse exact duplicates by normalized-text hash and near-duplicates
+    by MinHash/LSH.
+
+    LSH candidates are confirmed by their estimated Jaccard similarity, so a
+    band collision alone never merges two texts.
+    """
+
+    def __init__(
+        self,
+        near_duplicates: bool = True,
+        threshold: float = 0.85,
+        num_perm: int = 128,
+        shingle_size: int = 5,
+    ):
+        self.near_duplicates = near_duplicates
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm=num_perm, shingle_size=shingle_size)
+        self.bands, self.rows_per_band = lsh_params(threshold, num_perm)
+
+    def group(self, texts: Sequence[str]) -> DedupResult:
+        result = DedupResult()
+
+        # Exact pass: one entry per distinct normalized text.
+        unique_index: Dict[str, int] = {}
+        unique_texts: List[str] = []
+        members: List[List[int]] = []
+        for row, text in enumerate(texts):
+            normalized = normalize_text(text)
+            key = text_key(normalized)
+            idx = unique_index.get(key)
+            if idx is None:
+                unique_index[key] = len(unique_texts)
+                unique_texts.append(normalized)
+                members.append([row])
+            else:
+                members[idx].append(row)
+                result.exact_duplicates += 1
+
+        clusters = _UnionFind(len(unique_texts))
+        if self.near_duplicates and len(unique_texts) > 1:
+            self._link_near_duplicates(unique_texts, clusters)
+
+        grouped: Dict[int, List[int]] = {}
+        for idx, rows in enumerate(members):
+            root = clusters.find(idx)
+            if root != idx:
+                result.near_duplicates += len(rows)
+            grouped.setdefault(root, []).extend(rows)
+        result.groups = [sorted(rows) for _, rows in sorted(grouped.items())]
+        return result
+
+    def _link_near_duplicates(self, unique_texts: List[str], clusters: _UnionFind):
+        signatures = [self.hasher.signature(t) for t in unique_texts]
+        buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        r = self.rows_per_band
+        for idx, sig in enumerate(signatures):
+            candidates = set()
+            for band in range(self.bands):
+                band_key = (band, sig[band * r : (band + 1) * r].tobytes())
+                bucket = buckets.setdefault(band_key, [])
+                candidates.update(bucket)
+                bucket.append(idx)
+            for other in sorted(candidates):
+                if clusters.find(other) == clusters.find(idx):
+                    continue
+                if self.similarity(sig, signatures[other]) >= self.threshold:
+                    clusters.union(idx, other)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures."""
+        return float(np.mean(sig_a == sig_b))
+
+
+def deduplicate(
+    texts: Sequence[str], config: Optional[DedupConfig] = None
+) -> DedupResult:
+    """Group ``texts`` per ``config``; when dedup is disabled every row is
+    its own group."""
+    if config is None or not config.enabled:
+        return DedupResult(groups=[[row] for row in range(len(texts))])
+    return Deduplicator(
+        near_duplicates=config.near_duplicates,
+        threshold=config.threshold,
+        num_perm=config.num_perm,
+        shingle_size=config.shingle_size,
+    ).group(texts)
@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Optional
+
+from loguru import logger
+
+
+class LazyWSGIMount:
+    """ASGI app that builds a WSGI app on first use and serves it through
+    ``WSGIMiddleware``.
+
+    Mounting the Dash dashboard this way keeps Dash, plotly and pandas out of
+    the API's import, so workers (and every auto-reload) start serving API
+    requests before the dashboard exists. ``build`` may also be called from a
+    startup hook to prepare it in the background; concurrent callers wait for
+    the same build. If the factory fails, requests get 503.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], Callable]):
+        self.name = name
+        self.factory = factory
+        self.error: Optional[Exception] = None
+        self._app = None
+        self._lock = threading.Lock()
+
+    @property
+    def failed(self) -> bool:
+        return self.error is not None
+
+    def build(self):
+        with self._lock:
+            if self._app is None and self.error is None:
+                from fastapi.middleware.wsgi import WSGIMiddleware
+
+                started = time.perf_counter()
+                try:
+                    self._app = WSGIMiddleware(self.factory())
+                except Exception as e:
+                    self.error = e
+                    logger.error(f"Could not build {self.name}: {e}", exc_info=True)
+                else:
+                    logger.info(
+                        f"Built {self.name} in "
+                        f"{(time.perf_counter() - started) * 1000:.0f} ms."
+                    )
+        return self._app
+
+    async def __call__(self, scope, receive, send):
+        app = self._app or await asyncio.to_thread(self.build)
+        if app is None:
+            from fastapi.responses import PlainTextResponse
+
+            response = PlainTextResponse(
+                f"{self.name} is not available.", status_code=503
+            )
+            await response(scope, receive, send)
+            return
+        await app(scope, receive, send)
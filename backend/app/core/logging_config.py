@@ -1,49 +1,146 @@
+import json
 import sys
+import traceback
 from pathlib import Path
 from loguru import logger
 
+# Settings a profile forces over settings.yaml. "prod" keeps per-review
+# logging cheap: nothing below INFO reaches a sink, records are JSON lines,
+# tracebacks are not annotated with variable values (slow, and they can leak
+# review text or keys) and hot-path records are sampled.
+LOGGING_PROFILES = {
+    "dev": {},
+    "prod": {
+        "console_level": "INFO",
+        "file_level": "INFO",
+        "json_output": True,
+        "diagnose": False,
+        "backtrace": False,
+        "hot_path_sample_every": 100,
+    },
+}
+
+# Lowest level any handler accepts and hot-path sampling interval, set by
+# setup_logging and read by every HotPathLog call.
+_min_level_no = 0
+_hot_path_sample_every = 1
+
+
+def _json_format(record) -> str:
+    """Format a record as one JSON object per line."""
+    entry = {
+        "time": record["time"].isoformat(),
+        "level": record["level"].name,
+        "logger": record["name"],
+        "function": record["function"],
+        "line": record["line"],
+        "message": record["message"],
+    }
+    extra = {k: v for k, v in record["extra"].items() if k != "json"}
+    if extra:
+        entry["extra"] = extra
+    if record["exception"] is not None:
+        exc_type, exc_value, exc_traceback = record["exception"]
+        entry["exception"] = "".join(
+            traceback.format_exception(exc_type, exc_value, exc_traceback)
+        )
+    record["extra"]["json"] = json.dumps(entry, default=str, ensure_ascii=False)
+    return "{extra[json]}\n"
+
+
+class HotPathLog:
+    """A log call site on a per-review or per-request path.
+
+    Create one per call site at module level and call it with a brace-style
+    message and its arguments. When no sink accepts ``level`` the call
+    returns after one integer comparison, before any argument is formatted
+    (use format specs such as ``{:.30}`` instead of slicing at the call
+    site). Otherwise only every ``hot_path_sample_every``-th call at this
+    site is emitted, with the sampling interval in ``extra.sampled_1_in``.
+    """
+
+    __slots__ = ("level", "level_no", "calls")
+
+    def __init__(self, level: str):
+        self.level = level
+        self.level_no = logger.level(level).no
+        self.calls = 0
+
+    def __call__(self, message: str, *args, **kwargs):
+        if self.level_no < _min_level_no:
+            return
+        self.calls += 1
+        if _hot_path_sample_every > 1:
+            if self.calls % _hot_path_sample_every != 1:
+                return
+            logger.bind(sampled_1_in=_hot_path_sample_every).opt(depth=1).log(
+                self.level, message, *args, **kwargs
+            )
+        else:
+            logger.opt(depth=1).log(self.level, message, *args, **kwargs)
+
 
 def setup_logging(logging_settings, project_root: Path):
+    global _min_level_no, _hot_path_sample_every
     logger.remove()
 
+    profile = logging_settings.get("profile", "dev")
+    if profile not in LOGGING_PROFILES:
+        raise ValueError(
+            f"Unknown logging profile '{profile}'. Use one of {sorted(LOGGING_PROFILES)}."
+        )
+    logging_settings = {**logging_settings, **LOGGING_PROFILES[profile]}
+
     log_format = logging_settings.get(
         "format",
         "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | <level>{level: <8}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>",
     )
+    json_output = logging_settings.get("json_output", False)
+    diagnose = logging_settings.get("diagnose", True)
+    backtrace = logging_settings.get("backtrace", True)
+    levels = []
 
     # Console Handler
     if logging_settings.get("console_enabled", True):
+        console_level = logging_settings.get("console_level", "DEBUG").upper()
         logger.add(
             sys.stderr,  # Or sys.stdout
-            level=logging_settings.get("console_level", "DEBUG").upper(),
-            format=log_format,
-            colorize=True,
+            level=console_level,
+            format=_json_format if json_output else log_format,
+            colorize=not json_output,
+            backtrace=backtrace,
+            diagnose=diagnose,
         )
+        levels.append(console_level)
         logger.info("Console logging enabled.")
 
     # File Handler
     if logging_settings.get("file_enabled", True):
         file_path_str = logging_settings.get("file_path", "logs/app.log")
         log_file_path = project_root / file_path_str
+        file_level = logging_settings.get("file_level", "INFO").upper()
 
         # Ensure log directory exists
         log_file_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.add(
             log_file_path,
-            level=logging_settings.get("file_level", "INFO").upper(),
+            level=file_level,
             rotation=logging_settings.get("rotation", "10 MB"),
             retention=logging_settings.get("retention", "7 days"),
-            format=log_format,
+            format=_json_format if json_output else log_format,
             encoding="utf-8",
             enqueue=True,  # For async safety
-            backtrace=True,  # Better tracebacks
-            diagnose=True,  # More detailed error reporting
-        )
-        logger.info(
-            f"File logging enabled. Path: {log_file_path}, Level: {logging_settings.get('file_level', 'INFO').upper()}"
+            backtrace=backtrace,  # Better tracebacks
+            diagnose=diagnose,  # Variable values in tracebacks; off in production
         )
+        levels.append(file_level)
+        logger.info(f"File logging enabled. Path: {log_file_path}, Level: {file_level}")
 
+    _min_level_no = min((logger.level(level).no for level in levels), default=100)
+    _hot_path_sample_every = max(1, logging_settings.get("hot_path_sample_every", 1))
     logger.info(
-        f"Logging setup complete. Global default level (for filtering if no handler matches): {logging_settings.get('level', 'INFO').upper()}"
+        f"Logging setup complete (profile: {profile}, json: {json_output}, "
+        f"hot-path sampling: 1 in {_hot_path_sample_every}). Global default level "
+        f"(for filtering if no handler matches): {logging_settings.get('level', 'INFO').upper()}"
     )
@@ -0,0 +1,57 @@
+import os
+from pathlib import Path
+from typing import Optional
+from loguru import logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, every process behaves as a single worker
+    fcntl = None
+
+
+class ProcessLock:
+    """Non-blocking inter-process lock backed by ``flock`` on a lock file.
+
+    Each ``acquire`` opens its own file descriptor, so the lock also excludes
+    other holders inside the same process, and it is not reentrant: while
+    held, ``acquire`` on the same instance returns False too. The OS
+    releases the lock if the holder dies; the next ``acquire`` elsewhere
+    then succeeds.
+    """
+
+    def __init__(self, lock_path: str):
+        self.lock_path = Path(lock_path)
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def acquire(self) -> bool:
+        if self._fd is not None:
+            return False
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+        if fcntl is None:
+            self._fd = fd
+            return True
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        logger.debug(f"Process {os.getpid()} acquired lock {self.lock_path.name}")
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,159 @@
+import math
+import random
+from typing import Any, Dict, Iterable, List, Optional
+
+DEFAULT_K = 200
+DEFAULT_PERCENTILES = (0.05, 0.1, 0.25, 0.5, 0.75, 0.9, 0.95)
+
+_rng = random.Random()
+
+
+class KLLSketch:
+    """KLL streaming quantile sketch (Karnin, Lang and Liberty, 2016).
+
+    Values are kept in a stack of compactors; an item at level ``h`` stands
+    for ``2**h`` inputs. When the sketch is full, the lowest full compactor
+    is sorted and every other item (random offset) is promoted one level.
+    Memory is ``O(k log(n / k))`` and the rank error is about ``1.7 / k``.
+    Sketches with the same ``k`` merge losslessly in any order, so shards
+    can be summarized independently.
+    """
+
+    def __init__(self, k: int = DEFAULT_K, c: float = 2 / 3):
+        self.k = k
+        self.c = c
+        self.n = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.compactors: List[List[float]] = []
+        self.size = 0
+        self.max_size = 0
+        self._grow()
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.compactors) - level - 1
+        return int(math.ceil(self.k * self.c**depth)) + 1
+
+    def _grow(self):
+        self.compactors.append([])
+        self.max_size = sum(self._capacity(h) for h in range(len(self.compactors)))
+
+    def update(self, value: float):
+        value = float(value)
+        self.n += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        self.compactors[0].append(value)
+        self.size += 1
+        if self.size >= self.max_size:
+            self._compress()
+
+    def _compress(self):
+        for level in range(len(self.compactors)):
+            compactor = self.compactors[level]
+            if len(compactor) >= self._capacity(level):
+                if level + 1 >= len(self.compactors):
+                    self._grow()
+                compactor.sort()
+                # Odd lengths keep their largest item so weight is conserved.
+                keep = [compactor.pop()] if len(compactor) % 2 else []
+                offset = _rng.getrandbits(1)
+                self.compactors[level + 1].extend(compactor[offset::2])
+                self.compactors[level] = keep
+                break
+        self.size = sum(len(c) for c in self.compactors)
+
+    def merge(self, other: "KLLSketch") -> "KLLSketch":
+        """Fold ``other`` into this sketch in place and return self."""
+        if other.n == 0:
+            return self
+        while len(self.compactors) < len(other.compactors):
+            self._grow()
+        for level, items in enumerate(other.compactors):
+            self.compactors[level].extend(items)
+        self.n += other.n
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        self.size = sum(len(c) for c in self.compactors)
+        while self.size >= self.max_size:
+            self._compress()
+        return self
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        """Approximate values at each quantile rank in ``qs`` (0..1)."""
+        qs = list(qs)
+        if self.n == 0:
+            return [None for _ in qs]
+        weighted = sorted(
+            (value, 1 << level)
+            for level, items in enumerate(self.compactors)
+            for value in items
+        )
+        total = sum(w for _, w in weighted)
+        results = []
+        for q in qs:
+            if q <= 0:
+                results.append(self.min)
+                continue
+            if q >= 1:
+                results.append(self.max)
+                continue
+            target = q * total
+            cumulative = 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    results.append(value)
+                    break
+            else:
+                results.append(self.max)
+        return results
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles([q])[0]
+
+    def summary(self, qs: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        qs = list(qs)
+        return {
+            "count": self.n,
+            "min": self.min,
+            "max": self.max,
+            "percentiles": {
+                percentile_label(q): (None if v is None else round(v, 4))
+                for q, v in zip(qs, self.quantiles(qs))
+            },
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "k": self.k,
+            "n": self.n,
+            "min": self.min,
+            "max": self.max,
+            "compactors": [list(c) for c in self.compactors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "KLLSketch":
+        sketch = cls(k=data.get("k", DEFAULT_K))
+        sketch.compactors = []
+        for items in data.get("compactors") or [[]]:
+            sketch._grow()
+            sketch.compactors[-1] = [float(v) for v in items]
+        sketch.n = data.get("n", 0)
+        sketch.min = data.get("min")
+        sketch.max = data.get("max")
+        sketch.size = sum(len(c) for c in sketch.compactors)
+        return sketch
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        restored = KLLSketch.from_dict(state)
+        self.__dict__.update(restored.__dict__)
+
+
+def percentile_label(q: float) -> str:
+    """0.5 -> "p50", 0.995 -> "p99.5"."""
+    return f"p{round(q * 100, 2):g}"
@@ -0,0 +1,135 @@
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence
+
+from ..config import RollupDimensionConfig
+
+# Orderings precomputed for every dimension; "top" queries slice these.
+ROLLUP_SORT_KEYS = ("count", "mean_rating")
+
+_DATE_BUCKET_FORMATS = {"day": "%Y-%m-%d", "week": "%G-W%V", "month": "%Y-%m"}
+
+
+def dimension_values(
+    row: Dict[str, Any], dimensions: Sequence[RollupDimensionConfig]
+) -> Dict[str, str]:
+    """Map each configured dimension to its (bucketed) value for ``row``."""
+    import pandas as pd  # Deferred: keeps pandas out of the API's import
+
+    values = {}
+    for dim in dimensions:
+        raw = row.get(dim.column)
+        if raw is None or (isinstance(raw, float) and pd.isna(raw)):
+            values[dim.name] = "unknown"
+            continue
+        if dim.bucket:
+            ts = pd.to_datetime(raw, errors="coerce")
+            values[dim.name] = (
+                "unknown"
+                if pd.isna(ts)
+                else ts.strftime(_DATE_BUCKET_FORMATS[dim.bucket])
+            )
+        else:
+            values[dim.name] = str(raw)
+    return values
+
+
+def summarize(value: str, star_counts: Dict[Any, int]) -> Dict[str, Any]:
+    """Rollup summary for one dimension value. Star 0 counts rows the
+    sentiment model did not rate; they are excluded from the mean."""
+    histogram = {int(k): v for k, v in star_counts.items()}
+    rated = sum(c for s, c in histogram.items() if s > 0)
+    return {
+        "value": value,
+        "count": sum(histogram.values()),
+        "rated": rated,
+        "star_histogram": {s: c for s, c in sorted(histogram.items()) if s > 0},
+        "mean_rating": (
+            round(sum(s * c for s, c in histogram.items() if s > 0) / rated, 4)
+            if rated
+            else None
+        ),
+    }
+
+
+class RollupIndex:
+    """Read-side index over ``StatsSketch.rollups``.
+
+    Summaries and per-dimension orderings are computed once when the rollups
+    are published, so lookups are dict hits and top-k queries are slices.
+    """
+
+    def __init__(self, rollups: Optional[Dict[str, Dict[str, Dict[Any, int]]]] = None):
+        self.summaries: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.rankings: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        # Ascending counts aligned with rankings[dim]["count"] reversed, for
+        # min_count cut-offs by bisection.
+        self._counts_ascending: Dict[str, List[int]] = {}
+        for dim, values in (rollups or {}).items():
+            summaries = {v: summarize(v, counts) for v, counts in values.items()}
+            self.summaries[dim] = summaries
+            by_count = sorted(
+                summaries.values(), key=lambda s: (-s["count"], s["value"])
+            )
+            by_rating = sorted(
+                (s for s in summaries.values() if s["mean_rating"] is not None),
+                key=lambda s: (-s["mean_rating"], -s["count"], s["value"]),
+            )
+            self.rankings[dim] = {"count": by_count, "mean_rating": by_rating}
+            self._counts_ascending[dim] = [s["count"] for s in reversed(by_count)]
+
+    def dimensions(self) -> List[str]:
+        return list(self.summaries)
+
+    def get(self, dimension: str, value: str) -> Optional[Dict[str, Any]]:
+        return self.summaries.get(dimension, {}).get(value)
+
+    def size(self, dimension: str) -> int:
+        return len(self.summaries.get(dimension, {}))
+
+    def top(
+        self,
+        dimension: str,
+        k: int = 10,
+        by: str = "count",
+        ascending: bool = False,
+        min_count: int = 0,
+        values: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """The ``k`` best (or worst, with ``ascending``) values by ``by``.
+
+        ``values`` restricts the answer to the given dimension values.
+        Raises ValueError for an unknown dimension or sort key.
+        """
+        if dimension not in self.summaries:
+            raise ValueError(f"Unknown rollup dimension '{dimension}'.")
+        if by not in ROLLUP_SORT_KEYS:
+            raise ValueError(f"Invalid sort key '{by}'. Use one of {ROLLUP_SORT_KEYS}.")
+
+        if values is not None:
+            found = [
+                self.summaries[dimension][v]
+                for v in values
+                if v in self.summaries[dimension]
+            ]
+            ranked = [s for s in found if s["count"] >= min_count]
+            ranked.sort(key=lambda s: s["value"])
+            ranked.sort(key=lambda s: s[by] or 0, reverse=not ascending)
+            # Values without a rating go last whatever the direction.
+            ranked.sort(key=lambda s: s[by] is None)
+            return ranked[:k]
+
+        ranking = self.rankings[dimension][by]
+        if by == "count" and min_count > 0:
+            # Values with count >= min_count form a prefix of the ranking.
+            counts = self._counts_ascending[dimension]
+            ranking = ranking[: len(counts) - bisect_left(counts, min_count)]
+            return (ranking[::-1] if ascending else ranking)[:k]
+
+        ordered = reversed(ranking) if ascending else iter(ranking)
+        result = []
+        for summary in ordered:
+            if summary["count"] >= min_count:
+                result.append(summary)
+                if len(result) >= k:
+                    break
+        return result
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from collections import Counter, deque
+from contextlib import asynccontextmanager
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+from .quantiles import KLLSketch, percentile_label
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+PRIORITY_CLASSES = (INTERACTIVE, BULK)
+
+WAIT_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class InferenceScheduler:
+    """Share a fixed number of model-call slots between priority classes.
+
+    Each class has its own FIFO queue. When a slot frees up, the waiting
+    class with the lowest pass value gets it and its pass advances by
+    ``1 / weight`` (stride scheduling), so under contention classes receive
+    slots in proportion to their weights and an idle class cannot bank
+    credit. ``reserved`` slots are held back from every other class: bulk
+    work can never occupy the capacity set aside for interactive calls.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        weights: Mapping[str, float],
+        reserved: Optional[Mapping[str, int]] = None,
+    ):
+        self.capacity = max(1, capacity)
+        self.weights = {cls: max(float(w), 1e-6) for cls, w in weights.items()}
+        self.reserved = {cls: 0 for cls in self.weights}
+        self.reserved.update(reserved or {})
+        if sum(self.reserved.values()) >= self.capacity:
+            raise ValueError("Reserved slots must leave capacity for other classes.")
+        self.in_use = 0
+        self.in_use_by: Counter = Counter()
+        self.queues: Dict[str, Deque[Tuple[asyncio.Future, float]]] = {
+            cls: deque() for cls in self.weights
+        }
+        self._passes = {cls: 0.0 for cls in self.weights}
+        self._virtual_time = 0.0
+        self.granted: Counter = Counter()
+        self.waited: Counter = Counter()
+        self.wait_seconds_total: Dict[str, float] = {cls: 0.0 for cls in self.weights}
+        self.wait_sketches = {cls: KLLSketch() for cls in self.weights}
+
+    def limit(self, cls: str) -> int:
+        """Most slots ``cls`` may hold: capacity minus other classes' reserve."""
+        return self.capacity - sum(r for c, r in self.reserved.items() if c != cls)
+
+    def _can_run(self, cls: str) -> bool:
+        return self.in_use < self.capacity and self.in_use_by[cls] < self.limit(cls)
+
+    def _grant(self, cls: str):
+        self.in_use += 1
+        self.in_use_by[cls] += 1
+        self.granted[cls] += 1
+
+    def _dispatch(self):
+        while True:
+            ready = [c for c, q in self.queues.items() if q and self._can_run(c)]
+            if not ready:
+                return
+            cls = min(ready, key=lambda c: (self._passes[c], c))
+            future, _ = self.queues[cls].popleft()
+            if future.done():
+                continue  # Cancelled while queued; its task cleans up
+            self._virtual_time = self._passes[cls]
+            self._passes[cls] += 1.0 / self.weights[cls]
+            self._grant(cls)
+            future.set_result(None)
+
+    def _release(self, cls: str):
+        self.in_use -= 1
+        self.in_use_by[cls] -= 1
+        self._dispatch()
+
+    def _record_wait(self, cls: str, seconds: float, queued: bool):
+        self.wait_seconds_total[cls] += seconds
+        self.wait_sketches[cls].update(seconds)
+        if queued:
+            self.waited[cls] += 1
+
+    @asynccontextmanager
+    async def slot(self, cls: str):
+        """Hold one model-call slot for ``cls`` for the duration of the block."""
+        if cls not in self.queues:
+            raise ValueError(f"Unknown priority class '{cls}'.")
+        queue = self.queues[cls]
+        started = time.perf_counter()
+        queued = bool(queue) or not self._can_run(cls)
+        if not queued:
+            self._grant(cls)
+        else:
+            if not queue:
+                # Rejoining after idling: start from the current virtual time.
+                self._passes[cls] = max(self._passes[cls], self._virtual_time)
+            entry = (asyncio.get_running_loop().create_future(), started)
+            queue.append(entry)
+            try:
+                await entry[0]
+            except asyncio.CancelledError:
+                if entry[0].done() and not entry[0].cancelled():
+                    self._release(cls)  # Granted just as we were cancelled
+                else:
+                    if entry in queue:
+                        queue.remove(entry)
+                    self._dispatch()
+                raise
+        self._record_wait(cls, time.perf_counter() - started, queued)
+        try:
+            yield
+        finally:
+            self._release(cls)
+
+    def stats(self) -> Dict[str, Any]:
+        classes = {}
+        for cls in self.weights:
+            sketch = self.wait_sketches[cls]
+            percentiles = dict(
+                zip(WAIT_PERCENTILES, sketch.quantiles(WAIT_PERCENTILES))
+            )
+            classes[cls] = {
+                "weight": self.weights[cls],
+                "reserved": self.reserved[cls],
+                "limit": self.limit(cls),
+                "in_flight": self.in_use_by[cls],
+                "queued": len(self.queues[cls]),
+                "granted": self.granted[cls],
+                "waited": self.waited[cls],
+                "wait_ms": {
+                    "mean": (
+                        round(self.wait_seconds_total[cls] / sketch.n * 1000, 3)
+                        if sketch.n
+                        else None
+                    ),
+                    "max": None if sketch.max is None else round(sketch.max * 1000, 3),
+                    **{
+                        percentile_label(q): (None if v is None else round(v * 1000, 3))
+                        for q, v in percentiles.items()
+                    },
+                },
+            }
+        return {"capacity": self.capacity, "in_flight": self.in_use, "classes": classes}
@@ -0,0 +1,176 @@
+import gzip
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+from loguru import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# On-disk frame: MAGIC | serializer id (1 byte) | compression id (1 byte) | payload
+CACHE_MAGIC = b"RCC1"
+SERIALIZERS = {"json": 1, "pickle": 2}
+COMPRESSIONS = {"none": 0, "gzip": 1, "zstd": 2}
+_SERIALIZER_NAMES = {v: k for k, v in SERIALIZERS.items()}
+_COMPRESSION_NAMES = {v: k for k, v in COMPRESSIONS.items()}
+
+
+def _serialize(data: Any, serializer: str) -> bytes:
+    if serializer == "json":
+        if orjson is not None:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(data, separators=(",", ":")).encode("utf-8")
+    return pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _deserialize(payload: bytes, serializer: str) -> Any:
+    if serializer == "json":
+        return orjson.loads(payload) if orjson is not None else json.loads(payload)
+    return pickle.loads(payload)
+
+
+def _compress(payload: bytes, compression: str, level: int) -> bytes:
+    if compression == "gzip":
+        return gzip.compress(payload, compresslevel=max(1, min(level, 9)))
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(payload)
+    return payload
+
+
+def _decompress(payload: bytes, compression: str) -> bytes:
+    if compression == "gzip":
+        return gzip.decompress(payload)
+    if compression == "zstd":
+        if zstandard is None:
+            raise RuntimeError(
+                "Cache file is zstd-compressed but 'zstandard' is not installed."
+            )
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return payload
+
+
+def resolve_compression(compression: str) -> str:
+    if compression == "zstd" and zstandard is None:
+        logger.warning(
+            "zstd cache compression requested but 'zstandard' is not installed; using gzip."
+        )
+        return "gzip"
+    if compression not in COMPRESSIONS:
+        logger.warning(f"Unknown cache compression '{compression}'; using none.")
+        return "none"
+    return compression
+
+
+def _is_json_compatible(data: Any) -> bool:
+    return isinstance(data, (dict, list, str, int, float, bool)) or data is None
+
+
+def encode(
+    data: Any,
+    compression: str = "none",
+    compression_level: int = 3,
+    binary_threshold_bytes: Optional[int] = None,
+    serializer: str = "auto",
+) -> bytes:
+    """Serialize and compress ``data`` into a self-describing frame.
+
+    JSON is used for JSON-compatible payloads; payloads whose JSON encoding
+    exceeds ``binary_threshold_bytes`` (or that are not JSON-compatible) use
+    pickle, which is considerably faster to load for large nested structures.
+    Large payloads are pickled as decoded from their JSON encoding, so cached
+    data has JSON types (string dict keys, lists) whichever serializer is
+    picked. Pass ``serializer="json"`` or ``"pickle"`` to skip the automatic
+    choice.
+    """
+    compression = resolve_compression(compression)
+    if serializer == "auto":
+        serializer = "json" if _is_json_compatible(data) else "pickle"
+        check_threshold = True
+    else:
+        check_threshold = False
+    payload = None
+    if serializer == "json":
+        try:
+            payload = _serialize(data, "json")
+        except TypeError:
+            serializer = "pickle"
+        if (
+            check_threshold
+            and payload is not None
+            and binary_threshold_bytes
+            and len(payload) > binary_threshold_bytes
+        ):
+            data = _deserialize(payload, "json")
+            serializer, payload = "pickle", None
+    if payload is None:
+        payload = _serialize(data, serializer)
+    return (
+        CACHE_MAGIC
+        + bytes([SERIALIZERS[serializer], COMPRESSIONS[compression]])
+        + _compress(payload, compression, compression_level)
+    )
+
+
+def is_frame(raw: bytes) -> bool:
+    return raw.startswith(CACHE_MAGIC)
+
+
+def decode(raw: bytes) -> Any:
+    if not is_frame(raw):
+        raise ValueError("Not a cache frame.")
+    serializer = _SERIALIZER_NAMES[raw[len(CACHE_MAGIC)]]
+    compression = _COMPRESSION_NAMES[raw[len(CACHE_MAGIC) + 1]]
+    payload = _decompress(raw[len(CACHE_MAGIC) + 2 :], compression)
+    return _deserialize(payload, serializer)
+
+
+def atomic_write_bytes(path: Path, frame: bytes) -> int:
+    """Write to a temp file in the same directory, fsync and rename over
+    ``path``, so readers never see a partial file."""
+    cache_path = Path(path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{cache_path.name}.", suffix=".tmp", dir=cache_path.parent
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(frame)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return len(frame)
+
+
+def write_cache_file(cache_path: Path, data: Any, **encode_options: Any) -> int:
+    """Encode ``data`` and write it atomically; returns bytes written."""
+    return atomic_write_bytes(cache_path, encode(data, **encode_options))
+
+
+def read_cache_file(cache_path: Path) -> Any:
+    cache_path = Path(cache_path)
+    with open(cache_path, "rb") as f:
+        raw = f.read()
+    if is_frame(raw):
+        return decode(raw)
+    # Legacy cache files: plain JSON or joblib dumps.
+    if cache_path.suffix == ".json":
+        return json.loads(raw)
+    import joblib
+
+    return joblib.load(cache_path)
@@ -0,0 +1,328 @@
+import math
+from collections import Counter, defaultdict
+from statistics import NormalDist
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .quantiles import KLLSketch
+
+# Model confidences tracked per scope: overall, per detected language and per
+# predicted star rating.
+CONFIDENCE_METRICS = {
+    "overall": ("language_confidence", "sentiment_confidence"),
+    "language": ("language_confidence", "sentiment_confidence"),
+    "stars": ("sentiment_confidence",),
+}
+
+
+def wilson_interval(successes: int, n: int, z: float) -> Tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if n <= 0:
+        return 0.0, 1.0
+    p = successes / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class StatsSketch:
+    """Mergeable partial aggregate of analysis results.
+
+    ``merge`` is associative and commutative, so shards can be aggregated
+    independently (in other processes or machines) and reduced in any order.
+    """
+
+    def __init__(self):
+        self.processed = 0
+        self.failed = 0
+        # Texts sent to the models, and rows that reused a duplicate's result
+        self.scored = 0
+        self.exact_duplicates = 0
+        self.near_duplicates = 0
+        self.language_counts: Counter = Counter()
+        self.star_counts: Counter = Counter()
+        self.stars_by_language: Dict[str, Counter] = defaultdict(Counter)
+        # dimension -> value -> star histogram (0 = not rated)
+        self.rollups: Dict[str, Dict[str, Counter]] = defaultdict(
+            lambda: defaultdict(Counter)
+        )
+        # granularity ("hour"/"day") -> bucket key -> star histogram
+        self.trends: Dict[str, Dict[str, Counter]] = defaultdict(
+            lambda: defaultdict(Counter)
+        )
+        # model kind -> model calls, input tokens, truncated calls, dropped tokens
+        self.token_usage: Dict[str, Counter] = defaultdict(Counter)
+        # scope -> key -> metric -> quantile sketch of model confidence
+        self.confidence: Dict[str, Dict[str, Dict[str, KLLSketch]]] = {
+            scope: defaultdict(dict) for scope in CONFIDENCE_METRICS
+        }
+
+    def add(
+        self,
+        lang: str,
+        stars: int,
+        dimensions: Optional[Dict[str, str]] = None,
+        language_confidence: Optional[float] = None,
+        sentiment_confidence: Optional[float] = None,
+        trend_buckets: Optional[Dict[str, str]] = None,
+    ):
+        self.processed += 1
+        self.language_counts[lang] += 1
+        if stars > 0:
+            self.star_counts[stars] += 1
+            self.stars_by_language[lang][stars] += 1
+        for dim, value in (dimensions or {}).items():
+            self.rollups[dim][value][max(stars, 0)] += 1
+        for granularity, bucket in (trend_buckets or {}).items():
+            self.trends[granularity][bucket][max(stars, 0)] += 1
+
+        values = {
+            "language_confidence": language_confidence,
+            "sentiment_confidence": sentiment_confidence,
+        }
+        keys = {"overall": "all", "language": lang}
+        if stars > 0:
+            keys["stars"] = str(stars)
+        for scope, key in keys.items():
+            for metric in CONFIDENCE_METRICS[scope]:
+                if values[metric] is not None:
+                    self._confidence_sketch(scope, key, metric).update(values[metric])
+
+    def _confidence_sketch(self, scope: str, key: str, metric: str) -> KLLSketch:
+        metrics = self.confidence[scope][key]
+        if metric not in metrics:
+            metrics[metric] = KLLSketch()
+        return metrics[metric]
+
+    def add_failure(self, count: int = 1):
+        self.failed += count
+
+    def add_scored(self, count: int = 1):
+        self.scored += count
+
+    def add_duplicates(self, exact: int = 0, near: int = 0):
+        self.exact_duplicates += exact
+        self.near_duplicates += near
+
+    def add_token_usage(self, usage: Dict[str, Dict[str, int]]):
+        for kind, counts in usage.items():
+            self.token_usage[kind].update(counts)
+
+    def merge(self, other: "StatsSketch") -> "StatsSketch":
+        """Fold ``other`` into this sketch in place and return self."""
+        self.processed += other.processed
+        self.failed += other.failed
+        self.scored += other.scored
+        self.exact_duplicates += other.exact_duplicates
+        self.near_duplicates += other.near_duplicates
+        self.language_counts.update(other.language_counts)
+        self.star_counts.update(other.star_counts)
+        for lang, counts in other.stars_by_language.items():
+            self.stars_by_language[lang].update(counts)
+        self._merge_rollups(other.rollups)
+        self._merge_trends(other.trends)
+        self.add_token_usage(other.token_usage)
+        for scope, keys in other.confidence.items():
+            for key, metrics in keys.items():
+                for metric, sketch in metrics.items():
+                    self._confidence_sketch(scope, key, metric).merge(sketch)
+        return self
+
+    def _merge_rollups(self, rollups: Dict[str, Dict[str, Dict[Any, int]]]):
+        for dim, values in rollups.items():
+            for value, counts in values.items():
+                self.rollups[dim][value].update({int(k): v for k, v in counts.items()})
+
+    def _merge_trends(self, trends: Dict[str, Dict[str, Dict[Any, int]]]):
+        for granularity, buckets in trends.items():
+            for bucket, counts in buckets.items():
+                self.trends[granularity][bucket].update(
+                    {int(k): v for k, v in counts.items()}
+                )
+
+    def trends_payload(self) -> Dict[str, Dict[str, Dict[int, int]]]:
+        return {
+            granularity: {bucket: dict(counts) for bucket, counts in buckets.items()}
+            for granularity, buckets in self.trends.items()
+        }
+
+    def prune_trends(self, granularity: str, before: str):
+        """Drop ``granularity`` buckets whose key sorts before ``before``."""
+        buckets = self.trends.get(granularity, {})
+        for bucket in [b for b in buckets if b < before]:
+            del buckets[bucket]
+
+    def rollups_payload(self) -> Dict[str, Dict[str, Dict[int, int]]]:
+        return {
+            dim: {value: dict(counts) for value, counts in values.items()}
+            for dim, values in self.rollups.items()
+        }
+
+    def confidence_payload(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        return {
+            scope: {
+                key: {metric: sketch.to_dict() for metric, sketch in metrics.items()}
+                for key, metrics in keys.items()
+            }
+            for scope, keys in self.confidence.items()
+        }
+
+    def confidence_percentiles(self) -> Dict[str, Dict[str, Dict[str, Dict]]]:
+        return {
+            scope: {
+                key: {metric: sketch.summary() for metric, sketch in metrics.items()}
+                for key, metrics in keys.items()
+            }
+            for scope, keys in self.confidence.items()
+        }
+
+    @classmethod
+    def merge_all(cls, sketches: Iterable["StatsSketch"]) -> "StatsSketch":
+        merged = cls()
+        for sketch in sketches:
+            merged.merge(sketch)
+        return merged
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "StatsSketch":
+        """Rebuild a sketch from ``to_state``, e.g. after a cache round trip.
+
+        Star keys are coerced back to ints, since states that went through
+        JSON carry them as strings.
+        """
+        sketch = cls()
+        sketch.processed = state["processed"]
+        sketch.failed = state["failed"]
+        sketch.scored = state.get("scored", 0)
+        sketch.exact_duplicates = state.get("exact_duplicates", 0)
+        sketch.near_duplicates = state.get("near_duplicates", 0)
+        sketch.language_counts.update(state["language_counts"])
+        sketch.star_counts.update({int(k): v for k, v in state["star_counts"].items()})
+        for lang, counts in state["stars_by_language"].items():
+            sketch.stars_by_language[lang].update(
+                {int(k): v for k, v in counts.items()}
+            )
+        sketch._merge_rollups(state.get("rollups", {}))
+        sketch._merge_trends(state.get("trends", {}))
+        sketch.add_token_usage(state.get("token_usage", {}))
+        for scope, keys in (state.get("confidence") or {}).items():
+            for key, metrics in keys.items():
+                for metric, data in metrics.items():
+                    sketch.confidence[scope][key][metric] = KLLSketch.from_dict(data)
+        return sketch
+
+    def to_state(self) -> Dict[str, Any]:
+        # Plain dicts keep the payload independent of this class's internals
+        # and serializable by every cache backend.
+        return {
+            "processed": self.processed,
+            "failed": self.failed,
+            "scored": self.scored,
+            "exact_duplicates": self.exact_duplicates,
+            "near_duplicates": self.near_duplicates,
+            "language_counts": dict(self.language_counts),
+            "star_counts": dict(self.star_counts),
+            "stars_by_language": {
+                lang: dict(counts) for lang, counts in self.stars_by_language.items()
+            },
+            "rollups": self.rollups_payload(),
+            "trends": self.trends_payload(),
+            "token_usage": self.token_usage_payload(),
+            "confidence": self.confidence_payload(),
+        }
+
+    def dedup_stats(self) -> Dict[str, Any]:
+        rows = self.processed + self.failed
+        return {
+            "rows": rows,
+            "unique_texts_scored": self.scored,
+            "exact_duplicates": self.exact_duplicates,
+            "near_duplicates": self.near_duplicates,
+            # Share of rows that did not need their own model calls
+            "dedup_ratio": round(1 - self.scored / rows, 4) if rows else 0.0,
+        }
+
+    def token_usage_payload(self) -> Dict[str, Dict[str, int]]:
+        return {kind: dict(counts) for kind, counts in self.token_usage.items()}
+
+    def to_stats(self, total_in_dataset: Optional[int] = None) -> Dict[str, Any]:
+        """Render the sketch in the ``/api/v1/stats`` payload format."""
+        return {
+            "total_reviews_processed": self.processed,
+            "total_reviews_in_dataset": (
+                total_in_dataset
+                if total_in_dataset is not None
+                else self.processed + self.failed
+            ),
+            "language_distribution": dict(self.language_counts),
+            "overall_sentiment_distribution": dict(self.star_counts),
+            "sentiment_distribution_by_language": {
+                lang: dict(counts) for lang, counts in self.stars_by_language.items()
+            },
+            "deduplication": self.dedup_stats(),
+            "token_usage": self.token_usage_payload(),
+            "confidence_percentiles": self.confidence_percentiles(),
+            "approximate": False,
+        }
+
+    def to_approximate_stats(
+        self,
+        total_in_dataset: int,
+        target_rows: int,
+        confidence_level: float = 0.95,
+    ) -> Dict[str, Any]:
+        """Extrapolate a partial (randomly sampled) sketch to ``target_rows``.
+
+        Distributions hold estimated counts in the regular stats format, so
+        consumers can render them unchanged; ``confidence_intervals`` holds
+        Wilson intervals on the same scale. Rows of one duplicate group share
+        a single model call, so the interval uses the number of texts scored
+        as the sample size rather than the number of rows.
+        """
+        stats = self.to_stats(total_in_dataset)
+        n = max(1, self.processed)
+        n_eff = max(1, min(self.scored, n))
+        z = NormalDist().inv_cdf(0.5 + confidence_level / 2)
+
+        def estimate(counts: Dict[Any, int]) -> Dict[Any, int]:
+            return {k: round(c / n * target_rows) for k, c in counts.items()}
+
+        def intervals(counts: Dict[Any, int]) -> Dict[Any, list]:
+            out = {}
+            for k, c in counts.items():
+                low, high = wilson_interval(round(c / n * n_eff), n_eff, z)
+                out[k] = [round(low * target_rows), round(high * target_rows)]
+            return out
+
+        stats.update(
+            {
+                "approximate": True,
+                "progress": {
+                    "rows_completed": self.processed + self.failed,
+                    "rows_total": target_rows,
+                    "fraction": (
+                        round((self.processed + self.failed) / target_rows, 4)
+                        if target_rows
+                        else 1.0
+                    ),
+                },
+                "confidence_level": confidence_level,
+                "language_distribution": estimate(self.language_counts),
+                "overall_sentiment_distribution": estimate(self.star_counts),
+                "sentiment_distribution_by_language": {
+                    lang: estimate(counts)
+                    for lang, counts in self.stars_by_language.items()
+                },
+                "confidence_intervals": {
+                    "language_distribution": intervals(self.language_counts),
+                    "overall_sentiment_distribution": intervals(self.star_counts),
+                },
+            }
+        )
+        return stats
+
+    def __getstate__(self):
+        return self.to_state()
+
+    def __setstate__(self, state):
+        self.__dict__.update(StatsSketch.from_state(state).__dict__)
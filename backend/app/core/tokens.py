@@ -0,0 +1,197 @@
+import importlib
+import math
+import re
+from abc import ABC, abstractmethod
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Dict, Optional
+
+TRUNCATION_STRATEGIES = ("truncate", "head_tail")
+# Share of the budget "head_tail" gives to the start of the review.
+HEAD_SHARE = 2 / 3
+ELISION = " … "
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_whitespace(text: str) -> str:
+    """Collapse runs of whitespace (newlines, tabs, nbsp) to single spaces."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+class Tokenizer(ABC):
+    """Base class of tokenizers. Custom tokenizers named in a model config
+    (``"package.module:ClassName"``) must subclass it."""
+
+    @abstractmethod
+    def count(self, text: str) -> int:
+        pass
+
+    @abstractmethod
+    def head(self, text: str, max_tokens: int) -> str:
+        """The start of ``text``, at most ``max_tokens`` tokens long."""
+
+    @abstractmethod
+    def tail(self, text: str, max_tokens: int) -> str:
+        """The end of ``text``, at most ``max_tokens`` tokens long."""
+
+
+class HeuristicTokenizer(Tokenizer):
+    """Estimate tokens as characters / ``chars_per_token`` (about 4 for
+    English with BPE vocabularies). No dependencies and no encoding pass;
+    cuts fall back to the nearest space so words are not split."""
+
+    def __init__(self, chars_per_token: float = 4.0):
+        self.chars_per_token = chars_per_token
+
+    def count(self, text: str) -> int:
+        return math.ceil(len(text) / self.chars_per_token)
+
+    def head(self, text: str, max_tokens: int) -> str:
+        limit = int(max_tokens * self.chars_per_token)
+        if len(text) <= limit:
+            return text
+        cut = text.rfind(" ", 0, limit + 1)
+        return text[: cut if cut > 0 else limit].rstrip()
+
+    def tail(self, text: str, max_tokens: int) -> str:
+        limit = int(max_tokens * self.chars_per_token)
+        if len(text) <= limit:
+            return text
+        start = len(text) - limit
+        cut = text.find(" ", start)
+        return text[start if cut == -1 else cut + 1 :]
+
+
+class TiktokenTokenizer(Tokenizer):
+    """Exact counts for OpenAI-style BPE encodings. Requires ``tiktoken``."""
+
+    def __init__(self, encoding: str = "cl100k_base"):
+        try:
+            import tiktoken
+        except ImportError as e:
+            raise RuntimeError(
+                "The tiktoken tokenizer needs the 'tiktoken' package."
+            ) from e
+        try:
+            self.encoding = tiktoken.get_encoding(encoding)
+        except Exception as e:
+            raise ValueError(f"Cannot load tiktoken encoding '{encoding}': {e}") from e
+
+    def count(self, text: str) -> int:
+        return len(self.encoding.encode(text))
+
+    def head(self, text: str, max_tokens: int) -> str:
+        return self.encoding.decode(self.encoding.encode(text)[:max_tokens])
+
+    def tail(self, text: str, max_tokens: int) -> str:
+        tokens = self.encoding.encode(text)
+        return self.encoding.decode(tokens[-max_tokens:] if max_tokens else [])
+
+
+@lru_cache(maxsize=None)
+def get_tokenizer(spec: str = "heuristic"):
+    """Tokenizer for ``spec``: ``"heuristic"``, ``"tiktoken[:<encoding>]"``
+    or ``"package.module:ClassName"`` for a subclass of ``Tokenizer``.
+    Raises ValueError for an unknown or unusable spec."""
+    name, _, arg = spec.partition(":")
+    if name == "heuristic":
+        try:
+            chars_per_token = float(arg) if arg else 4.0
+        except ValueError as e:
+            raise ValueError(f"Invalid tokenizer '{spec}': {e}") from e
+        if not chars_per_token > 0:
+            raise ValueError(
+                f"Invalid tokenizer '{spec}': chars per token must be > 0."
+            )
+        return HeuristicTokenizer(chars_per_token)
+    if name == "tiktoken":
+        return TiktokenTokenizer(arg or "cl100k_base")
+    if arg:
+        # The spec can come from the admin swap endpoint: only instantiate
+        # Tokenizer subclasses, never arbitrary callables.
+        try:
+            cls = getattr(importlib.import_module(name), arg)
+        except Exception as e:
+            raise ValueError(f"Cannot load tokenizer '{spec}': {e}") from e
+        if not (isinstance(cls, type) and issubclass(cls, Tokenizer)):
+            raise ValueError(
+                f"Tokenizer '{spec}' is not a subclass of {__name__}.Tokenizer."
+            )
+        try:
+            return cls()
+        except Exception as e:
+            raise ValueError(f"Cannot create tokenizer '{spec}': {e}") from e
+    raise ValueError(
+        f"Unknown tokenizer '{spec}'. Use 'heuristic', 'tiktoken[:<encoding>]' "
+        "or 'package.module:ClassName' (a Tokenizer subclass)."
+    )
+
+
+def fit_to_budget(text: str, tokenizer, max_tokens: int, strategy: str) -> str:
+    """Shorten ``text`` to about ``max_tokens`` tokens.
+
+    ``truncate`` keeps the start. ``head_tail`` keeps the start and the end
+    joined by an ellipsis: the closing sentences of a long review usually
+    carry its verdict, so this is a cheap extractive summary.
+    """
+    if strategy == "head_tail":
+        head_tokens = int(max_tokens * HEAD_SHARE)
+        tail_tokens = max_tokens - head_tokens - tokenizer.count(ELISION)
+        if tail_tokens > 0:
+            return (
+                tokenizer.head(text, head_tokens)
+                + ELISION
+                + tokenizer.tail(text, tail_tokens)
+            )
+    return tokenizer.head(text, max_tokens)
+
+
+class TokenUsage:
+    """Per-model token totals: model calls, input tokens sent, calls whose
+    review was shortened, and review tokens dropped to fit the budget."""
+
+    def __init__(self):
+        self.by_model: Dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, kind: str, input_tokens: int, dropped_tokens: int = 0):
+        counts = self.by_model[kind]
+        counts["calls"] += 1
+        counts["input_tokens"] += input_tokens
+        if dropped_tokens:
+            counts["truncated"] += 1
+            counts["dropped_tokens"] += dropped_tokens
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        return {kind: dict(counts) for kind, counts in self.by_model.items()}
+
+    def __str__(self) -> str:
+        return (
+            ", ".join(
+                f"{kind}: {c['input_tokens']} tokens in {c['calls']} calls"
+                f" ({c['truncated']} truncated, {c['dropped_tokens']} tokens dropped)"
+                for kind, c in sorted(self.by_model.items())
+            )
+            or "no model calls"
+        )
+
+
+_run_usage: ContextVar[Optional[TokenUsage]] = ContextVar("run_usage", default=None)
+
+
+@contextmanager
+def track_token_usage():
+    """Collect the token usage of model calls made in this context,
+    including tasks started from it (e.g. by ``asyncio.gather``)."""
+    usage = TokenUsage()
+    reset_token = _run_usage.set(usage)
+    try:
+        yield usage
+    finally:
+        _run_usage.reset(reset_token)
+
+
+def current_run_usage() -> Optional[TokenUsage]:
+    return _run_usage.get()
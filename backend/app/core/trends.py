@@ -0,0 +1,122 @@
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from .rollups import summarize
+
+# Bucket key formats; keys sort lexicographically in time order.
+TREND_GRANULARITIES = {"hour": "%Y-%m-%dT%H:00", "day": "%Y-%m-%d"}
+# "auto" picks hourly buckets for windows up to this long, daily beyond.
+AUTO_HOURLY_MAX_WINDOW = timedelta(days=3)
+DEFAULT_TREND_WINDOW = timedelta(days=30)
+
+
+def parse_timestamp(raw: Any) -> Optional[datetime]:
+    """Parse a dataset timestamp as UTC; None if missing or unparseable."""
+    import pandas as pd  # Deferred: keeps pandas out of the API's import
+
+    if raw is None or (isinstance(raw, float) and pd.isna(raw)):
+        return None
+    ts = pd.to_datetime(raw, errors="coerce", utc=True)
+    return None if pd.isna(ts) else ts.to_pydatetime()
+
+
+def trend_buckets(raw: Any) -> Optional[Dict[str, str]]:
+    """Hourly and daily bucket keys for a timestamp value."""
+    ts = parse_timestamp(raw)
+    if ts is None:
+        return None
+    return {gran: ts.strftime(fmt) for gran, fmt in TREND_GRANULARITIES.items()}
+
+
+def bucket_key(ts: datetime, granularity: str) -> str:
+    return ts.astimezone(timezone.utc).strftime(TREND_GRANULARITIES[granularity])
+
+
+class TrendIndex:
+    """Window queries over hourly/daily star histograms.
+
+    Buckets are sorted once and prefix sums are kept per star, so the totals
+    for any window cost two bisections; only the per-bucket series (for
+    charts) is proportional to the number of buckets in the window.
+    """
+
+    def __init__(self, trends: Optional[Dict[str, Dict[str, Dict[Any, int]]]] = None):
+        self.keys: Dict[str, List[str]] = {}
+        self.histograms: Dict[str, List[Dict[int, int]]] = {}
+        self.prefix: Dict[str, List[Dict[int, int]]] = {}
+        for gran, buckets in (trends or {}).items():
+            keys = sorted(buckets)
+            histograms = [{int(s): c for s, c in buckets[k].items()} for k in keys]
+            running: Dict[int, int] = {}
+            prefix = [{}]
+            for hist in histograms:
+                for star, count in hist.items():
+                    running[star] = running.get(star, 0) + count
+                prefix.append(dict(running))
+            self.keys[gran] = keys
+            self.histograms[gran] = histograms
+            self.prefix[gran] = prefix
+
+    def is_empty(self) -> bool:
+        return not any(self.keys.values())
+
+    def latest(self) -> Optional[datetime]:
+        keys = self.keys.get("hour")
+        if not keys:
+            return None
+        return datetime.strptime(keys[-1], TREND_GRANULARITIES["hour"]).replace(
+            tzinfo=timezone.utc
+        )
+
+    def window(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        granularity: str = "auto",
+    ) -> Dict[str, Any]:
+        """Totals and per-bucket series for ``[start, end)``.
+
+        Without ``end`` the window ends after the newest bucket; without
+        ``start`` it covers ``DEFAULT_TREND_WINDOW`` before ``end``.
+        Raises ValueError for an unknown granularity or an empty window.
+        """
+        latest = self.latest()
+        if end is None:
+            end = (latest or datetime.now(timezone.utc)) + timedelta(hours=1)
+        if start is None:
+            start = end - DEFAULT_TREND_WINDOW
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=timezone.utc)
+        if end <= start:
+            raise ValueError("end must be after start.")
+        if granularity == "auto":
+            granularity = "hour" if end - start <= AUTO_HOURLY_MAX_WINDOW else "day"
+        if granularity not in TREND_GRANULARITIES:
+            raise ValueError(
+                f"Invalid granularity '{granularity}'. Use auto, {', '.join(TREND_GRANULARITIES)}."
+            )
+
+        keys = self.keys.get(granularity, [])
+        lo = bisect_left(keys, bucket_key(start, granularity))
+        # Daily buckets are included if they start before ``end``.
+        hi = bisect_right(
+            keys, bucket_key(end - timedelta(microseconds=1), granularity)
+        )
+        prefix = self.prefix.get(granularity, [{}])
+        totals = {
+            star: prefix[hi].get(star, 0) - prefix[lo].get(star, 0)
+            for star in prefix[hi]
+        }
+        return {
+            "granularity": granularity,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "total": summarize("window", {s: c for s, c in totals.items() if c}),
+            "series": [
+                summarize(keys[i], self.histograms[granularity][i])
+                for i in range(lo, hi)
+            ],
+        }
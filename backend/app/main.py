@@ -1,12 +1,15 @@
-from fastapi import FastAPI, HTTPException, Body, Depends
-from fastapi.middleware.wsgi import WSGIMiddleware
-from pydantic import BaseModel
-from typing import Dict, Any, Optional
+from fastapi import FastAPI, HTTPException, Body, Depends, Header, Query
+from pydantic import BaseModel, Field
+from typing import Dict, Any, List, Optional
+from datetime import datetime
+import asyncio
+import hmac
 import sys
+import time
 from pathlib import Path
 from loguru import logger
 
-from fastapi.responses import RedirectResponse
+from fastapi.responses import JSONResponse, RedirectResponse, StreamingResponse
 
 APP_DIR = Path(__file__).resolve().parent
 BACKEND_DIR = APP_DIR.parent
@@ -14,33 +17,51 @@ PROJECT_ROOT_FOR_MAIN = BACKEND_DIR.parent
 if str(PROJECT_ROOT_FOR_MAIN) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT_FOR_MAIN))
 
-from backend.app.config import settings
-from backend.app.services.model_service import model_service
+from backend.app.config import ModelConfig, settings
+from backend.app.services.model_service import ModelService, get_model_service
 from backend.app.services.analysis_service import (
-    initialize_analysis_service,
+    start_analysis_service,
+    shutdown_analysis_service,
     get_analysis_service,
     AnalysisService,
 )
-from backend.app.prompts.prompt_engine import prompt_engine
+from backend.app.prompts.prompt_engine import get_prompt_engine
+from backend.app.core.quantiles import DEFAULT_PERCENTILES
+from backend.app.storage.results_store import get_results_store
+from backend.app.storage.export import (
+    EXPORT_FORMATS,
+    check_export_format,
+    export_results,
+)
+from backend.app.core.cache_backends import get_cache
+from backend.app.core.admission import (
+    Overloaded,
+    admission_stats,
+    get_admission_controller,
+)
 
-try:
-    from frontend.dashboard.app import (
-        app as dash_app_instance,
-    )
+from backend.app.core.lazy_mount import LazyWSGIMount
+from backend.app.core.logging_config import HotPathLog
 
-    DASH_CONFIGURED_URL_BASE_PATHNAME = dash_app_instance.config.url_base_pathname
-    logger.info("Dash app instance imported successfully.")
-except ImportError as e:
-    logger.error(f"Could not import Dash app (dash_app_instance): {e}", exc_info=True)
-    dash_app_instance = None
-    DASH_CONFIGURED_URL_BASE_PATHNAME = "N/A (Dash app not loaded)"
-except AttributeError:  # Should not happen if Dash app structure is correct
-    logger.error(
-        "Dash app instance imported, but '.config.url_base_pathname' is missing.",
-        exc_info=True,
-    )
-    dash_app_instance = None  # Treat as not loaded
-    DASH_CONFIGURED_URL_BASE_PATHNAME = "N/A (Dash config error)"
+
+def _build_dash_server():
+    # Imports Dash, plotly and pandas; kept out of this module's import.
+    from frontend.dashboard.app import app as dash_app_instance
+
+    logger.debug(
+        f"FastAPI: Dash app's internal url_base_pathname is: "
+        f"'{dash_app_instance.config.url_base_pathname}'"
+    )  # Should be /dashboard/
+    return dash_app_instance.server
+
+
+dashboard = LazyWSGIMount("Dash dashboard", _build_dash_server)
+
+_log_analyze_review = HotPathLog("DEBUG")
+
+MAX_BATCH_SIZE = 500
+MAX_ROLLUP_ITEMS = 1000
+PRODUCT_DIMENSION = "product"
 
 app = FastAPI(title="Customer Review Analysis API")
 logger.info("Main FastAPI application instance created.")
@@ -56,30 +77,150 @@ class AnalysisResult(BaseModel):
     sentiment: Optional[Dict[str, Any]] = None
 
 
+class BatchReviewInput(BaseModel):
+    texts: List[str] = Field(..., max_length=MAX_BATCH_SIZE)
+
+
+class BatchAnalysisItem(AnalysisResult):
+    text: str
+    latency_ms: float
+
+
+class BatchAnalysisResult(BaseModel):
+    results: List[BatchAnalysisItem]
+    elapsed_ms: float
+
+
 class StatsResponse(BaseModel):
     stats: Optional[Dict[str, Any]] = None
 
 
+class RollupSummary(BaseModel):
+    value: str
+    count: int
+    rated: int
+    star_histogram: Dict[int, int]
+    mean_rating: Optional[float] = None
+
+
+class RollupPage(BaseModel):
+    dimension: str
+    total_values: int
+    items: List[RollupSummary]
+
+
+class ConfidencePercentiles(BaseModel):
+    scope: str
+    metric: str
+    groups: Dict[str, Dict[str, Any]]
+
+
+class TrendWindow(BaseModel):
+    granularity: str
+    start: str
+    end: str
+    total: RollupSummary
+    series: List[RollupSummary]
+
+
+class ReviewResultItem(BaseModel):
+    review_id: str
+    product_id: str
+    text_preview: str
+    detected_language: str
+    language_confidence: float
+    predicted_sentiment_stars: int
+    sentiment_confidence: float
+
+
+class ReviewPage(BaseModel):
+    items: List[ReviewResultItem]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
 # --- Event Handlers ---
 @app.on_event("startup")
 async def startup_event():
     logger.info("FastAPI Event: Application startup initiated...")
-    await initialize_analysis_service()
+    if settings.dashboard.preload:
+        # Runs alongside the API; dashboard requests wait for it if needed.
+        app.state.dashboard_build = asyncio.create_task(
+            asyncio.to_thread(dashboard.build)
+        )
+    model_service = await asyncio.to_thread(get_model_service)
+    # /api/v1/ready answers 503 until every model has been warmed up.
+    app.state.model_warmup = asyncio.create_task(model_service.warm_up())
+    get_prompt_engine()
+    # The initial analysis runs while the API serves, so /api/v1/stats can
+    # return its progressive approximate snapshots.
+    app.state.analysis_startup = start_analysis_service()
+    model_service.start_sync()
     logger.info("FastAPI Event: Application startup complete.")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await get_model_service().stop_sync()
+    await shutdown_analysis_service()
+
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request, exc: Overloaded):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc), "reason": exc.reason},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 # --- API Endpoints ---
 @app.post("/api/v1/analyze_review", response_model=AnalysisResult)
-async def analyze_review_endpoint(review: ReviewInput):
-    logger.debug(f"API POST /api/v1/analyze_review with text: '{review.text[:50]}...'")
+async def analyze_review_endpoint(
+    review: ReviewInput, model_service: ModelService = Depends(get_model_service)
+):
+    _log_analyze_review(
+        "API POST /api/v1/analyze_review with text: '{:.50}...'", review.text
+    )
     if not model_service.language_model or not model_service.sentiment_model:
         logger.error("Models not available for /api/v1/analyze_review")
         raise HTTPException(status_code=503, detail="Models not available.")
-    lang_result = await model_service.get_language(review.text)
-    sentiment_result = await model_service.get_sentiment(review.text)
+    async with get_admission_controller("analyze_review").admit():
+        lang_result = await model_service.get_language(review.text)
+        sentiment_result = await model_service.get_sentiment(review.text)
     return AnalysisResult(language=lang_result, sentiment=sentiment_result)
 
 
+async def _analyze_timed(model_service: ModelService, text: str) -> BatchAnalysisItem:
+    started = time.perf_counter()
+    lang_result = await model_service.get_language(text)
+    sentiment_result = await model_service.get_sentiment(text)
+    return BatchAnalysisItem(
+        text=text,
+        language=lang_result,
+        sentiment=sentiment_result,
+        latency_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+@app.post("/api/v1/analyze_reviews", response_model=BatchAnalysisResult)
+async def analyze_reviews_batch_endpoint(
+    batch: BatchReviewInput, model_service: ModelService = Depends(get_model_service)
+):
+    logger.debug(f"API POST /api/v1/analyze_reviews with {len(batch.texts)} texts")
+    if not model_service.language_model or not model_service.sentiment_model:
+        logger.error("Models not available for /api/v1/analyze_reviews")
+        raise HTTPException(status_code=503, detail="Models not available.")
+    started = time.perf_counter()
+    async with get_admission_controller("analyze_reviews").admit():
+        results = await asyncio.gather(
+            *(_analyze_timed(model_service, text) for text in batch.texts)
+        )
+    return BatchAnalysisResult(
+        results=list(results), elapsed_ms=(time.perf_counter() - started) * 1000
+    )
+
+
 @app.get("/api/v1/stats", response_model=StatsResponse)
 async def get_statistics_endpoint(
     analysis_svc: AnalysisService = Depends(get_analysis_service),
@@ -110,10 +251,282 @@ async def trigger_reanalysis_endpoint(
     return StatsResponse(stats=new_stats)
 
 
+@app.get("/api/v1/reviews", response_model=ReviewPage)
+async def list_reviews_endpoint(
+    language: Optional[List[str]] = Query(None),
+    stars: Optional[List[int]] = Query(None),
+    min_confidence: Optional[float] = None,
+    max_confidence: Optional[float] = None,
+    product_id: Optional[str] = None,
+    sort_by: str = "row",
+    sort_dir: str = "asc",
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    include_total: bool = False,
+):
+    logger.debug(
+        f"API GET /api/v1/reviews sort={sort_by} {sort_dir}, limit={limit}, cursor={'yes' if cursor else 'no'}"
+    )
+    try:
+        page = await asyncio.to_thread(
+            get_results_store().query,
+            languages=language,
+            stars=stars,
+            min_confidence=min_confidence,
+            max_confidence=max_confidence,
+            product_id=product_id,
+            sort_by=sort_by,
+            sort_dir=sort_dir,
+            cursor=cursor,
+            limit=limit,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ReviewPage(**page)
+
+
+@app.get("/api/v1/reviews/export")
+async def export_reviews_endpoint(
+    format: str = "csv",
+    language: Optional[List[str]] = Query(None),
+    stars: Optional[List[int]] = Query(None),
+    min_confidence: Optional[float] = None,
+    max_confidence: Optional[float] = None,
+    product_id: Optional[str] = None,
+):
+    logger.debug(f"API GET /api/v1/reviews/export format={format}")
+    try:
+        check_export_format(format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    batches = get_results_store().iter_batches(
+        batch_size=settings.backend.results_store.export_batch_size,
+        languages=language,
+        stars=stars,
+        min_confidence=min_confidence,
+        max_confidence=max_confidence,
+        product_id=product_id,
+    )
+    media_type, extension = EXPORT_FORMATS[format]
+    # No Content-Length: the body goes out with chunked transfer encoding, and
+    # the synchronous generator is driven from the threadpool batch by batch.
+    return StreamingResponse(
+        export_results(format, batches),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="review_results.{extension}"'
+        },
+    )
+
+
+def _rollup_page(
+    analysis_svc: AnalysisService,
+    dimension: str,
+    top: int,
+    sort_by: str,
+    order: str,
+    min_reviews: int,
+    values: Optional[List[str]],
+) -> RollupPage:
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order must be 'asc' or 'desc'.")
+    index = analysis_svc.get_rollup_index()
+    if dimension not in index.dimensions():
+        raise HTTPException(
+            status_code=404, detail=f"No rollups for dimension '{dimension}'."
+        )
+    try:
+        items = index.top(
+            dimension,
+            k=top,
+            by=sort_by,
+            ascending=order == "asc",
+            min_count=min_reviews,
+            values=values,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return RollupPage(
+        dimension=dimension, total_values=index.size(dimension), items=items
+    )
+
+
+@app.get("/api/v1/stats/products", response_model=RollupPage)
+async def product_rollups_endpoint(
+    top: int = Query(10, ge=1, le=MAX_ROLLUP_ITEMS),
+    sort_by: str = "count",
+    order: str = "desc",
+    min_reviews: int = Query(0, ge=0),
+    product_id: Optional[List[str]] = Query(None),
+    analysis_svc: AnalysisService = Depends(get_analysis_service),
+):
+    logger.debug(f"API GET /api/v1/stats/products top={top} sort_by={sort_by} {order}")
+    return _rollup_page(
+        analysis_svc, PRODUCT_DIMENSION, top, sort_by, order, min_reviews, product_id
+    )
+
+
+@app.get("/api/v1/stats/products/{product_id}", response_model=RollupSummary)
+async def product_rollup_endpoint(
+    product_id: str,
+    analysis_svc: AnalysisService = Depends(get_analysis_service),
+):
+    logger.debug(f"API GET /api/v1/stats/products/{product_id}")
+    summary = analysis_svc.get_rollup_index().get(PRODUCT_DIMENSION, product_id)
+    if summary is None:
+        raise HTTPException(
+            status_code=404, detail=f"No analyzed reviews for product '{product_id}'."
+        )
+    return summary
+
+
+@app.get("/api/v1/stats/rollups/{dimension}", response_model=RollupPage)
+async def dimension_rollups_endpoint(
+    dimension: str,
+    top: int = Query(10, ge=1, le=MAX_ROLLUP_ITEMS),
+    sort_by: str = "count",
+    order: str = "desc",
+    min_reviews: int = Query(0, ge=0),
+    value: Optional[List[str]] = Query(None),
+    analysis_svc: AnalysisService = Depends(get_analysis_service),
+):
+    logger.debug(f"API GET /api/v1/stats/rollups/{dimension} top={top}")
+    return _rollup_page(
+        analysis_svc, dimension, top, sort_by, order, min_reviews, value
+    )
+
+
+@app.get("/api/v1/stats/confidence", response_model=ConfidencePercentiles)
+async def confidence_percentiles_endpoint(
+    scope: str = "language",
+    metric: str = "sentiment_confidence",
+    q: List[float] = Query(list(DEFAULT_PERCENTILES)),
+    analysis_svc: AnalysisService = Depends(get_analysis_service),
+):
+    logger.debug(f"API GET /api/v1/stats/confidence scope={scope} metric={metric}")
+    try:
+        groups = analysis_svc.get_confidence_percentiles(scope, metric, q)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ConfidencePercentiles(scope=scope, metric=metric, groups=groups)
+
+
+@app.get("/api/v1/stats/trends", response_model=TrendWindow)
+async def trends_endpoint(
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    granularity: str = "auto",
+    analysis_svc: AnalysisService = Depends(get_analysis_service),
+):
+    logger.debug(
+        f"API GET /api/v1/stats/trends start={start} end={end} granularity={granularity}"
+    )
+    if not settings.backend.trends.timestamp_column:
+        raise HTTPException(
+            status_code=404,
+            detail="Trends are disabled; set backend.trends.timestamp_column.",
+        )
+    try:
+        return analysis_svc.get_trend_index().window(start, end, granularity)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/v1/health")
+async def health_endpoint():
+    """Liveness: the process is up and serving requests."""
+    return {"status": "ok"}
+
+
+@app.get("/api/v1/ready")
+async def readiness_endpoint(model_service: ModelService = Depends(get_model_service)):
+    """Readiness: every model is loaded and warmed up (503 until then)."""
+    readiness = model_service.readiness()
+    # Startup returns before warm-up ends; not ready until the task is done.
+    warmup = getattr(app.state, "model_warmup", None)
+    readiness["warming_up"] = warmup is None or not warmup.done()
+    readiness["ready"] = readiness["ready"] and not readiness["warming_up"]
+    return JSONResponse(
+        status_code=200 if readiness["ready"] else 503, content=readiness
+    )
+
+
+@app.get("/api/v1/models/scheduler")
+async def scheduler_stats_endpoint(
+    model_service: ModelService = Depends(get_model_service),
+):
+    logger.debug("API GET /api/v1/models/scheduler called")
+    return model_service.scheduler.stats()
+
+
+@app.get("/api/v1/models/tokens")
+async def token_usage_endpoint(
+    model_service: ModelService = Depends(get_model_service),
+):
+    """Token usage of this worker's model calls since it started; usage per
+    analysis run is in the ``token_usage`` field of ``/api/v1/stats``."""
+    logger.debug("API GET /api/v1/models/tokens called")
+    return model_service.token_usage.to_dict()
+
+
+def require_admin(x_admin_token: Optional[str] = Header(None)):
+    """Admin endpoints are disabled until ``backend.admin_token`` is set."""
+    token = settings.backend.admin_token
+    expected = token.get_secret_value() if token is not None else ""
+    if not expected:
+        raise HTTPException(
+            status_code=403,
+            detail="Admin endpoints are disabled: backend.admin_token is not set.",
+        )
+    if not x_admin_token or not hmac.compare_digest(
+        x_admin_token.encode("utf-8"), expected.encode("utf-8")
+    ):
+        raise HTTPException(status_code=403, detail="Invalid or missing admin token.")
+
+
+@app.get("/api/v1/admin/models", dependencies=[Depends(require_admin)])
+async def list_model_versions_endpoint(
+    model_service: ModelService = Depends(get_model_service),
+):
+    logger.debug("API GET /api/v1/admin/models called")
+    return model_service.describe()
+
+
+@app.post("/api/v1/admin/models/{kind}", dependencies=[Depends(require_admin)])
+async def swap_model_endpoint(
+    kind: str,
+    config: ModelConfig,
+    model_service: ModelService = Depends(get_model_service),
+):
+    """Load, warm up and switch ``kind`` to a new model version. In-flight
+    requests finish on the previous version; other workers follow within
+    a few seconds."""
+    logger.info(f"API POST /api/v1/admin/models/{kind}: {config.class_name}")
+    try:
+        return await model_service.swap_model(kind, config)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.get("/api/v1/admission")
+async def admission_stats_endpoint():
+    logger.debug("API GET /api/v1/admission called")
+    return admission_stats()
+
+
+@app.get("/api/v1/caches")
+async def cache_info_endpoint():
+    logger.debug("API GET /api/v1/caches called")
+    return {
+        name: get_cache(name).info() for name in ("stats", "predictions", "figures")
+    }
+
+
 @app.get("/api/v1/prompt/{prompt_name}")
 async def get_prompt_template_endpoint(prompt_name: str, version: Optional[str] = None):
     logger.debug(f"API GET /api/v1/prompt/{prompt_name}. Version: {version}")
-    prompt_str = prompt_engine.get_prompt(prompt_name, version=version)
+    prompt_str = get_prompt_engine().get_prompt(prompt_name, version=version)
     v = version or settings.prompts.engine.default_version
     if not prompt_str:
         raise HTTPException(
@@ -129,33 +542,21 @@ async def root():
         "message": "Customer Review Analysis API",
         "api_docs_url": "/docs",
         "dashboard_url": (
-            settings.frontend_base_url
-            if dash_app_instance and dash_app_instance.server
-            else "Dashboard not available"
+            "Dashboard not available"
+            if dashboard.failed
+            else settings.frontend_base_url
         ),
     }
 
 
 # --- Mount Dash App ---
-if dash_app_instance and dash_app_instance.server:
-    mount_path = settings.frontend_base_url.rstrip("/")  # + "/"
-    app.mount(
-        mount_path,
-        WSGIMiddleware(dash_app_instance.server),
-        name="dash_app",
-    )
-    logger.info(
-        f"FastAPI: Dash app mounted at FastAPI path: '{mount_path}' using WSGIMiddleware."
-    )
-    logger.debug(
-        f"FastAPI: Dash app's internal url_base_pathname is: '{DASH_CONFIGURED_URL_BASE_PATHNAME}'"
-    )  # Should be /dashboard/
+mount_path = settings.frontend_base_url.rstrip("/")  # + "/"
+app.mount(mount_path, dashboard, name="dash_app")
+logger.info(
+    f"FastAPI: Dash app mounted at FastAPI path: '{mount_path}' (built on first use)."
+)
 
-    @app.get(f"{mount_path}/", include_in_schema=False)
-    async def _dash_redirect():
-        return RedirectResponse(mount_path, status_code=307)
 
-else:
-    logger.error(
-        "FastAPI: Dash app server not available. Frontend will not be mounted."
-    )
+@app.get(f"{mount_path}/", include_in_schema=False)
+async def _dash_redirect():
+    return RedirectResponse(mount_path, status_code=307)
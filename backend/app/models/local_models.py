@@ -3,6 +3,13 @@ from typing import Dict, Any, Optional
 import random
 from loguru import logger
 
+from ..core.logging_config import HotPathLog
+
+# Per-prediction call sites; the prompt is logged by size only, since it
+# contains the review text.
+_log_sentiment_predict = HotPathLog("TRACE")
+_log_language_predict = HotPathLog("TRACE")
+
 
 class LocalSentimentModel(SentimentModelInterface):
     def __init__(self, model_path: Optional[str] = None, **kwargs):
@@ -11,9 +18,11 @@ class LocalSentimentModel(SentimentModelInterface):
         )
 
     def predict(self, text: str, prompt: Optional[str] = None) -> Dict[str, Any]:
-        logger.debug(f"LocalSentimentModel predicting for: {text[:30]}...")
-        if prompt:
-            logger.debug(f"Using prompt: {prompt}")
+        _log_sentiment_predict(
+            "LocalSentimentModel predicting for: {:.30}... (prompt: {} chars)",
+            text,
+            len(prompt) if prompt else 0,
+        )
         return {
             "stars": random.randint(1, 5),
             "confidence": round(random.uniform(0.7, 0.99), 2),
@@ -28,9 +37,11 @@ class LocalLanguageModel(LanguageModelInterface):
         )
 
     def predict(self, text: str, prompt: Optional[str] = None) -> Dict[str, Any]:
-        logger.debug(f"LocalLanguageModel predicting for: {text[:30]}...")
-        if prompt:
-            logger.debug(f"Using prompt: {prompt}")
+        _log_language_predict(
+            "LocalLanguageModel predicting for: {:.30}... (prompt: {} chars)",
+            text,
+            len(prompt) if prompt else 0,
+        )
         if any(char in "éàçê" for char in text.lower()):
             lang = "fr"
         elif any(char in "ñáéíóúü" for char in text.lower()):
@@ -1,75 +1,225 @@
 import json
+import string
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Any, Dict, FrozenSet, Optional, Set, Tuple
 from loguru import logger
 
 from ..config import settings
 
 
+class CompiledPrompt:
+    """A prompt template parsed once at load time.
+
+    The placeholders are extracted up front, so rendering checks for missing
+    variables with a set difference instead of catching ``KeyError``, and
+    renders are memoized per distinct set of variable values.
+    """
+
+    def __init__(self, key: str, data: Dict[str, Any], render_cache_size: int):
+        template = data.get("template")
+        if not isinstance(template, str) or not template:
+            raise ValueError("missing or empty 'template' field")
+        self.key = key
+        self.name = data.get("name")
+        self.version = data.get("version")
+        self.type = data.get("type")
+        self.template = template
+        self.variables = self._parse_variables(template)
+        declared = data.get("variables")
+        if declared is not None and set(declared) != self.variables:
+            raise ValueError(
+                f"template uses {sorted(self.variables)} but declares {sorted(declared)}"
+            )
+        self._render = lru_cache(maxsize=render_cache_size)(self._format)
+
+    @staticmethod
+    def _parse_variables(template: str) -> FrozenSet[str]:
+        variables: Set[str] = set()
+        try:
+            fields = [
+                f for _, f, _, _ in string.Formatter().parse(template) if f is not None
+            ]
+        except ValueError as e:  # Unbalanced braces
+            raise ValueError(f"invalid template: {e}") from e
+        for field in fields:
+            if not field.isidentifier():
+                raise ValueError(
+                    f"placeholder '{{{field}}}' must be a plain name, e.g. {{review_text}}"
+                )
+            variables.add(field)
+        return frozenset(variables)
+
+    def _format(self, items: Tuple[Tuple[str, Any], ...]) -> str:
+        return self.template.format(**dict(items))
+
+    def missing(self, variables: Dict[str, Any]) -> Set[str]:
+        return set(self.variables - variables.keys())
+
+    def render(self, variables: Dict[str, Any]) -> str:
+        """Fill the template; ``variables`` must cover ``self.variables``."""
+        items = tuple(sorted((name, variables[name]) for name in self.variables))
+        try:
+            return self._render(items)
+        except TypeError:  # Unhashable value: render without the memo
+            return self._format(items)
+
+    def cache_info(self):
+        return self._render.cache_info()
+
+
 class PromptEngine:
-    def __init__(self, template_dir: str, default_version: str):
+    def __init__(
+        self,
+        template_dir: str,
+        default_version: str,
+        reload_interval_seconds: float = 2.0,
+        render_cache_size: int = 1024,
+    ):
         self.template_dir = Path(template_dir)
         self.default_version = default_version
-        self.prompts_cache: Dict[str, Dict] = {}
+        self.reload_interval_seconds = reload_interval_seconds
+        self.render_cache_size = render_cache_size
+        self.prompts_cache: Dict[str, CompiledPrompt] = {}
+        # file -> (mtime_ns, size, prompt key or None if it failed to compile)
+        self._files: Dict[Path, Tuple[int, int, Optional[str]]] = {}
+        self._next_reload_check = time.monotonic() + reload_interval_seconds
+        self._warned_missing: Set[str] = set()
         self._load_all_prompts()
 
+    def _prompt_key(self, file_path: Path, prompt_data: Dict[str, Any]) -> str:
+        prompt_name_from_file = file_path.stem
+        version = prompt_data.get("version", self.default_version)
+        base_name = prompt_data.get(
+            "name", prompt_name_from_file.replace(f"_{version}", "")
+        )
+        return (
+            f"{base_name}_{version}" if "name" in prompt_data else prompt_name_from_file
+        )
+
+    def _load_file(self, file_path: Path) -> Optional[str]:
+        """Compile one template file; returns its key, None if it is invalid
+        (a previously loaded version of the prompt is then kept)."""
+        try:
+            with open(file_path, "r", encoding="utf-8") as f:
+                prompt_data = json.load(f)
+            key = self._prompt_key(file_path, prompt_data)
+            self.prompts_cache[key] = CompiledPrompt(
+                key, prompt_data, self.render_cache_size
+            )
+            logger.debug(f"Loaded prompt: {key} from {file_path.name}")
+            return key
+        except json.JSONDecodeError:
+            logger.warning(f"Could not decode JSON from {file_path}", exc_info=True)
+        except ValueError as e:
+            logger.warning(f"Invalid prompt template {file_path.name}: {e}")
+        except Exception as e:
+            logger.warning(f"Error loading prompt {file_path}: {e}", exc_info=True)
+        return None
+
+    def _scan(self) -> Dict[Path, Tuple[int, int]]:
+        files = {}
+        for file_path in self.template_dir.glob("*.json"):
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue  # Removed while scanning
+            files[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return files
+
     def _load_all_prompts(self):
         if not self.template_dir.is_dir():
             logger.warning(
                 f"Prompt template directory not found or not a directory: {self.template_dir}"
             )
             return
-        for file_path in self.template_dir.glob("*.json"):
-            try:
-                with open(file_path, "r", encoding="utf-8") as f:
-                    prompt_data = json.load(f)
-                prompt_name_from_file = file_path.stem
-                version = prompt_data.get("version", self.default_version)
-                base_name = prompt_data.get(
-                    "name", prompt_name_from_file.replace(f"_{version}", "")
-                )
+        for file_path, state in self._scan().items():
+            self._files[file_path] = (*state, self._load_file(file_path))
 
-                key = (
-                    f"{base_name}_{version}"
-                    if "name" in prompt_data
-                    else prompt_name_from_file
-                )
-                self.prompts_cache[key] = prompt_data
-                logger.debug(f"Loaded prompt: {key} from {file_path.name}")
-            except json.JSONDecodeError:
-                logger.warning(f"Could not decode JSON from {file_path}", exc_info=True)
-            except Exception as e:
-                logger.warning(f"Error loading prompt {file_path}: {e}", exc_info=True)
-
-    def get_prompt(
-        self, name: str, version: Optional[str] = None, variables: Optional[Dict] = None
-    ) -> Optional[str]:
-        target_version = version or self.default_version
-        prompt_key = f"{name}_{target_version}"
+    def reload_changed(self) -> int:
+        """Recompile templates whose file changed, appeared or disappeared
+        since the last check; returns the number of files affected."""
+        if not self.template_dir.is_dir():
+            return 0
+        current = self._scan()
+        changed = 0
+        for file_path in set(self._files) - set(current):
+            key = self._files.pop(file_path)[2]
+            if key and key in self.prompts_cache:
+                del self.prompts_cache[key]
+            logger.info(f"Prompt file removed: {file_path.name}")
+            changed += 1
+        for file_path, state in current.items():
+            previous = self._files.get(file_path)
+            if previous is not None and previous[:2] == state:
+                continue
+            key = self._load_file(file_path)
+            if key is None and previous is not None:
+                key = previous[2]  # Keep serving the last valid version
+            elif previous is not None and previous[2] not in (None, key):
+                self.prompts_cache.pop(previous[2], None)  # Renamed in the file
+            self._files[file_path] = (*state, key)
+            logger.info(
+                f"Prompt file {'changed' if previous else 'added'}: {file_path.name}"
+            )
+            changed += 1
+        if changed:
+            self._warned_missing.clear()
+        return changed
 
-        prompt_template_data = self.prompts_cache.get(prompt_key)
+    def _maybe_reload(self):
+        if self.reload_interval_seconds <= 0:
+            return
+        now = time.monotonic()
+        if now >= self._next_reload_check:
+            self._next_reload_check = now + self.reload_interval_seconds
+            self.reload_changed()
 
-        if not prompt_template_data:
+    def get_compiled(
+        self, name: str, version: Optional[str] = None
+    ) -> Optional[CompiledPrompt]:
+        self._maybe_reload()
+        prompt_key = f"{name}_{version or self.default_version}"
+        prompt = self.prompts_cache.get(prompt_key)
+        if prompt is None and prompt_key not in self._warned_missing:
+            # Once per key: a hot path asking for a missing prompt must not
+            # flood the log.
+            self._warned_missing.add(prompt_key)
             logger.warning(
-                f"Prompt '{prompt_key}' not found in cache. Available: {list(self.prompts_cache.keys())}"
+                f"Prompt '{prompt_key}' not found ({len(self.prompts_cache)} loaded)."
             )
-            return None
+        return prompt
 
-        template_str = prompt_template_data.get("template")
-        if not template_str:
-            logger.warning(f"No 'template' field in prompt data for '{prompt_key}'.")
+    def get_prompt(
+        self, name: str, version: Optional[str] = None, variables: Optional[Dict] = None
+    ) -> Optional[str]:
+        prompt = self.get_compiled(name, version)
+        if prompt is None:
             return None
 
         if variables:
-            try:
-                return template_str.format(**variables)
-            except KeyError as e:
-                logger.warning(f"Missing variable {e} for prompt '{prompt_key}'.")
-                return template_str
-        return template_str
+            missing = prompt.missing(variables)
+            if missing:
+                logger.warning(
+                    f"Missing variable(s) {sorted(missing)} for prompt '{prompt.key}'."
+                )
+                return prompt.template
+            return prompt.render(variables)
+        return prompt.template
+
+
+_prompt_engine_instance: Optional[PromptEngine] = None
 
 
-prompt_engine = PromptEngine(
-    template_dir=settings.prompts.engine.template_dir,
-    default_version=settings.prompts.engine.default_version,
-)
+def get_prompt_engine() -> PromptEngine:
+    """Process-wide PromptEngine; templates are read on first use."""
+    global _prompt_engine_instance
+    if _prompt_engine_instance is None:
+        _prompt_engine_instance = PromptEngine(
+            template_dir=settings.prompts.engine.template_dir,
+            default_version=settings.prompts.engine.default_version,
+            reload_interval_seconds=settings.prompts.engine.reload_interval_seconds,
+            render_cache_size=settings.prompts.engine.render_cache_size,
+        )
+    return _prompt_engine_instance
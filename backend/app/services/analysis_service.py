@@ -1,15 +1,48 @@
-import pandas as pd
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from collections import Counter
+from typing import List, Dict, Any, Optional, Tuple
 import asyncio
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timedelta
 from loguru import logger
 
 from ..config import settings
-from .model_service import model_service
+from .review_pipeline import (
+    ReviewGroup,
+    analyze_groups,
+    group_reviews,
+    progressive_order,
+)
+from .model_service import get_model_service
+from .sharded_analysis import ShardedAnalysisRunner
+from .dataset_watcher import DatasetWatcher, file_state, read_csv_rows
 from ..core import caching
+from ..core.process_lock import ProcessLock
+from ..core.quantiles import KLLSketch
+from ..core.rollups import RollupIndex
+from ..core.trends import TREND_GRANULARITIES, TrendIndex
+from ..core.sketches import CONFIDENCE_METRICS, StatsSketch
+from ..storage.results_store import get_results_store
+from ..storage.state_store import get_state_store
 
-from ..prompts.prompt_engine import prompt_engine
+from ..prompts.prompt_engine import get_prompt_engine
+
+STATS_STATE_KEY = "stats"
+DATASET_OFFSETS_CACHE_KEY = "dataset_offsets"
+SKETCH_CACHE_KEY = "stats_sketch"
+# Aggregates published next to the stats for the query endpoints
+ROLLUPS_STATE_KEY = "rollups"
+CONFIDENCE_STATE_KEY = "confidence"
+TRENDS_STATE_KEY = "trends"
+# Exact sketch and ingestion checkpoint behind the published stats, so the
+# leader continues from runs finished by other workers
+SKETCH_STATE_KEY = "stats_sketch"
+OFFSETS_STATE_KEY = "dataset_offsets"
+SHARED_STATE_POLL_SECONDS = 1.0
+# How often a follower tries to take over the leader lock
+LEADER_RETRY_SECONDS = 5.0
 
 
 class AnalysisService:
@@ -18,22 +51,104 @@ class AnalysisService:
         self.dataset_path = Path(settings.backend.dataset_path)
         self.cache_file_name = settings.backend.results_cache_file
         self.stats: Optional[Dict[str, Any]] = None
+        self.results_store = get_results_store()
+        self.state_store = get_state_store()
+        cache_dir = Path(settings.backend.cache_dir)
+        # The leader lock is held for the process lifetime by the one worker that
+        # owns startup analysis; the run lock serializes analysis runs across workers.
+        self.leader_lock = ProcessLock(str(cache_dir / "analysis_leader.lock"))
+        self.run_lock = ProcessLock(str(cache_dir / "analysis_run.lock"))
+        self.is_leader = False
+        self._leadership_task: Optional[asyncio.Task] = None
+        self._stats_state_version = 0
+        self._last_state_check = 0.0
+        # Bytes of each dataset file already reflected in the stats
+        self.dataset_offsets: Dict[str, Dict[str, Any]] = {}
+        self._read_offsets: Dict[str, Dict[str, Any]] = {}
+        self.watcher: Optional[DatasetWatcher] = None
+        # Exact mergeable aggregate behind self.stats (leader only)
+        self.sketch: Optional[StatsSketch] = None
+        self.rollup_index = RollupIndex()
+        self.confidence_sketches: Dict[str, Dict[str, Dict[str, KLLSketch]]] = {}
+        self.trend_index = TrendIndex()
+        self._aggregate_versions = {
+            ROLLUPS_STATE_KEY: 0,
+            CONFIDENCE_STATE_KEY: 0,
+            TRENDS_STATE_KEY: 0,
+        }
+        self._leader_state_versions = {SKETCH_STATE_KEY: 0, OFFSETS_STATE_KEY: 0}
+        # With analysis_workers > 1, runs are split into row-range shards scored
+        # in a process pool and reduced by merging partial StatsSketches.
+        self.sharded_runner = (
+            ShardedAnalysisRunner(settings.backend.analysis_workers)
+            if settings.backend.analysis_workers > 1
+            else None
+        )
         logger.debug(
             f"Dataset path: {self.dataset_path}, Cache file name: {self.cache_file_name}"
         )
 
     async def _load_or_generate_stats_async(self):
         logger.debug("AnalysisService: Attempting to load or generate stats...")
+        self.is_leader = self.leader_lock.acquire()
+        if not self.is_leader:
+            logger.info(
+                f"Worker {os.getpid()} is a follower; reading analysis state from shared storage."
+            )
+            self._refresh_from_shared_state(force=True)
+            self._leadership_task = asyncio.create_task(self._wait_for_leadership())
+            return
+        logger.info(f"Worker {os.getpid()} is the analysis leader.")
+        await self._load_leader_state()
+
+    async def _wait_for_leadership(self):
+        """Take over as leader once the current leader's process exits (the
+        OS then releases its lock): load its cached stats and start the
+        watcher."""
+        while not self.leader_lock.acquire():
+            await asyncio.sleep(LEADER_RETRY_SECONDS)
+        self.is_leader = True
+        logger.warning(
+            f"Worker {os.getpid()} took over as the analysis leader; the previous leader exited."
+        )
+        try:
+            await self._load_leader_state()
+        except Exception as e:
+            logger.error(f"Loading state as the new leader failed: {e}", exc_info=True)
+        self.start_watcher()
+
+    def start_watcher(self):
+        if settings.backend.watcher.enabled and self.is_leader and not self.watcher:
+            self.watcher = DatasetWatcher(self, settings.backend.watcher)
+            self.watcher.start()
+
+    async def _load_leader_state(self):
         if not settings.backend.force_reanalyze_on_startup:
-            self.stats = caching.load_cache(self.cache_file_name)
+            self.stats = await caching.load_cache_async(
+                self.cache_file_name, fingerprint=self._stats_cache_fingerprint()
+            )
+            if self.stats:
+                sketch_state = await caching.load_cache_async(
+                    SKETCH_CACHE_KEY, fingerprint=self._stats_cache_fingerprint()
+                )
+                if sketch_state is None:
+                    logger.info("Cached stats have no matching sketch; re-analyzing.")
+                    self.stats = None
             if self.stats:
                 logger.info("Analysis stats loaded from cache.")
+                self.sketch = StatsSketch.from_state(sketch_state)
+                await self._save_dataset_offsets(
+                    await caching.load_cache_async(DATASET_OFFSETS_CACHE_KEY) or {}
+                )
+                self._publish_stats(self.stats, self.sketch)
 
         if not self.stats:
             if settings.backend.force_reanalyze_on_startup:
                 logger.info("Forcing re-analysis of dataset on startup.")
             else:
-                logger.info("Cache not found. Starting full analysis of dataset.")
+                logger.info(
+                    "No valid cache for the current dataset/models/prompts. Starting full analysis of dataset."
+                )
             self.stats = await self.run_full_analysis()
         else:
             logger.debug("Stats were available, no generation needed.")
@@ -61,6 +176,8 @@ class AnalysisService:
                 ],
             }
             try:
+                import pandas as pd
+
                 df_dummy = pd.DataFrame(dummy_data)
                 self.dataset_path.parent.mkdir(parents=True, exist_ok=True)
                 df_dummy.to_csv(self.dataset_path, index=False)
@@ -69,113 +186,377 @@ class AnalysisService:
                 logger.error(f"Could not create dummy dataset: {e}", exc_info=True)
                 return None
         try:
-            df = pd.read_csv(self.dataset_path)
-            if "review_text" not in df.columns:
-                logger.error("Dataset error: 'review_text' column not found.")
-                return None
-            logger.info(f"Dataset loaded successfully with {len(df)} reviews.")
-
-            return df.to_dict("records")
+            reviews: List[Dict[str, Any]] = []
+            offsets: Dict[str, Dict[str, Any]] = {}
+            for path in self.dataset_files():
+                records, end = read_csv_rows(path)
+                if records is None:
+                    if path == self.dataset_path:
+                        return None
+                    continue
+                reviews.extend(records)
+                offsets[str(path)] = file_state(path, end, len(records))
+            self._read_offsets = offsets
+            logger.info(
+                f"Dataset loaded successfully with {len(reviews)} reviews from {len(offsets)} file(s)."
+            )
+            return reviews
         except Exception as e:
             logger.error(f"Error loading dataset: {e}", exc_info=True)
 
             return None
 
+    def dataset_files(self) -> List[Path]:
+        """The dataset file followed by any files in the watcher's drop directory."""
+        files = [self.dataset_path]
+        drop_directory = settings.backend.watcher.drop_directory
+        if drop_directory and Path(drop_directory).is_dir():
+            files.extend(
+                sorted(
+                    p
+                    for p in Path(drop_directory).glob(settings.backend.watcher.pattern)
+                    if p.is_file()
+                )
+            )
+        return files
+
+    def _stats_cache_fingerprint(self) -> Dict[str, str]:
+        """Everything the aggregate stats depend on: data, models and prompts."""
+        return caching.build_fingerprint(
+            dataset=caching.dataset_fingerprint(str(self.dataset_path)),
+            models=caching.models_fingerprint(get_model_service().active_configs()),
+            prompts=caching.prompts_fingerprint(get_prompt_engine().prompts_cache),
+            dedup=json.dumps(settings.backend.dedup.model_dump(), sort_keys=True),
+            rollups=json.dumps(settings.backend.rollups.model_dump(), sort_keys=True),
+            trends=settings.backend.trends.timestamp_column,
+        )
+
+    def _publish_stats(
+        self, stats: Dict[str, Any], sketch: Optional[StatsSketch] = None
+    ):
+        # Aggregates go first: followers re-read them when the stats version moves.
+        if sketch is not None:
+            for key, value in (
+                (ROLLUPS_STATE_KEY, sketch.rollups_payload()),
+                (CONFIDENCE_STATE_KEY, sketch.confidence_payload()),
+                (TRENDS_STATE_KEY, sketch.trends_payload()),
+            ):
+                self._set_aggregate(key, value)
+                self._aggregate_versions[key] = self.state_store.put(key, value)
+            self._leader_state_versions[SKETCH_STATE_KEY] = self.state_store.put(
+                SKETCH_STATE_KEY, sketch.to_state()
+            )
+        self._stats_state_version = self.state_store.put(STATS_STATE_KEY, stats)
+
+    def _set_aggregate(self, key: str, value: Dict[str, Any]):
+        if key == ROLLUPS_STATE_KEY:
+            self.rollup_index = RollupIndex(value)
+        elif key == TRENDS_STATE_KEY:
+            self.trend_index = TrendIndex(value)
+        elif key == CONFIDENCE_STATE_KEY:
+            self.confidence_sketches = {
+                scope: {
+                    k: {metric: KLLSketch.from_dict(d) for metric, d in metrics.items()}
+                    for k, metrics in keys.items()
+                }
+                for scope, keys in value.items()
+            }
+
+    def _refresh_from_shared_state(self, force: bool = False):
+        """Pick up stats published by another worker, polling at most once a second."""
+        now = time.monotonic()
+        if not force and now - self._last_state_check < SHARED_STATE_POLL_SECONDS:
+            return
+        self._last_state_check = now
+        try:
+            if self.state_store.version(STATS_STATE_KEY) == self._stats_state_version:
+                return
+            state = self.state_store.get(STATS_STATE_KEY)
+        except Exception as e:
+            logger.error(f"Could not read shared analysis state: {e}", exc_info=True)
+            return
+        if state:
+            self.stats = state["value"]
+            self._stats_state_version = state["version"]
+            self._refresh_aggregates_from_shared_state()
+            if self.is_leader:
+                self._refresh_leader_state_from_shared_state()
+            logger.debug(
+                f"Stats refreshed from shared state (version {state['version']})."
+            )
+
+    def _refresh_aggregates_from_shared_state(self):
+        for key in self._aggregate_versions:
+            try:
+                if self.state_store.version(key) == self._aggregate_versions[key]:
+                    continue
+                state = self.state_store.get(key)
+            except Exception as e:
+                logger.error(f"Could not read shared '{key}' state: {e}", exc_info=True)
+                continue
+            if state:
+                self._set_aggregate(key, state["value"])
+                self._aggregate_versions[key] = state["version"]
+
+    def _refresh_leader_state_from_shared_state(self):
+        """Adopt the sketch and checkpoint of a run another worker finished
+        (e.g. a reanalysis triggered on a follower), so later incremental
+        ingestion builds on that run instead of overwriting it."""
+        for key in self._leader_state_versions:
+            try:
+                if self.state_store.version(key) == self._leader_state_versions[key]:
+                    continue
+                state = self.state_store.get(key)
+            except Exception as e:
+                logger.error(f"Could not read shared '{key}' state: {e}", exc_info=True)
+                continue
+            if not state:
+                continue
+            if key == SKETCH_STATE_KEY:
+                self.sketch = StatsSketch.from_state(state["value"])
+            else:
+                self.dataset_offsets = state["value"]
+            self._leader_state_versions[key] = state["version"]
+            logger.info(f"Leader picked up '{key}' published by another worker.")
+
+    def get_rollup_index(self) -> RollupIndex:
+        self._refresh_from_shared_state()
+        return self.rollup_index
+
+    def get_trend_index(self) -> TrendIndex:
+        self._refresh_from_shared_state()
+        return self.trend_index
+
+    def get_confidence_percentiles(
+        self, scope: str, metric: str, quantiles: List[float]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Percentiles of ``metric`` for every key in ``scope`` (overall,
+        language or stars). Raises ValueError for unknown scopes/metrics."""
+        self._refresh_from_shared_state()
+        if scope not in CONFIDENCE_METRICS:
+            raise ValueError(
+                f"Invalid scope '{scope}'. Use one of {list(CONFIDENCE_METRICS)}."
+            )
+        if metric not in CONFIDENCE_METRICS[scope]:
+            raise ValueError(
+                f"Metric '{metric}' is not tracked per {scope}. "
+                f"Use one of {list(CONFIDENCE_METRICS[scope])}."
+            )
+        if any(not 0 <= q <= 1 for q in quantiles):
+            raise ValueError("Quantiles must be between 0 and 1.")
+        return {
+            key: metrics[metric].summary(quantiles)
+            for key, metrics in self.confidence_sketches.get(scope, {}).items()
+            if metric in metrics
+        }
+
     async def run_full_analysis(self) -> Dict[str, Any]:
+        if not self.run_lock.acquire():
+            logger.warning(
+                "An analysis run is already in progress; returning current stats."
+            )
+            return self.stats or {
+                "status": "loading",
+                "message": "Analysis is already running. Please try again shortly.",
+            }
+        try:
+            return await self._run_full_analysis_locked()
+        finally:
+            self.run_lock.release()
+
+    async def _run_full_analysis_locked(self) -> Dict[str, Any]:
         logger.info("Starting full dataset analysis...")
         reviews = self.get_dataset_reviews()
+        cache_fingerprint = self._stats_cache_fingerprint()
 
         if not reviews:
             logger.error("Cannot run analysis, dataset could not be loaded.")
 
             return {"error": "Could not load reviews from dataset."}
 
-        processed_reviews_data = []
-        language_counts = Counter()
-        sentiment_counts = Counter()
-        sentiment_by_language = {}
+        groups, dedup = await asyncio.to_thread(
+            group_reviews, reviews, settings.backend.dedup
+        )
+        rows_total = sum(len(group) for group in groups)
+        batches = self._analysis_batches(groups)
+        sketch = StatsSketch()
+        indexed_results = []
+        for i, batch in enumerate(batches):
+            batch_sketch, batch_results = await self._score_groups(batch)
+            sketch.merge(batch_sketch)
+            indexed_results.extend(batch_results)
+            if i < len(batches) - 1:
+                self._publish_approximate_stats(sketch, len(reviews), rows_total)
+        sketch.add_duplicates(dedup.exact_duplicates, dedup.near_duplicates)
+        processed_reviews_data = [
+            review for _, review in sorted(indexed_results, key=lambda r: r[0])
+        ]
+        overall_stats = sketch.to_stats(total_in_dataset=len(reviews))
+
+        await asyncio.to_thread(self.results_store.replace_all, processed_reviews_data)
 
-        tasks = []
-        for review_data in reviews:
-            text = review_data.get("review_text", "")
-            if text:
-                tasks.append(self._process_single_review(review_data, text))
-            else:
-                logger.warning(
-                    f"Skipping review with empty text. ID: {review_data.get('review_id', 'N/A')}"
+        await self._commit_stats(
+            overall_stats, sketch, cache_fingerprint, self._read_offsets
+        )
+        logger.success("Full analysis complete and stats cached.")
+        return overall_stats
+
+    async def ingest_reviews(
+        self,
+        reviews: List[Dict[str, Any]],
+        offsets: Dict[str, Tuple[int, int]],
+        start_offsets: Optional[Dict[str, int]] = None,
+    ) -> bool:
+        """Fold newly appended reviews into the current stats.
+
+        ``offsets`` maps each file to the byte offset the new rows end at and
+        its number of data rows up to there; ``start_offsets`` to the offset
+        they were read from.
+        Returns False (retry later) while another analysis run holds the lock,
+        or when another worker's run has moved the checkpoint since the rows
+        were read (they are then re-read from the new checkpoint).
+        """
+        if not self.run_lock.acquire():
+            logger.info("Analysis run in progress; deferring incremental ingestion.")
+            return False
+        try:
+            self._refresh_from_shared_state(force=True)
+            if any(
+                self.dataset_offsets.get(path, {}).get("offset", 0) != start
+                for path, start in (start_offsets or {}).items()
+            ):
+                logger.info(
+                    "Another worker's analysis moved the ingestion checkpoint; re-reading new rows."
                 )
+                return False
+            if self.sketch is None or not self.stats or self.stats.get("approximate"):
+                logger.info(
+                    "No exact stats to update; running a full analysis instead."
+                )
+                await self._run_full_analysis_locked()
+                return True
 
-        logger.info(f"Processing {len(tasks)} reviews concurrently...")
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+            new_offsets = {
+                path: file_state(Path(path), end, rows)
+                for path, (end, rows) in offsets.items()
+            }
+            if reviews:
+                cache_fingerprint = self._stats_cache_fingerprint()
+                groups, dedup = await asyncio.to_thread(
+                    group_reviews, reviews, settings.backend.dedup
+                )
+                sketch, indexed_results = await self._score_groups(groups)
+                sketch.add_duplicates(dedup.exact_duplicates, dedup.near_duplicates)
+                await asyncio.to_thread(
+                    self.results_store.upsert,
+                    [r for _, r in sorted(indexed_results, key=lambda r: r[0])],
+                )
 
-        successful_processing_count = 0
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(
-                    f"Error processing review (index {i}): {result}", exc_info=result
+                merged = StatsSketch.from_state(self.sketch.to_state()).merge(sketch)
+                stats = merged.to_stats(
+                    total_in_dataset=self.stats.get("total_reviews_in_dataset", 0)
+                    + len(reviews)
                 )
-                # Optionally store info about failed review
-                continue
-            if result:
-                processed_reviews_data.append(result["processed_review"])
-                language_counts[result["lang"]] += 1
-                if result["stars"] > 0:
-                    sentiment_counts[result["stars"]] += 1
-                    if result["lang"] not in sentiment_by_language:
-                        sentiment_by_language[result["lang"]] = Counter()
-                    sentiment_by_language[result["lang"]][result["stars"]] += 1
-                successful_processing_count += 1
+                await self._commit_stats(
+                    stats,
+                    merged,
+                    cache_fingerprint,
+                    {**self.dataset_offsets, **new_offsets},
+                )
+            else:
+                await self._save_dataset_offsets(
+                    {**self.dataset_offsets, **new_offsets}
+                )
+            logger.success(f"Ingested {len(reviews)} new reviews incrementally.")
+            return True
+        finally:
+            self.run_lock.release()
 
-        logger.info(
-            f"Successfully processed {successful_processing_count}/{len(tasks)} reviews."
+    async def _commit_stats(
+        self,
+        stats: Dict[str, Any],
+        sketch: StatsSketch,
+        cache_fingerprint: Dict[str, str],
+        offsets: Dict[str, Dict[str, Any]],
+    ):
+        """Cache and publish exact stats together with the sketch and dataset
+        checkpoint behind them."""
+        self._prune_hourly_trends(sketch)
+        stats["stats_version"] = self._compute_stats_version(stats)
+        await caching.save_cache_async(
+            stats, self.cache_file_name, fingerprint=cache_fingerprint
+        )
+        await caching.save_cache_async(
+            sketch.to_state(), SKETCH_CACHE_KEY, fingerprint=cache_fingerprint
         )
+        self.stats = stats
+        self.sketch = sketch
+        await self._save_dataset_offsets(offsets)
+        self._publish_stats(stats, sketch)
 
-        overall_stats = {
-            "total_reviews_processed": successful_processing_count,
-            "total_reviews_in_dataset": len(reviews),
-            "language_distribution": dict(language_counts),
-            "overall_sentiment_distribution": dict(sentiment_counts),
-            "sentiment_distribution_by_language": {
-                lang: dict(counts) for lang, counts in sentiment_by_language.items()
-            },
-        }
+    @staticmethod
+    def _prune_hourly_trends(sketch: StatsSketch):
+        hourly = sketch.trends.get("hour")
+        if not hourly:
+            return
+        newest = datetime.strptime(max(hourly), TREND_GRANULARITIES["hour"])
+        cutoff = newest - timedelta(days=settings.backend.trends.hourly_retention_days)
+        sketch.prune_trends("hour", cutoff.strftime(TREND_GRANULARITIES["hour"]))
 
-        caching.save_cache(overall_stats, self.cache_file_name)
-        self.stats = overall_stats
-        logger.success("Full analysis complete and stats cached.")
-        return overall_stats
+    async def _score_groups(self, groups: List[ReviewGroup]):
+        if self.sharded_runner is not None and len(groups) > 1:
+            return await self.sharded_runner.run(groups)
+        return await analyze_groups(groups)
 
-    async def _process_single_review(
-        self, review_data: Dict, text: str
-    ) -> Optional[Dict]:
-        review_id = review_data.get("review_id", "N/A")
-        logger.trace(f"Processing review ID: {review_id}, Text: '{text[:30]}...'")
-        try:
-            lang_result = await model_service.get_language(text)
-            sentiment_result = await model_service.get_sentiment(text)
+    async def _save_dataset_offsets(self, offsets: Dict[str, Dict[str, Any]]):
+        self.dataset_offsets = offsets
+        self._leader_state_versions[OFFSETS_STATE_KEY] = self.state_store.put(
+            OFFSETS_STATE_KEY, offsets
+        )
+        await caching.save_cache_async(offsets, DATASET_OFFSETS_CACHE_KEY)
+
+    def _analysis_batches(self, groups: List[ReviewGroup]) -> List[List[ReviewGroup]]:
+        """Split a run into batches; on large datasets the first batch is a
+        stratified sample and each later batch refines the estimates."""
+        progressive = settings.backend.progressive
+        if not progressive.enabled or len(groups) < progressive.min_rows:
+            return [groups]
+        ordered, sample_len = progressive_order(
+            groups, progressive.sample_size, progressive.seed
+        )
+        step = max(1, progressive.refine_batch_size)
+        batches = [ordered[:sample_len]]
+        batches.extend(
+            ordered[start : start + step]
+            for start in range(sample_len, len(ordered), step)
+        )
+        logger.info(
+            f"Progressive analysis: sample of {sample_len} reviews, then {len(batches) - 1} refinement batches."
+        )
+        return [batch for batch in batches if batch]
 
-            lang = lang_result.get("language", "unknown") if lang_result else "unknown"
-            stars = sentiment_result.get("stars", 0) if sentiment_result else 0
+    def _publish_approximate_stats(
+        self, sketch: StatsSketch, total_in_dataset: int, rows_total: int
+    ):
+        stats = sketch.to_approximate_stats(
+            total_in_dataset,
+            rows_total,
+            confidence_level=settings.backend.progressive.confidence_level,
+        )
+        stats["stats_version"] = self._compute_stats_version(stats)
+        self.stats = stats
+        self._publish_stats(stats)
+        logger.info(
+            f"Published approximate stats ({stats['progress']['fraction']:.1%} of rows analyzed)."
+        )
 
-            processed_review = {
-                "review_id": review_id,
-                "text_preview": text[:50] + "...",
-                "detected_language": lang,
-                "predicted_sentiment_stars": stars,
-            }
-            logger.trace(
-                f"Review ID {review_id} processed. Lang: {lang}, Stars: {stars}"
-            )
-            return {"processed_review": processed_review, "lang": lang, "stars": stars}
-        except Exception as e:
-            logger.error(
-                f"Exception while processing single review ID {review_id}: {e}",
-                exc_info=True,
-            )
-            # This exception will be caught by asyncio.gather if return_exceptions=True
-            raise  # Or return None / error structure
+    @staticmethod
+    def _compute_stats_version(stats: Dict[str, Any]) -> str:
+        payload = json.dumps(stats, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()[:16]
 
     def get_stats(self) -> Optional[Dict[str, Any]]:
+        self._refresh_from_shared_state()
         if not self.stats:
             logger.warning("Stats requested but not yet available/generated.")
             return {
@@ -187,25 +568,60 @@ class AnalysisService:
 
 
 _analysis_service_instance: Optional[AnalysisService] = None
+_analysis_startup_task: Optional[asyncio.Task] = None
 
 
-async def initialize_analysis_service():
-    global _analysis_service_instance
-    logger.debug("Attempting to initialize AnalysisService...")
+async def _load_analysis_service(service: AnalysisService):
+    try:
+        await service._load_or_generate_stats_async()
+        logger.success("AnalysisService initialized and stats loaded/generated.")
+    except Exception as e:
+        logger.error(f"Loading or generating stats failed: {e}", exc_info=True)
+    service.start_watcher()
+
+
+def start_analysis_service() -> asyncio.Task:
+    """Create the service and load or generate its stats in a background task.
+
+    The API serves requests meanwhile: ``/api/v1/stats`` answers "loading",
+    then the progressive approximate snapshots, then the exact stats.
+    """
+    global _analysis_service_instance, _analysis_startup_task
     if _analysis_service_instance is None:
         logger.info("AnalysisService instance not found, creating new one.")
         _analysis_service_instance = AnalysisService()
-        await _analysis_service_instance._load_or_generate_stats_async()
-        logger.success("AnalysisService initialized and stats loaded/generated.")
+        _analysis_startup_task = asyncio.create_task(
+            _load_analysis_service(_analysis_service_instance)
+        )
     else:
         logger.debug("AnalysisService instance already exists.")
+    return _analysis_startup_task
+
+
+async def initialize_analysis_service():
+    """Like ``start_analysis_service``, but wait until stats are available."""
+    logger.debug("Attempting to initialize AnalysisService...")
+    await start_analysis_service()
     return _analysis_service_instance
 
 
+async def shutdown_analysis_service():
+    if _analysis_service_instance is None:
+        return
+    if _analysis_startup_task and not _analysis_startup_task.done():
+        _analysis_startup_task.cancel()
+    if _analysis_service_instance._leadership_task:
+        _analysis_service_instance._leadership_task.cancel()
+    if _analysis_service_instance.watcher:
+        await _analysis_service_instance.watcher.stop()
+    if _analysis_service_instance.sharded_runner:
+        _analysis_service_instance.sharded_runner.shutdown()
+
+
 def get_analysis_service() -> AnalysisService:
     if _analysis_service_instance is None:
         logger.critical("AnalysisService accessed before async initialization!")
         raise RuntimeError(
-            "AnalysisService not initialized. Ensure initialize_analysis_service() is awaited at application startup."
+            "AnalysisService not initialized. Ensure start_analysis_service() is called at application startup."
         )
     return _analysis_service_instance
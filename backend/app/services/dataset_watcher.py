@@ -0,0 +1,166 @@
+import asyncio
+import hashlib
+import io
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from ..storage.results_store import ROW_KEY_FIELD, row_key
+
+# Bytes at the start of a file hashed to tell an append from a replacement.
+HEAD_BYTES = 4096
+
+
+def _head_digest(path: Path, length: int) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read(min(length, HEAD_BYTES))).hexdigest()
+
+
+def file_state(path: Path, offset: int, rows: int) -> Dict[str, Any]:
+    """Ingestion checkpoint for ``path``: the first ``rows`` rows, ending at
+    ``offset`` bytes, are in the stats. The inode and head digest identify
+    the file that was read."""
+    stat = path.stat()
+    return {
+        "offset": offset,
+        "rows": rows,
+        "inode": stat.st_ino,
+        "head": _head_digest(path, offset),
+    }
+
+
+def is_replaced(path: Path, state: Dict[str, Any]) -> bool:
+    """True if ``path`` is no longer the file ``state`` was taken from (it
+    shrank, was swapped for another inode, or its first bytes changed)."""
+    stat = path.stat()
+    return (
+        stat.st_size < state["offset"]
+        or stat.st_ino != state["inode"]
+        or _head_digest(path, state["offset"]) != state["head"]
+    )
+
+
+def read_csv_rows(
+    path: Path, start: int = 0, end: Optional[int] = None, first_row: int = 0
+) -> Tuple[Optional[List[Dict[str, Any]]], int]:
+    """Parse the CSV rows stored in bytes ``[start, end)`` of ``path``.
+
+    Reads from ``start`` onwards reuse the header line, so appended bytes can
+    be parsed without rereading the file. ``first_row`` is the number of data
+    rows before ``start``; each record gets the row key of its position in
+    the file. Returns ``(records, end)``; records are None if the file has no
+    ``review_text`` column.
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        if end is None:
+            end = f.seek(0, os.SEEK_END)
+        start = max(start, len(header))
+        f.seek(start)
+        body = f.read(max(0, end - start))
+    if not header.strip():
+        return [], end
+    import pandas as pd  # Deferred: only needed once a dataset is read
+
+    df = pd.read_csv(io.BytesIO(header + body))
+    if "review_text" not in df.columns:
+        logger.error(f"Dataset error: 'review_text' column not found in {path}.")
+        return None, end
+    records = df.to_dict("records")
+    for row, record in enumerate(records, start=first_row):
+        record[ROW_KEY_FIELD] = row_key(str(path), row)
+    return records, end
+
+
+class DatasetWatcher:
+    """Poll the dataset file and an optional drop directory for changes.
+
+    Appended bytes (and new files in the drop directory) are parsed and sent
+    to ``AnalysisService.ingest_reviews``, which updates the stats
+    incrementally. A replaced dataset triggers a full re-analysis. A file is
+    only read once its size and mtime have not changed for
+    ``debounce_seconds``, so a writer in the middle of a batch is never
+    tailed halfway through.
+    """
+
+    def __init__(self, analysis_service, config):
+        self.service = analysis_service
+        self.config = config
+        self._seen: Dict[str, Tuple[int, float]] = {}
+        self._changed_at: Dict[str, float] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+            logger.info(
+                f"Dataset watcher started (poll every {self.config.poll_interval_seconds}s, "
+                f"debounce {self.config.debounce_seconds}s, drop directory: {self.config.drop_directory})."
+            )
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self):
+        while True:
+            try:
+                await self.poll_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Dataset watcher poll failed: {e}", exc_info=True)
+            await asyncio.sleep(self.config.poll_interval_seconds)
+
+    async def poll_once(self, now: Optional[float] = None):
+        """Check every watched file once and ingest those that have settled."""
+        now = time.monotonic() if now is None else now
+        for path in self.service.dataset_files():
+            key = str(path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_size, stat.st_mtime)
+            if self._seen.get(key) != signature:
+                self._seen[key] = signature
+                self._changed_at[key] = now
+                continue
+            changed_at = self._changed_at.get(key)
+            if changed_at is None or now - changed_at < self.config.debounce_seconds:
+                continue
+            if await self._handle_settled(path):
+                self._changed_at.pop(key, None)
+
+    async def _handle_settled(self, path: Path) -> bool:
+        """Ingest whatever changed in ``path``; False means retry later."""
+        state = self.service.dataset_offsets.get(str(path))
+        if state is not None and is_replaced(path, state):
+            logger.info(f"Dataset file {path} was replaced; running a full analysis.")
+            result = await self.service.run_full_analysis()
+            return "status" not in result
+
+        offset = state["offset"] if state else 0
+        size = path.stat().st_size
+        if size <= offset:
+            return True
+        rows = state.get("rows") if state else 0
+        if rows is None:
+            # Checkpoint written before row counts were kept: count once.
+            records, _ = await asyncio.to_thread(read_csv_rows, path, 0, offset)
+            rows = len(records or [])
+        records, end = await asyncio.to_thread(read_csv_rows, path, offset, size, rows)
+        if records is None:
+            return True
+        logger.info(f"Dataset watcher: {len(records)} new rows in {path}.")
+        return await self.service.ingest_reviews(
+            records, {str(path): (end, rows + len(records))}, {str(path): offset}
+        )
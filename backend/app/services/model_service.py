@@ -1,27 +1,491 @@
-from ..config import settings
+from ..config import ModelConfig, settings
+from ..core.cache_backends import get_cache
+from ..core.logging_config import HotPathLog
+from ..core.scheduler import BULK, INTERACTIVE, InferenceScheduler
+from ..core.tokens import (
+    TRUNCATION_STRATEGIES,
+    TokenUsage,
+    current_run_usage,
+    fit_to_budget,
+    get_tokenizer,
+    normalize_whitespace,
+)
 from ..models.base import SentimentModelInterface, LanguageModelInterface
+from ..prompts.prompt_engine import get_prompt_engine
+from ..storage.state_store import get_state_store
+import asyncio
+import hashlib
 import importlib
-from typing import Optional, Dict, Any
-from loguru import logger  
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
+from loguru import logger
+
+_log_predict = HotPathLog("DEBUG")
+
+MODEL_KINDS = ("sentiment", "language")
+# Shared state key holding models swapped in at runtime, so every worker
+# (and analysis pool process) serves the same versions.
+MODELS_STATE_KEY = "model_versions"
+MODEL_SYNC_POLL_SECONDS = 5.0
+WARMUP_TEXTS = (
+    "This product is great, I would buy it again.",
+    "Le produit est horrible, ne fonctionne pas.",
+    "¡Excelente servicio y entrega rápida!",
+    "Ziemlich gut, aber der Kundenservice war langsam.",
+)
+
+
+def warmup_batch(batch_size: int) -> List[str]:
+    """Synthetic reviews of varying language and length (1-4 sentences), so
+    warm-up exercises the input shapes real traffic will bring."""
+    return [
+        " ".join([WARMUP_TEXTS[i % len(WARMUP_TEXTS)]] * (1 + i % 4))
+        for i in range(batch_size)
+    ]
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+class ModelVersion:
+    """A loaded model plus the requests still pinned to it.
+
+    Requests take the active version when they start and finish on it, so a
+    swap never changes the model under an in-flight prediction. A retired
+    version is closed once its last request completes.
+    """
+
+    def __init__(self, kind: str, config: ModelConfig, model):
+        if config.truncation not in TRUNCATION_STRATEGIES:
+            raise ValueError(
+                f"Unknown truncation '{config.truncation}'. Use one of {TRUNCATION_STRATEGIES}."
+            )
+        self.kind = kind
+        self.config = config
+        self.model = model
+        self.tokenizer = get_tokenizer(config.tokenizer)
+        # Predictions are cached per version: a new version never serves
+        # predictions made by the previous one.
+        self.cache_namespace = ModelService._config_namespace(kind, config)
+        self.loaded_at = time.time()
+        self.load_seconds: Optional[float] = None
+        self.warmup_seconds: Optional[float] = None
+        self.in_flight = 0
+        self.retired = False
+
+    def acquire(self):
+        self.in_flight += 1
+
+    def release(self):
+        self.in_flight -= 1
+        self._close_if_idle()
+
+    def retire(self):
+        self.retired = True
+        self._close_if_idle()
+
+    def _close_if_idle(self):
+        if not self.retired or self.in_flight:
+            return
+        close = getattr(self.model, "aclose", None) or getattr(
+            self.model, "close", None
+        )
+        if callable(close):
+            try:
+                result = close()
+                if inspect.isawaitable(result):
+                    asyncio.ensure_future(result)
+            except Exception as e:
+                logger.warning(f"Closing retired {self.kind} model failed: {e}")
+        logger.info(f"Retired {self.kind} model version {self.cache_namespace}.")
+
+    def describe(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "namespace": self.cache_namespace,
+            "type": self.config.type,
+            "class": self.config.class_name,
+            "endpoint": self.config.endpoint,
+            "version": self.config.version,
+            "loaded_at": self.loaded_at,
+            "load_ms": _ms(self.load_seconds),
+            "warmup_ms": _ms(self.warmup_seconds),
+            "in_flight": self.in_flight,
+            "retired": self.retired,
+        }
 
 
 class ModelService:
     def __init__(self):
         logger.info("Initializing ModelService...")
-        self.sentiment_model: Optional[SentimentModelInterface] = self._load_model(
-            settings.models.sentiment, "sentiment"
+        self.state_store = get_state_store()
+        self._swap_locks: Dict[str, asyncio.Lock] = {}
+        self._models_state_version = 0
+        self._sync_task: Optional[asyncio.Task] = None
+        self.retiring: list = []
+        # Set once every model has loaded and finished warming up.
+        self.ready = False
+        self.warmup_error: Optional[str] = None
+        overrides = self._shared_overrides()
+        self.versions: Dict[str, Optional[ModelVersion]] = self._load_versions(
+            {
+                kind: overrides.get(kind) or getattr(settings.models, kind)
+                for kind in MODEL_KINDS
+            }
+        )
+
+        self.prediction_cache = get_cache("predictions")
+        # Since process start; per-run totals go into the analysis stats.
+        self.token_usage = TokenUsage()
+        scheduler_config = settings.models.scheduler
+        self.scheduler = InferenceScheduler(
+            scheduler_config.capacity,
+            weights={
+                INTERACTIVE: scheduler_config.interactive_weight,
+                BULK: scheduler_config.bulk_weight,
+            },
+            reserved={INTERACTIVE: scheduler_config.interactive_reserved},
+        )
+
+    def _load_versions(
+        self, configs: Dict[str, ModelConfig]
+    ) -> Dict[str, Optional[ModelVersion]]:
+        """Load all models at once, one thread each: loading is dominated by
+        file/network I/O and native code that releases the GIL."""
+        started = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=len(configs), thread_name_prefix="model-load"
+        ) as pool:
+            futures = {
+                kind: pool.submit(self._build_version, kind, config)
+                for kind, config in configs.items()
+            }
+            versions = {kind: future.result() for kind, future in futures.items()}
+        logger.info(
+            f"Loaded {sum(v is not None for v in versions.values())}/{len(versions)} "
+            f"models in {(time.perf_counter() - started) * 1000:.0f} ms."
         )
-        self.language_model: Optional[LanguageModelInterface] = self._load_model(
-            settings.models.language, "language"
+        return versions
+
+    def _build_version(self, kind: str, config: ModelConfig) -> Optional[ModelVersion]:
+        started = time.perf_counter()
+        model = self._load_model(config, kind)
+        if model is None:
+            logger.error(f"{kind.capitalize()} model FAILED to load.")
+            return None
+        try:
+            version = ModelVersion(kind, config, model)
+        except (ValueError, RuntimeError) as e:
+            logger.error(f"{kind.capitalize()} model FAILED to load: {e}")
+            return None
+        version.load_seconds = time.perf_counter() - started
+        logger.success(
+            f"{kind.capitalize()} model loaded in {_ms(version.load_seconds)} ms."
         )
-        if self.sentiment_model:
-            logger.success("Sentiment model loaded successfully.")
+        return version
+
+    @property
+    def sentiment_model(self) -> Optional[SentimentModelInterface]:
+        version = self.versions.get("sentiment")
+        return version.model if version else None
+
+    @property
+    def language_model(self) -> Optional[LanguageModelInterface]:
+        version = self.versions.get("language")
+        return version.model if version else None
+
+    @staticmethod
+    def _config_namespace(kind: str, config) -> str:
+        config_dump = config.model_dump()
+        config_dump.pop("api_key", None)
+        raw = json.dumps(config_dump, sort_keys=True).encode("utf-8")
+        return f"{kind}-{hashlib.sha1(raw).hexdigest()[:12]}"
+
+    @staticmethod
+    def _prediction_cache_key(
+        version: ModelVersion, text: str, prompt: Optional[str]
+    ) -> str:
+        raw = f"{prompt or ''}\x00{text}".encode("utf-8")
+        return f"{version.cache_namespace}:{hashlib.sha1(raw).hexdigest()}"
+
+    def active_configs(self) -> Dict[str, ModelConfig]:
+        """Config of the version serving each kind (settings.yaml if unloaded)."""
+        return {
+            kind: (
+                self.versions[kind].config
+                if self.versions.get(kind)
+                else getattr(settings.models, kind)
+            )
+            for kind in MODEL_KINDS
+        }
+
+    def describe(self) -> Dict[str, Any]:
+        self.retiring = [v for v in self.retiring if v.in_flight]
+        return {
+            "active": {
+                kind: version.describe() if version else None
+                for kind, version in self.versions.items()
+            },
+            "retiring": [v.describe() for v in self.retiring],
+        }
+
+    @staticmethod
+    async def _call_model(version: ModelVersion, text: str, prompt) -> Dict[str, Any]:
+        """Run one prediction. Local models run in a worker thread: a
+        synchronous predict on the event loop would stall every other
+        request, whatever its priority."""
+        if version.config.type == "api":
+            return await version.model.predict(text, prompt=prompt)
+        return await asyncio.to_thread(version.model.predict, text, prompt=prompt)
+
+    @staticmethod
+    def _prepare_input(
+        version: ModelVersion, text: str, prompt: Optional[str]
+    ) -> Tuple[str, Optional[str], int, int]:
+        """Normalize whitespace, fit the review into the model's token budget
+        and render its prompt template around it.
+
+        The budget covers the whole rendered prompt, so the review gets what
+        the template leaves. Returns ``(text, prompt, input tokens, review
+        tokens dropped)``.
+        """
+        config = version.config
+        tokenizer = version.tokenizer
+        text = normalize_whitespace(text)
+        if prompt is None and config.prompt:
+            prompts = get_prompt_engine()
+            overhead = tokenizer.count(
+                prompts.get_prompt(config.prompt, variables={"review_text": ""}) or ""
+            )
         else:
-            logger.error("Sentiment model FAILED to load.")
-        if self.language_model:
-            logger.success("Language model loaded successfully.")
+            prompts = None
+            overhead = tokenizer.count(prompt) if prompt else 0
+
+        tokens = tokenizer.count(text)
+        dropped = 0
+        if config.max_input_tokens:
+            budget = max(1, config.max_input_tokens - overhead)
+            if tokens > budget:
+                text = fit_to_budget(text, tokenizer, budget, config.truncation)
+                shortened = tokenizer.count(text)
+                dropped, tokens = tokens - shortened, shortened
+        if prompts is not None:
+            prompt = prompts.get_prompt(config.prompt, variables={"review_text": text})
+        return text, prompt, overhead + tokens, dropped
+
+    def _record_usage(self, kind: str, input_tokens: int, dropped: int):
+        self.token_usage.record(kind, input_tokens, dropped)
+        run_usage = current_run_usage()
+        if run_usage is not None:
+            run_usage.record(kind, input_tokens, dropped)
+
+    async def _predict(
+        self, kind: str, text: str, prompt: Optional[str], priority: str
+    ) -> Optional[Dict[str, Any]]:
+        version = self.versions.get(kind)
+        if version is None:
+            logger.warning(f"{kind.capitalize()} model not loaded, cannot predict.")
+            return {"error": f"{kind.capitalize()} model not loaded"}
+
+        text, prompt, input_tokens, dropped = self._prepare_input(version, text, prompt)
+        cache_key = self._prediction_cache_key(version, text, prompt)
+        cached = self.prediction_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        _log_predict("Predicting {} for text: '{:.30}...'", kind, text)
+        if not callable(getattr(version.model, "predict", None)):
+            message = (
+                f"{kind.capitalize()} model 'predict' method not found or not callable."
+            )
+            logger.error(message)
+            return {"error": message}
+
+        version.acquire()
+        try:
+            async with self.scheduler.slot(priority):
+                self._record_usage(kind, input_tokens, dropped)
+                result = await self._call_model(version, text, prompt)
+        except Exception as e:
+            logger.error(f"Error during {kind} prediction: {e}", exc_info=True)
+            return {"error": f"Prediction error: {str(e)}"}
+        finally:
+            version.release()
+        if result and "error" not in result:
+            self.prediction_cache.set(cache_key, result)
+        return result
+
+    async def get_sentiment(
+        self, text: str, prompt: Optional[str] = None, priority: str = INTERACTIVE
+    ) -> Optional[Dict[str, Any]]:
+        return await self._predict("sentiment", text, prompt, priority)
+
+    async def get_language(
+        self, text: str, prompt: Optional[str] = None, priority: str = INTERACTIVE
+    ) -> Optional[Dict[str, Any]]:
+        return await self._predict("language", text, prompt, priority)
+
+    async def _warm_up(self, version: ModelVersion, batches: int):
+        """Run ``batches`` synthetic batches through ``version``, bypassing
+        the cache and scheduler. Raises ValueError if a prediction fails."""
+        config = settings.models.warmup
+        texts = warmup_batch(config.batch_size)
+        started = time.perf_counter()
+        for _ in range(batches):
+            results = await asyncio.gather(
+                *(self._call_model(version, text, None) for text in texts)
+            )
+            for result in results:
+                if not result or "error" in result:
+                    raise ValueError(f"Warm-up prediction failed: {result}")
+        version.warmup_seconds = time.perf_counter() - started
+        logger.info(
+            f"Warmed up {version.kind} model {version.cache_namespace} with "
+            f"{batches}x{len(texts)} reviews in {_ms(version.warmup_seconds)} ms."
+        )
+
+    async def warm_up(self):
+        """Warm up every loaded model concurrently, then mark the service
+        ready. Readiness stays false if a model failed to load or warm up."""
+        batches = settings.models.warmup.batches
+        loaded = [v for v in self.versions.values() if v is not None]
+        results = await asyncio.gather(
+            *(self._warm_up(v, batches) for v in loaded), return_exceptions=True
+        )
+        errors = [
+            f"{v.kind}: {r}"
+            for v, r in zip(loaded, results)
+            if isinstance(r, Exception)
+        ]
+        missing = [kind for kind, v in self.versions.items() if v is None]
+        if missing:
+            errors.append(f"not loaded: {', '.join(missing)}")
+        self.warmup_error = "; ".join(errors) or None
+        self.ready = not errors
+        if self.ready:
+            logger.success("All models loaded and warmed up; ready.")
         else:
-            logger.error("Language model FAILED to load.")
+            logger.error(f"Models not ready: {self.warmup_error}")
+
+    def readiness(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "error": self.warmup_error,
+            "models": {
+                kind: version.describe() if version else None
+                for kind, version in self.versions.items()
+            },
+        }
+
+    async def swap_model(
+        self, kind: str, config: ModelConfig, publish: bool = True
+    ) -> Dict[str, Any]:
+        """Load and warm up ``config`` in the background, then route new
+        requests for ``kind`` to it. Requests already running finish on the
+        previous version. Raises ValueError if the new model cannot serve.
+        """
+        if kind not in MODEL_KINDS:
+            raise ValueError(f"Unknown model kind '{kind}'. Use one of {MODEL_KINDS}.")
+        lock = self._swap_locks.setdefault(kind, asyncio.Lock())
+        async with lock:
+            started = time.perf_counter()
+            version = await asyncio.to_thread(self._build_version, kind, config)
+            if version is None:
+                raise ValueError(
+                    f"Could not load the {kind} model; see the server log."
+                )
+            # At least one batch, so a broken version is never switched to.
+            await self._warm_up(version, max(1, settings.models.warmup.batches))
+
+            previous = self.versions.get(kind)
+            self.versions[kind] = version
+            if previous is not None:
+                previous.retire()
+                if previous.in_flight:
+                    self.retiring.append(previous)
+            if publish:
+                self._publish_override(kind, config)
+            logger.success(
+                f"Swapped {kind} model to {version.cache_namespace} "
+                f"({config.class_name}) in {(time.perf_counter() - started) * 1000:.0f} ms; "
+                f"{previous.in_flight if previous else 0} requests finishing on the previous version."
+            )
+            return version.describe()
+
+    def _publish_override(self, kind: str, config: ModelConfig):
+        state = self.state_store.get(MODELS_STATE_KEY)
+        overrides = dict(state["value"]) if state else {}
+        overrides[kind] = {
+            # The override only applies while settings.yaml still has this config.
+            "base": self._config_namespace(kind, getattr(settings.models, kind)),
+            "config": config.model_dump(by_alias=True, exclude={"api_key"}),
+        }
+        # API keys stay out of the state store, including entries written
+        # before they were excluded.
+        for entry in overrides.values():
+            entry["config"].pop("api_key", None)
+        self._models_state_version = self.state_store.put(MODELS_STATE_KEY, overrides)
+
+    def _shared_overrides(self) -> Dict[str, ModelConfig]:
+        """Models swapped in by any worker since settings.yaml last changed."""
+        try:
+            state = self.state_store.get(MODELS_STATE_KEY)
+        except Exception as e:
+            logger.error(f"Could not read shared model versions: {e}")
+            return {}
+        if not state:
+            return {}
+        self._models_state_version = state["version"]
+        overrides = {}
+        for kind, entry in state["value"].items():
+            base = self._config_namespace(kind, getattr(settings.models, kind))
+            if kind in MODEL_KINDS and entry.get("base") == base:
+                config = ModelConfig(**entry["config"])
+                if config.api_key is None:
+                    # Keys are not shared; use the one configured for this kind.
+                    config.api_key = getattr(settings.models, kind).api_key
+                overrides[kind] = config
+        return overrides
+
+    async def sync_with_shared_state(self):
+        """Swap in any model version another worker has published."""
+        try:
+            if self.state_store.version(MODELS_STATE_KEY) == self._models_state_version:
+                return
+        except Exception as e:
+            logger.error(f"Could not read shared model versions: {e}")
+            return
+        for kind, config in self._shared_overrides().items():
+            current = self.versions.get(kind)
+            namespace = self._config_namespace(kind, config)
+            if current is None or current.cache_namespace != namespace:
+                logger.info(f"Picking up {kind} model {namespace} from another worker.")
+                try:
+                    await self.swap_model(kind, config, publish=False)
+                except ValueError as e:
+                    logger.error(f"Could not swap in shared {kind} model: {e}")
+
+    def start_sync(self):
+        if self._sync_task is None:
+            self._sync_task = asyncio.create_task(self._sync_loop())
+
+    async def stop_sync(self):
+        if self._sync_task is not None:
+            self._sync_task.cancel()
+            try:
+                await self._sync_task
+            except asyncio.CancelledError:
+                pass
+            self._sync_task = None
+
+    async def _sync_loop(self):
+        while True:
+            await asyncio.sleep(MODEL_SYNC_POLL_SECONDS)
+            await self.sync_with_shared_state()
 
     def _load_model(self, config, model_name_for_log: str):
         logger.debug(
@@ -53,10 +517,11 @@ class ModelService:
                     return None
                 model_params["endpoint"] = config.endpoint
                 if config.api_key:
-                    model_params["api_key"] = config.api_key
+                    model_params["api_key"] = config.api_key.get_secret_value()
 
+            logged_params = {k: v for k, v in model_params.items() if k != "api_key"}
             logger.info(
-                f"Initializing {model_name_for_log} model ({class_name}) with params: {model_params}"
+                f"Initializing {model_name_for_log} model ({class_name}) with params: {logged_params}"
             )
             return ModelClass(**model_params)
         except ImportError:
@@ -76,55 +541,14 @@ class ModelService:
             )
         return None
 
-    async def get_sentiment(
-        self, text: str, prompt: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        if not self.sentiment_model:
-            logger.warning("Sentiment model not loaded, cannot predict sentiment.")
-            return {"error": "Sentiment model not loaded"}
-
-        logger.debug(f"Predicting sentiment for text: '{text[:30]}...'")
-        prediction_method = getattr(self.sentiment_model, "predict", None)
-        if not callable(prediction_method):
-            logger.error("Sentiment model 'predict' method not found or not callable.")
-            return {
-                "error": "Sentiment model 'predict' method not found or not callable."
-            }
-
-        try:
-            if (
-                settings.models.sentiment.type == "api"
-            ):  # Check if it's an API model for potential async call
-                return await prediction_method(text, prompt=prompt)  # type: ignore
-            else:
-                return prediction_method(text, prompt=prompt)  # type: ignore
-        except Exception as e:
-            logger.error(f"Error during sentiment prediction: {e}", exc_info=True)
-            return {"error": f"Prediction error: {str(e)}"}
 
-    async def get_language(
-        self, text: str, prompt: Optional[str] = None
-    ) -> Optional[Dict[str, Any]]:
-        if not self.language_model:
-            logger.warning("Language model not loaded, cannot detect language.")
-            return {"error": "Language model not loaded"}
-
-        logger.debug(f"Detecting language for text: '{text[:30]}...'")
-        prediction_method = getattr(self.language_model, "predict", None)
-        if not callable(prediction_method):
-            logger.error("Language model 'predict' method not found or not callable.")
-            return {
-                "error": "Language model 'predict' method not found or not callable."
-            }
-
-        try:
-            if settings.models.language.type == "api":  # Check if it's an API model
-                return await prediction_method(text, prompt=prompt)  # type: ignore
-            else:
-                return prediction_method(text, prompt=prompt)  # type: ignore
-        except Exception as e:
-            logger.error(f"Error during language detection: {e}", exc_info=True)
-            return {"error": f"Prediction error: {str(e)}"}
+_model_service_instance: Optional[ModelService] = None
 
 
-model_service = ModelService()
+def get_model_service() -> ModelService:
+    """Process-wide ModelService; models load on first use (or in the
+    application startup hook), not when this module is imported."""
+    global _model_service_instance
+    if _model_service_instance is None:
+        _model_service_instance = ModelService()
+    return _model_service_instance
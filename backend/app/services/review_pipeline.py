@@ -0,0 +1,177 @@
+import asyncio
+import random
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+
+from .model_service import get_model_service
+from ..config import DedupConfig, settings
+from ..core.dedup import DedupResult, deduplicate
+from ..core.logging_config import HotPathLog
+from ..core.scheduler import BULK
+from ..core.tokens import track_token_usage
+from ..core.rollups import dimension_values
+from ..core.trends import trend_buckets
+from ..core.sketches import StatsSketch
+from ..storage.results_store import ROW_KEY_FIELD
+
+_log_review_start = HotPathLog("TRACE")
+_log_review_done = HotPathLog("TRACE")
+
+
+async def process_single_review(review_data: Dict, text: str) -> Optional[Dict]:
+    review_id = review_data.get("review_id", "N/A")
+    _log_review_start("Processing review ID: {}, Text: '{:.30}...'", review_id, text)
+    try:
+        model_service = get_model_service()
+        lang_result = await model_service.get_language(text, priority=BULK)
+        sentiment_result = await model_service.get_sentiment(text, priority=BULK)
+
+        lang = lang_result.get("language", "unknown") if lang_result else "unknown"
+        stars = sentiment_result.get("stars", 0) if sentiment_result else 0
+
+        processed_review = {
+            "review_id": review_id,
+            "product_id": review_data.get("product_id"),
+            "text_preview": text[:50] + "...",
+            "detected_language": lang,
+            "language_confidence": (lang_result or {}).get("confidence"),
+            "predicted_sentiment_stars": stars,
+            "sentiment_confidence": (sentiment_result or {}).get("confidence"),
+        }
+        _log_review_done(
+            "Review ID {} processed. Lang: {}, Stars: {}", review_id, lang, stars
+        )
+        return {"processed_review": processed_review, "lang": lang, "stars": stars}
+    except Exception as e:
+        logger.error(
+            f"Exception while processing single review ID {review_id}: {e}",
+            exc_info=True,
+        )
+        # This exception will be caught by asyncio.gather if return_exceptions=True
+        raise
+
+
+# A duplicate cluster: (row index, review) pairs, representative first.
+ReviewGroup = List[Tuple[int, Dict[str, Any]]]
+
+
+def group_reviews(
+    reviews: List[Dict[str, Any]], dedup_config: Optional[DedupConfig] = None
+) -> Tuple[List[ReviewGroup], DedupResult]:
+    """Drop rows without text and group the rest into duplicate clusters."""
+    records = []
+    for row, review_data in enumerate(reviews):
+        text = review_data.get("review_text", "")
+        if isinstance(text, str) and text.strip():
+            records.append((row, review_data))
+        else:
+            logger.warning(
+                f"Skipping review with empty text. ID: {review_data.get('review_id', 'N/A')}"
+            )
+
+    dedup = deduplicate([r["review_text"] for _, r in records], dedup_config)
+    groups = [[records[i] for i in group] for group in dedup.groups]
+    if dedup_config is not None and dedup_config.enabled:
+        logger.info(
+            f"Dedup: {len(records)} rows -> {len(groups)} unique texts "
+            f"({dedup.exact_duplicates} exact, {dedup.near_duplicates} near duplicates)."
+        )
+    return groups, dedup
+
+
+def progressive_order(
+    groups: List[ReviewGroup], sample_size: int, seed: Optional[int] = None
+) -> Tuple[List[ReviewGroup], int]:
+    """Reorder ``groups`` so a product-stratified random sample comes first,
+    followed by the remaining groups in random order.
+
+    The sample uses proportional allocation, so any prefix of the result is a
+    (near) self-weighting random sample. Returns the groups and sample length.
+    """
+    rng = random.Random(seed)
+    strata: Dict[str, List[ReviewGroup]] = defaultdict(list)
+    for group in groups:
+        strata[str(group[0][1].get("product_id"))].append(group)
+
+    total = len(groups)
+    # Every product gets at least one row if the sample is big enough for that.
+    min_take = 1 if len(strata) <= sample_size else 0
+    sample, rest = [], []
+    for members in strata.values():
+        rng.shuffle(members)
+        take = max(min_take, round(sample_size * len(members) / total))
+        sample.extend(members[:take])
+        rest.extend(members[take:])
+    rng.shuffle(sample)
+    rng.shuffle(rest)
+    return sample + rest, len(sample)
+
+
+def _fan_out(processed_review: Dict[str, Any], row_data: Dict[str, Any]) -> Dict:
+    text = row_data.get("review_text", "")
+    return {
+        **processed_review,
+        "review_id": row_data.get("review_id", "N/A"),
+        "product_id": row_data.get("product_id"),
+        "text_preview": text[:50] + "...",
+        ROW_KEY_FIELD: row_data.get(ROW_KEY_FIELD),
+    }
+
+
+async def analyze_groups(
+    groups: List[ReviewGroup],
+) -> Tuple[StatsSketch, List[Tuple[int, Dict[str, Any]]]]:
+    """Score each group's representative once and apply the result to every
+    row in the group.
+
+    Returns the sketch and ``(row index, per-review result)`` pairs.
+    """
+    sketch = StatsSketch()
+    processed_reviews_data = []
+
+    tasks = [
+        process_single_review(group[0][1], group[0][1]["review_text"])
+        for group in groups
+    ]
+    timestamp_column = settings.backend.trends.timestamp_column
+    logger.info(f"Processing {len(tasks)} unique reviews concurrently...")
+    with track_token_usage() as usage:
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    sketch.add_scored(len(tasks))
+    sketch.add_token_usage(usage.to_dict())
+    logger.info(f"Token usage for {len(tasks)} reviews: {usage}")
+
+    for i, (group, result) in enumerate(zip(groups, results)):
+        if isinstance(result, Exception):
+            logger.error(
+                f"Error processing review (index {i}): {result}", exc_info=result
+            )
+            sketch.add_failure(len(group))
+            continue
+        if result:
+            for row, row_data in group:
+                processed_reviews_data.append(
+                    (row, _fan_out(result["processed_review"], row_data))
+                )
+                sketch.add(
+                    result["lang"],
+                    result["stars"],
+                    dimension_values(row_data, settings.backend.rollups.dimensions),
+                    language_confidence=result["processed_review"].get(
+                        "language_confidence"
+                    ),
+                    sentiment_confidence=result["processed_review"].get(
+                        "sentiment_confidence"
+                    ),
+                    trend_buckets=(
+                        trend_buckets(row_data.get(timestamp_column))
+                        if timestamp_column
+                        else None
+                    ),
+                )
+
+    logger.info(
+        f"Successfully processed {sketch.processed} reviews from {len(tasks)} model calls."
+    )
+    return sketch, processed_reviews_data
@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from loguru import logger
+
+from ..core.sketches import StatsSketch
+
+
+def split_row_ranges(num_rows: int, num_shards: int) -> List[Tuple[int, int]]:
+    """Split ``[0, num_rows)`` into at most ``num_shards`` contiguous ranges."""
+    num_shards = max(1, min(num_shards, num_rows))
+    base, extra = divmod(num_rows, num_shards)
+    ranges, start = [], 0
+    for i in range(num_shards):
+        end = start + base + (1 if i < extra else 0)
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _analyze_shard(
+    shard_index: int, groups: List[list]
+) -> Tuple[int, StatsSketch, List[Tuple[int, Dict[str, Any]]], float]:
+    # Runs in a pool process; the import loads the models once per process.
+    from .model_service import get_model_service
+    from .review_pipeline import analyze_groups
+
+    async def run():
+        # Serve the model versions swapped in since this process started.
+        await get_model_service().sync_with_shared_state()
+        return await analyze_groups(groups)
+
+    started = time.perf_counter()
+    sketch, processed = asyncio.run(run())
+    return shard_index, sketch, processed, time.perf_counter() - started
+
+
+class ShardedAnalysisRunner:
+    """Analyze row ranges of the dataset in a process pool and reduce the
+    partial StatsSketches with ``merge``.
+
+    The pool uses the spawn start method (forking a process that runs an
+    event loop and logging threads is unsafe) and lives as long as the
+    runner, so models load once per worker process rather than once per run.
+    """
+
+    def __init__(self, num_workers: int, shards_per_worker: int = 4):
+        self.num_workers = max(1, num_workers)
+        self.shards_per_worker = max(1, shards_per_worker)
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logger.info(
+                f"Started analysis process pool with {self.num_workers} workers (parent pid {os.getpid()})."
+            )
+        return self._pool
+
+    async def run(
+        self, groups: List[list]
+    ) -> Tuple[StatsSketch, List[Tuple[int, Dict[str, Any]]]]:
+        """Analyze review groups (see ``review_pipeline.group_reviews``)."""
+        ranges = split_row_ranges(
+            len(groups), self.num_workers * self.shards_per_worker
+        )
+        logger.info(
+            f"Sharded analysis: {len(groups)} unique reviews in {len(ranges)} shards across {self.num_workers} processes."
+        )
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        futures = [
+            loop.run_in_executor(pool, _analyze_shard, i, groups[start:end])
+            for i, (start, end) in enumerate(ranges)
+        ]
+        shard_results = sorted(await asyncio.gather(*futures), key=lambda r: r[0])
+
+        sketch = StatsSketch.merge_all(r[1] for r in shard_results)
+        processed = [review for r in shard_results for review in r[2]]
+        for shard_index, shard_sketch, _, seconds in shard_results:
+            logger.debug(
+                f"Shard {shard_index}: {shard_sketch.processed} reviews in {seconds:.2f}s"
+            )
+        return sketch, processed
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
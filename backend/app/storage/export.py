@@ -0,0 +1,134 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+from loguru import logger
+
+from .results_store import RESULT_COLUMNS
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:
+    pyarrow = None
+    pyarrow_parquet = None
+
+# Export format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+Batches = Iterable[List[Dict[str, Any]]]
+
+
+def _csv_chunks(batches: Batches) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=RESULT_COLUMNS, lineterminator="\n")
+    writer.writeheader()
+    # The header goes out before the first query so clients see bytes at once.
+    yield buffer.getvalue().encode("utf-8")
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _ndjson_chunks(batches: Batches) -> Iterator[bytes]:
+    for batch in batches:
+        yield "".join(
+            json.dumps(row, ensure_ascii=False, separators=(",", ":")) + "\n"
+            for row in batch
+        ).encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands out whatever was written since the last
+    ``drain``; lets the Parquet writer stream instead of building a file."""
+
+    def __init__(self):
+        super().__init__()
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema():
+    return pyarrow.schema(
+        [
+            ("review_id", pyarrow.string()),
+            ("product_id", pyarrow.string()),
+            ("text_preview", pyarrow.string()),
+            ("detected_language", pyarrow.string()),
+            ("language_confidence", pyarrow.float64()),
+            ("predicted_sentiment_stars", pyarrow.int32()),
+            ("sentiment_confidence", pyarrow.float64()),
+        ]
+    )
+
+
+def _parquet_chunks(batches: Batches) -> Iterator[bytes]:
+    schema = _parquet_schema()
+    sink = _ChunkSink()
+    writer = pyarrow_parquet.ParquetWriter(
+        pyarrow.PythonFile(sink, mode="w"), schema, compression="zstd"
+    )
+    try:
+        # One row group per batch; the footer is written on close.
+        for batch in batches:
+            writer.write_table(pyarrow.Table.from_pylist(batch, schema=schema))
+            yield sink.drain()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+_ENCODERS = {"csv": _csv_chunks, "ndjson": _ndjson_chunks, "parquet": _parquet_chunks}
+
+
+def check_export_format(fmt: str):
+    """Raise ValueError if ``fmt`` cannot be exported."""
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(
+            f"Unsupported export format '{fmt}'. Use one of: {sorted(EXPORT_FORMATS)}"
+        )
+    if fmt == "parquet" and pyarrow is None:
+        raise ValueError("Parquet export needs the 'pyarrow' package.")
+
+
+def export_results(fmt: str, batches: Batches) -> Iterator[bytes]:
+    """Encode result ``batches`` as ``fmt``, one output chunk per batch.
+
+    Empty chunks are skipped so each yielded value is worth a transfer chunk.
+    """
+    check_export_format(fmt)
+    rows = 0
+
+    def counted(batches: Batches) -> Iterator[List[Dict[str, Any]]]:
+        nonlocal rows
+        for batch in batches:
+            rows += len(batch)
+            yield batch
+
+    for chunk in _ENCODERS[fmt](counted(batches)):
+        if chunk:
+            yield chunk
+    logger.info(f"Exported {rows} per-review results as {fmt}.")
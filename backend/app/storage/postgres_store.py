@@ -0,0 +1,130 @@
+from typing import Iterable, Tuple
+
+from loguru import logger
+
+from .results_store import (
+    INDEXED_COLUMNS,
+    SQLResultsStore,
+    WRITE_COLUMNS,
+    chunked,
+    upsert_sql,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_results (
+    id BIGINT GENERATED BY DEFAULT AS IDENTITY PRIMARY KEY,
+    row_key TEXT NOT NULL,
+    review_id TEXT NOT NULL,
+    product_id TEXT NOT NULL DEFAULT '',
+    text_preview TEXT NOT NULL DEFAULT '',
+    detected_language TEXT NOT NULL DEFAULT 'unknown',
+    language_confidence DOUBLE PRECISION NOT NULL DEFAULT 0,
+    predicted_sentiment_stars INTEGER NOT NULL DEFAULT 0,
+    sentiment_confidence DOUBLE PRECISION NOT NULL DEFAULT 0
+)
+"""
+
+# Tables created when results were keyed by a unique review_id keep it as
+# the row key of their rows.
+_MIGRATIONS = (
+    "ALTER TABLE review_results ADD COLUMN IF NOT EXISTS row_key TEXT",
+    "UPDATE review_results SET row_key = 'review_id:' || review_id WHERE row_key IS NULL",
+    "ALTER TABLE review_results ALTER COLUMN row_key SET NOT NULL",
+    "ALTER TABLE review_results DROP CONSTRAINT IF EXISTS review_results_review_id_key",
+)
+
+_STAGING_TABLE = "review_results_staging"
+_STAGING_SCHEMA = f"""
+CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} (
+    seq BIGINT,
+    row_key TEXT,
+    review_id TEXT,
+    product_id TEXT,
+    text_preview TEXT,
+    detected_language TEXT,
+    language_confidence DOUBLE PRECISION,
+    predicted_sentiment_stars INTEGER,
+    sentiment_confidence DOUBLE PRECISION
+) ON COMMIT DELETE ROWS
+"""
+
+
+class PostgresResultsStore(SQLResultsStore):
+    """Postgres results store; works against Supabase through the project's
+    database connection string.
+
+    Each chunk is streamed into a temporary staging table with ``COPY`` and
+    merged with one ``INSERT ... SELECT ... ON CONFLICT`` statement, which is
+    far cheaper than a round trip per row. Requires ``psycopg[pool]`` (v3).
+    """
+
+    param = "%s"
+
+    def __init__(self, dsn: str, batch_size: int = 5000, pool_size: int = 4):
+        super().__init__(batch_size)
+        try:
+            from psycopg.rows import dict_row
+            from psycopg_pool import ConnectionPool
+        except ImportError as e:
+            raise RuntimeError(
+                "The postgres results store needs the 'psycopg[binary,pool]' package."
+            ) from e
+        self.pool = ConnectionPool(
+            dsn,
+            min_size=1,
+            max_size=pool_size,
+            kwargs={"row_factory": dict_row},
+            open=True,
+        )
+        self._init_schema()
+
+    def __str__(self) -> str:
+        return "postgres:review_results"
+
+    def _connect(self):
+        # Commits on exit (rolls back on error) and returns the connection.
+        return self.pool.connection()
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.execute(_SCHEMA)
+            for statement in _MIGRATIONS:
+                conn.execute(statement)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_review_results_row_key "
+                "ON review_results (row_key)"
+            )
+            for column in INDEXED_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_review_results_{column} "
+                    f"ON review_results ({column})"
+                )
+        logger.debug("PostgresResultsStore schema ready.")
+
+    def _write(self, rows: Iterable[Tuple], replace: bool) -> int:
+        columns = ", ".join(WRITE_COLUMNS)
+        # A single INSERT may not touch the same key twice, so keep the last
+        # row per row_key, then insert in input order so ids follow it.
+        merge = upsert_sql(
+            "review_results",
+            f"SELECT {columns} FROM ("
+            f"SELECT DISTINCT ON (row_key) seq, {columns} FROM {_STAGING_TABLE} "
+            f"ORDER BY row_key, seq DESC) latest ORDER BY seq",
+        )
+        count = 0
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(_STAGING_SCHEMA)
+            if replace:
+                # DELETE rather than TRUNCATE: readers keep seeing the old
+                # results (MVCC) until this transaction commits.
+                cur.execute("DELETE FROM review_results")
+            for chunk in chunked(rows, self.batch_size):
+                with cur.copy(
+                    f"COPY {_STAGING_TABLE} (seq, {columns}) FROM STDIN"
+                ) as copy:
+                    for seq, row in enumerate(chunk, start=count):
+                        copy.write_row((seq, *row))
+                cur.execute(merge)
+                cur.execute(f"DELETE FROM {_STAGING_TABLE}")
+                count += len(chunk)
+        return count
@@ -0,0 +1,418 @@
+import base64
+import itertools
+import json
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..config import settings
+
+# Columns that may be used for sorting, mapped to their SQL expression.
+SORTABLE_COLUMNS = {
+    "row": "id",
+    "review_id": "review_id",
+    "product_id": "product_id",
+    "language": "detected_language",
+    "stars": "predicted_sentiment_stars",
+    "sentiment_confidence": "sentiment_confidence",
+    "language_confidence": "language_confidence",
+}
+
+RESULT_COLUMNS = (
+    "review_id",
+    "product_id",
+    "text_preview",
+    "detected_language",
+    "language_confidence",
+    "predicted_sentiment_stars",
+    "sentiment_confidence",
+)
+
+# Unique key of a stored result: the review's source file and data row (see
+# ``row_key``), so rows without a review_id or with one repeated across
+# files are all kept.
+ROW_KEY_FIELD = "row_key"
+WRITE_COLUMNS = (ROW_KEY_FIELD, *RESULT_COLUMNS)
+
+MAX_PAGE_SIZE = 500
+
+# Filterable/sortable columns indexed by every backend.
+INDEXED_COLUMNS = (
+    "review_id",
+    "detected_language",
+    "predicted_sentiment_stars",
+    "product_id",
+    "sentiment_confidence",
+)
+
+# Bump when the SQLite schema changes; see ``ReviewResultsStore._migrate``.
+SQLITE_SCHEMA_VERSION = 2
+
+
+def row_key(source: str, row: int) -> str:
+    """Key of data row ``row`` (0-based, header excluded) of file ``source``."""
+    return f"{source}#{row}"
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    raw = json.dumps([sort_value, row_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, int]:
+    try:
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, int(row_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {e}") from e
+
+
+def chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def upsert_sql(target: str, source: str) -> str:
+    """``INSERT ... ON CONFLICT (row_key) DO UPDATE`` from ``source``
+    (a ``VALUES`` clause or a ``SELECT``); valid in SQLite and Postgres."""
+    updates = ", ".join(f"{col} = excluded.{col}" for col in RESULT_COLUMNS)
+    return (
+        f"INSERT INTO {target} ({', '.join(WRITE_COLUMNS)}) {source} "
+        f"ON CONFLICT ({ROW_KEY_FIELD}) DO UPDATE SET {updates}"
+    )
+
+
+class SQLResultsStore(ABC):
+    """Per-review analysis results in a relational table keyed by row.
+
+    Writes are batched upserts of ``batch_size`` rows, so re-ingesting a
+    row updates it in place. Queries use keyset (cursor) pagination over
+    ``(sort_column, id)`` so the cost of fetching a page does not grow with
+    its position in the result set. Subclasses provide connections, the
+    schema and the bulk write path.
+    """
+
+    # DB-API parameter marker of the driver.
+    param = "?"
+
+    def __init__(self, batch_size: int = 5000):
+        self.batch_size = max(1, batch_size)
+
+    @abstractmethod
+    def _connect(self):
+        pass
+
+    @abstractmethod
+    def _write(self, rows: Iterable[Tuple], replace: bool) -> int:
+        pass
+
+    @staticmethod
+    def _to_row(review: Dict[str, Any], position: int) -> Tuple:
+        review_id = review.get("review_id")
+        if review_id != review_id:  # NaN from an empty CSV cell
+            review_id = None
+        # Results from the analysis pipeline carry a row key. Otherwise fall
+        # back to the review_id, or to the position in this write.
+        key = review.get(ROW_KEY_FIELD) or (
+            f"review_id:{review_id}" if review_id is not None else f"#{position}"
+        )
+        return (
+            str(key),
+            str(review_id if review_id is not None else "N/A"),
+            str(review.get("product_id") or ""),
+            str(review.get("text_preview") or ""),
+            str(review.get("detected_language") or "unknown"),
+            float(review.get("language_confidence") or 0.0),
+            int(review.get("predicted_sentiment_stars") or 0),
+            float(review.get("sentiment_confidence") or 0.0),
+        )
+
+    def replace_all(self, reviews: Iterable[Dict[str, Any]]) -> int:
+        """Atomically replace the stored results with ``reviews``."""
+        count = self._write(
+            (self._to_row(r, i) for i, r in enumerate(reviews)), replace=True
+        )
+        logger.info(f"Stored {count} per-review results in {self}")
+        return count
+
+    def upsert(self, reviews: Iterable[Dict[str, Any]]) -> int:
+        """Insert ``reviews``, updating any already stored under the same
+        row key. New reviews sort after the stored ones."""
+        count = self._write(
+            (self._to_row(r, i) for i, r in enumerate(reviews)), replace=False
+        )
+        logger.info(f"Upserted {count} per-review results in {self}")
+        return count
+
+    def _build_filters(
+        self,
+        languages: Optional[Sequence[str]],
+        stars: Optional[Sequence[int]],
+        min_confidence: Optional[float],
+        max_confidence: Optional[float],
+        product_id: Optional[str],
+    ) -> Tuple[List[str], List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if languages:
+            clauses.append(
+                f"detected_language IN ({', '.join(self.param for _ in languages)})"
+            )
+            params.extend(languages)
+        if stars:
+            clauses.append(
+                f"predicted_sentiment_stars IN ({', '.join(self.param for _ in stars)})"
+            )
+            params.extend(int(s) for s in stars)
+        if min_confidence is not None:
+            clauses.append(f"sentiment_confidence >= {self.param}")
+            params.append(min_confidence)
+        if max_confidence is not None:
+            clauses.append(f"sentiment_confidence <= {self.param}")
+            params.append(max_confidence)
+        if product_id:
+            clauses.append(f"product_id = {self.param}")
+            params.append(product_id)
+        return clauses, params
+
+    def query(
+        self,
+        languages: Optional[Sequence[str]] = None,
+        stars: Optional[Sequence[int]] = None,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        product_id: Optional[str] = None,
+        sort_by: str = "row",
+        sort_dir: str = "asc",
+        cursor: Optional[str] = None,
+        limit: int = 50,
+        include_total: bool = False,
+    ) -> Dict[str, Any]:
+        if sort_by not in SORTABLE_COLUMNS:
+            raise ValueError(
+                f"Unsupported sort column '{sort_by}'. Use one of: {sorted(SORTABLE_COLUMNS)}"
+            )
+        if sort_dir not in ("asc", "desc"):
+            raise ValueError("sort_dir must be 'asc' or 'desc'.")
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        sort_column = SORTABLE_COLUMNS[sort_by]
+
+        p = self.param
+        clauses, params = self._build_filters(
+            languages, stars, min_confidence, max_confidence, product_id
+        )
+        filter_clauses, filter_params = list(clauses), list(params)
+
+        if cursor:
+            last_value, last_id = decode_cursor(cursor)
+            op = ">" if sort_dir == "asc" else "<"
+            if sort_column == "id":
+                clauses.append(f"id {op} {p}")
+                params.append(last_id)
+            else:
+                clauses.append(
+                    f"({sort_column} {op} {p} OR ({sort_column} = {p} AND id {op} {p}))"
+                )
+                params.extend([last_value, last_value, last_id])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = f"{sort_column} {sort_dir.upper()}"
+        if sort_column != "id":
+            order += f", id {sort_dir.upper()}"
+
+        sql = (
+            f"SELECT id, {', '.join(RESULT_COLUMNS)} FROM review_results "
+            f"{where} ORDER BY {order} LIMIT {p}"
+        )
+        with self._connect() as conn:
+            # Fetch one extra row to know whether another page exists.
+            rows = conn.execute(sql, [*params, limit + 1]).fetchall()
+            total = None
+            if include_total:
+                count_where = (
+                    f"WHERE {' AND '.join(filter_clauses)}" if filter_clauses else ""
+                )
+                total = conn.execute(
+                    f"SELECT COUNT(*) AS n FROM review_results {count_where}",
+                    filter_params,
+                ).fetchone()["n"]
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = None
+        if has_more and rows:
+            last = rows[-1]
+            next_cursor = encode_cursor(last[sort_column], last["id"])
+
+        return {
+            "items": [{col: row[col] for col in RESULT_COLUMNS} for row in rows],
+            "next_cursor": next_cursor,
+            "total": total,
+        }
+
+    def count(self) -> int:
+        with self._connect() as conn:
+            row = conn.execute("SELECT COUNT(*) AS n FROM review_results").fetchone()
+        return row["n"]
+
+    def iter_batches(
+        self,
+        batch_size: int = 10000,
+        languages: Optional[Sequence[str]] = None,
+        stars: Optional[Sequence[int]] = None,
+        min_confidence: Optional[float] = None,
+        max_confidence: Optional[float] = None,
+        product_id: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """Yield matching results in row order, ``batch_size`` at a time.
+
+        Each batch is a separate keyset query (``id > last id``) on a fresh
+        connection, so memory stays constant and no read transaction is held
+        open between batches.
+        """
+        clauses, params = self._build_filters(
+            languages, stars, min_confidence, max_confidence, product_id
+        )
+        last_id = 0
+        while True:
+            where = " AND ".join([*clauses, f"id > {self.param}"])
+            sql = (
+                f"SELECT id, {', '.join(RESULT_COLUMNS)} FROM review_results "
+                f"WHERE {where} ORDER BY id LIMIT {self.param}"
+            )
+            with self._connect() as conn:
+                rows = conn.execute(sql, [*params, last_id, batch_size]).fetchall()
+            if not rows:
+                return
+            last_id = rows[-1]["id"]
+            yield [{col: row[col] for col in RESULT_COLUMNS} for row in rows]
+            if len(rows) < batch_size:
+                return
+
+
+class ReviewResultsStore(SQLResultsStore):
+    """SQLite results store (WAL mode; readers never block the writer)."""
+
+    def __init__(self, db_path: str, batch_size: int = 5000):
+        super().__init__(batch_size)
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._write_lock = threading.Lock()
+        self._init_schema()
+
+    def __str__(self) -> str:
+        return str(self.db_path)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        # Durable across application crashes in WAL mode; only an OS crash can
+        # lose the last commits, which the next analysis run rewrites anyway.
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _init_schema(self):
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS review_results (
+                    id INTEGER PRIMARY KEY,
+                    row_key TEXT NOT NULL,
+                    review_id TEXT NOT NULL,
+                    product_id TEXT NOT NULL DEFAULT '',
+                    text_preview TEXT NOT NULL DEFAULT '',
+                    detected_language TEXT NOT NULL DEFAULT 'unknown',
+                    language_confidence REAL NOT NULL DEFAULT 0,
+                    predicted_sentiment_stars INTEGER NOT NULL DEFAULT 0,
+                    sentiment_confidence REAL NOT NULL DEFAULT 0
+                )
+                """)
+            self._migrate(conn)
+            conn.execute(
+                "CREATE UNIQUE INDEX IF NOT EXISTS idx_review_results_row_key "
+                "ON review_results (row_key)"
+            )
+            for column in INDEXED_COLUMNS:
+                conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_review_results_{column} "
+                    f"ON review_results ({column})"
+                )
+            conn.execute(f"PRAGMA user_version={SQLITE_SCHEMA_VERSION}")
+        logger.debug(f"ReviewResultsStore ready at {self.db_path}")
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection):
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # Version 0 appended rows without a key; keep the latest result
+            # per review so the unique index can be built.
+            removed = conn.execute(
+                "DELETE FROM review_results WHERE id NOT IN "
+                "(SELECT MAX(id) FROM review_results GROUP BY review_id)"
+            ).rowcount
+            if removed:
+                logger.info(f"Dropped {removed} superseded per-review results.")
+        if version < 2:
+            # Version 1 was keyed by a unique review_id, which stays the key
+            # of its rows; review_id gets a plain index instead.
+            columns = {
+                row["name"] for row in conn.execute("PRAGMA table_info(review_results)")
+            }
+            if ROW_KEY_FIELD not in columns:
+                conn.execute(
+                    "ALTER TABLE review_results "
+                    "ADD COLUMN row_key TEXT NOT NULL DEFAULT ''"
+                )
+                conn.execute(
+                    "UPDATE review_results SET row_key = 'review_id:' || review_id"
+                )
+            conn.execute("DROP INDEX IF EXISTS idx_review_results_review_id")
+
+    def _write(self, rows: Iterable[Tuple], replace: bool) -> int:
+        sql = upsert_sql(
+            "review_results",
+            f"VALUES ({', '.join(self.param for _ in WRITE_COLUMNS)})",
+        )
+        count = 0
+        # One transaction: readers see the old results until the commit.
+        with self._write_lock, self._connect() as conn:
+            if replace:
+                conn.execute("DELETE FROM review_results")
+            for chunk in chunked(rows, self.batch_size):
+                conn.executemany(sql, chunk)
+                count += len(chunk)
+        return count
+
+
+_results_store_instance: Optional[SQLResultsStore] = None
+
+
+def get_results_store() -> SQLResultsStore:
+    global _results_store_instance
+    if _results_store_instance is None:
+        config = settings.backend.results_store
+        if config.backend == "postgres":
+            from .postgres_store import PostgresResultsStore
+
+            dsn = config.postgres_dsn or settings.supabase.db_url
+            if not dsn:
+                raise RuntimeError(
+                    "results_store.backend is 'postgres' but neither "
+                    "results_store.postgres_dsn nor supabase.db_url is set."
+                )
+            _results_store_instance = PostgresResultsStore(
+                dsn, batch_size=config.write_batch_size, pool_size=config.pool_size
+            )
+        else:
+            db_path = (
+                Path(settings.backend.cache_dir) / settings.backend.results_db_file
+            )
+            _results_store_instance = ReviewResultsStore(
+                str(db_path), batch_size=config.write_batch_size
+            )
+    return _results_store_instance
@@ -0,0 +1,79 @@
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from loguru import logger
+
+from ..config import settings
+
+
+class SharedStateStore:
+    """Small key/value table shared by all server workers through SQLite.
+
+    The leader worker publishes analysis stats here; every worker reads them
+    back, checking a cheap version counter before re-reading the payload.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS analysis_state (
+                    key TEXT PRIMARY KEY,
+                    version INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    value TEXT NOT NULL
+                )
+                """
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30.0)
+
+    def put(self, key: str, value: Any) -> int:
+        payload = json.dumps(value)
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM analysis_state WHERE key = ?", (key,)
+            ).fetchone()
+            version = (row[0] if row else 0) + 1
+            conn.execute(
+                "INSERT OR REPLACE INTO analysis_state (key, version, updated_at, value) "
+                "VALUES (?, ?, ?, ?)",
+                (key, version, time.time(), payload),
+            )
+        logger.debug(f"SharedStateStore: published '{key}' version {version}")
+        return version
+
+    def version(self, key: str) -> int:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version FROM analysis_state WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return ``{"version": int, "value": Any}`` or None if missing."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT version, value FROM analysis_state WHERE key = ?", (key,)
+            ).fetchone()
+        if not row:
+            return None
+        return {"version": row[0], "value": json.loads(row[1])}
+
+
+_state_store_instance: Optional[SharedStateStore] = None
+
+
+def get_state_store() -> SharedStateStore:
+    global _state_store_instance
+    if _state_store_instance is None:
+        db_path = Path(settings.backend.cache_dir) / settings.backend.results_db_file
+        _state_store_instance = SharedStateStore(str(db_path))
+    return _state_store_instance
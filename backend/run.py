@@ -1,3 +1,4 @@
+import argparse
 import uvicorn
 import sys
 from pathlib import Path
@@ -24,18 +25,49 @@ except Exception as e:
     )
 
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Start the review analysis backend.")
+    parser.add_argument(
+        "--mode",
+        choices=["dev", "prod"],
+        default=settings.backend.mode,
+        help="dev: one worker with auto-reload. prod: multiple workers, no reload.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.backend.workers,
+        help="Number of worker processes in prod mode.",
+    )
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     logger.info(
-        f"Starting Uvicorn server on {settings.backend.host}:{settings.backend.port}"
+        f"Starting Uvicorn server on {settings.backend.host}:{settings.backend.port} (mode: {args.mode})"
     )
     logger.debug(f"Frontend base URL from settings: {settings.frontend_base_url}")
     logger.debug(f"Full settings dump: {settings.model_dump_json(indent=2)}")
 
-    uvicorn.run(
-        "backend.app.main:app",
-        host=settings.backend.host,
-        port=settings.backend.port,
-        reload=True,
-        reload_dirs=[str(PROJECT_ROOT_PATH)],
-        log_level=settings.logging.level.lower(),
-    )
+    if args.mode == "prod":
+        workers = max(1, args.workers)
+        logger.info(
+            f"Production mode: {workers} workers. One leader runs the analysis; the others read shared state."
+        )
+        uvicorn.run(
+            "backend.app.main:app",
+            host=settings.backend.host,
+            port=settings.backend.port,
+            workers=workers,
+            log_level=settings.logging.level.lower(),
+        )
+    else:
+        uvicorn.run(
+            "backend.app.main:app",
+            host=settings.backend.host,
+            port=settings.backend.port,
+            reload=True,
+            reload_dirs=[str(PROJECT_ROOT_PATH)],
+            log_level=settings.logging.level.lower(),
+        )
@@ -0,0 +1,124 @@
+"""Benchmark cache save/load time and file size as result sets grow.
+
+Usage (from the project root):
+    python benchmarks/bench_caching.py [--sizes 1000 10000 100000] [--repeat 3]
+
+Compares the legacy format (indented JSON) with every serializer/compression
+combination supported by ``backend.app.core.serialization``.
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backend.app.core import serialization  # noqa: E402
+
+
+def make_payload(num_reviews: int) -> dict:
+    rng = random.Random(42)
+    langs = ["en", "fr", "es", "de", "it", "pt"]
+    reviews = [
+        {
+            "review_id": i,
+            "product_id": f"P{rng.randint(100, 999)}",
+            "text_preview": "Lorem ipsum dolor sit amet, consectetur adipiscing...",
+            "detected_language": rng.choice(langs),
+            "language_confidence": round(rng.uniform(0.7, 0.99), 2),
+            "predicted_sentiment_stars": rng.randint(1, 5),
+            "sentiment_confidence": round(rng.uniform(0.6, 0.99), 2),
+        }
+        for i in range(num_reviews)
+    ]
+    return {"stats": {"total_reviews_processed": num_reviews}, "reviews": reviews}
+
+
+def time_call(fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings) * 1000
+
+
+def bench_legacy(path: Path, data, repeat: int):
+    def save():
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=4)
+
+    def load():
+        with open(path, "r", encoding="utf-8") as f:
+            json.load(f)
+
+    save_ms = time_call(save, repeat)
+    load_ms = time_call(load, repeat)
+    return save_ms, load_ms, path.stat().st_size
+
+
+def bench_framed(path: Path, data, repeat: int, compression: str, serializer: str):
+    save_ms = time_call(
+        lambda: serialization.write_cache_file(
+            path, data, compression=compression, serializer=serializer
+        ),
+        repeat,
+    )
+    load_ms = time_call(lambda: serialization.read_cache_file(path), repeat)
+    return save_ms, load_ms, path.stat().st_size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    compressions = ["none", "gzip"] + (["zstd"] if serialization.zstandard else [])
+    print(
+        f"orjson: {'yes' if serialization.orjson else 'no'}, zstd: {'yes' if serialization.zstandard else 'no'}"
+    )
+    print(
+        f"{'reviews':>8} {'format':<22} {'save ms':>9} {'load ms':>9} {'size KiB':>10}"
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp_dir = Path(tmp)
+        for size in args.sizes:
+            data = make_payload(size)
+            rows = [
+                (
+                    "legacy json indent=4",
+                    bench_legacy(tmp_dir / "legacy.json", data, args.repeat),
+                )
+            ]
+            for compression in compressions:
+                for serializer in ("json", "pickle"):
+                    label = f"{serializer}+{compression}"
+                    rows.append(
+                        (
+                            label,
+                            bench_framed(
+                                tmp_dir / f"{label}.cache",
+                                data,
+                                args.repeat,
+                                compression,
+                                serializer,
+                            ),
+                        )
+                    )
+            for label, (save_ms, load_ms, nbytes) in rows:
+                print(
+                    f"{size:>8} {label:<22} {save_ms:>9.1f} {load_ms:>9.1f} {nbytes / 1024:>10.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
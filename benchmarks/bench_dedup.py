@@ -0,0 +1,104 @@
+"""Benchmark deduplication against model scoring for ingest-sized batches.
+
+Usage (from the project root):
+    python benchmarks/bench_dedup.py [--sizes 10 100 1000 10000] [--repeat 3]
+
+For each batch size, times ``group_reviews`` with dedup off, exact-only and
+exact + near-duplicate (MinHash/LSH), then scores the batch's groups with
+the models configured in ``settings.yaml`` as the dataset watcher does.
+Every batch has fresh texts, so the prediction cache never answers. The
+near-duplicate pass costs about the same per row at every size, so its
+share of an ingest's latency is the ratio of the two per-row columns.
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from loguru import logger  # noqa: E402
+
+from backend.app.config import DedupConfig  # noqa: E402
+from backend.app.services.review_pipeline import (  # noqa: E402
+    analyze_groups,
+    group_reviews,
+)
+
+WORDS = (
+    "good bad great product quality price delivery fast slow broken love hate "
+    "recommend would buy again not really very works fine cheap expensive"
+).split()
+
+DEDUP_MODES = {
+    "off": DedupConfig(enabled=False),
+    "exact": DedupConfig(near_duplicates=False),
+    "near": DedupConfig(),
+}
+
+
+def make_batch(rng: random.Random, size: int):
+    return [
+        {
+            "review_id": i,
+            "product_id": f"P{rng.randint(1, 20)}",
+            "review_text": " ".join(
+                rng.choice(WORDS) for _ in range(rng.randint(8, 60))
+            ),
+        }
+        for i in range(size)
+    ]
+
+
+def time_grouping(batch, config: DedupConfig) -> float:
+    started = time.perf_counter()
+    group_reviews(batch, config)
+    return time.perf_counter() - started
+
+
+async def time_scoring(batch) -> float:
+    groups, _ = group_reviews(batch, DEDUP_MODES["off"])
+    started = time.perf_counter()
+    await analyze_groups(groups)
+    return time.perf_counter() - started
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logger.remove()
+    rng = random.Random(42)
+
+    await time_scoring(make_batch(rng, 8))  # Load the models
+    print(
+        f"{'rows':>6} {'off us/row':>11} {'exact us/row':>13} "
+        f"{'near us/row':>12} {'score us/row':>13}"
+    )
+    for size in args.sizes:
+        per_row = {}
+        for mode, config in DEDUP_MODES.items():
+            per_row[mode] = statistics.median(
+                time_grouping(make_batch(rng, size), config) for _ in range(args.repeat)
+            )
+        scoring = [
+            await time_scoring(make_batch(rng, size)) for _ in range(args.repeat)
+        ]
+        per_row["score"] = statistics.median(scoring)
+        print(
+            f"{size:>6} {per_row['off'] / size * 1e6:>11.0f} "
+            f"{per_row['exact'] / size * 1e6:>13.0f} "
+            f"{per_row['near'] / size * 1e6:>12.0f} "
+            f"{per_row['score'] / size * 1e6:>13.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+"""Benchmark the logging overhead of the per-review code path.
+
+Usage (from the project root):
+    python benchmarks/bench_logging.py [--reviews 100000] [--repeat 3]
+
+Each simulated review makes the log calls of the real path (review start,
+one prediction per model, review done). "f-strings" are the calls as they
+were written before the hot-path loggers: messages are built (and the text
+sliced) on every call, even when no sink accepts the level. "HotPathLog"
+uses the module-level call sites of ``backend.app.core.logging_config``.
+Sinks write to a temporary log file (no console) and the time includes
+draining loguru's queue, so it covers formatting and writing. The cost per
+review is reported over a run without any log calls.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from loguru import logger  # noqa: E402
+
+from backend.app.core.logging_config import HotPathLog, setup_logging  # noqa: E402
+
+TEXT = "This product is great, I would buy it again. " * 8
+KINDS = ("language", "sentiment")
+
+_log_review_start = HotPathLog("TRACE")
+_log_predict = HotPathLog("DEBUG")
+_log_review_done = HotPathLog("TRACE")
+
+# label, logging settings, call style
+SCENARIOS = [
+    (
+        "dev profile (file TRACE), f-strings",
+        {"profile": "dev", "file_level": "TRACE"},
+        "fstring",
+    ),
+    ("prod profile, f-strings", {"profile": "prod"}, "fstring"),
+    (
+        "dev profile (file TRACE), HotPathLog 1/100",
+        {"profile": "dev", "file_level": "TRACE", "hot_path_sample_every": 100},
+        "hot_path",
+    ),
+    ("prod profile, HotPathLog", {"profile": "prod"}, "hot_path"),
+]
+
+
+def review_fstring(review_id: int, text: str):
+    logger.trace(f"Processing review ID: {review_id}, Text: '{text[:30]}...'")
+    for kind in KINDS:
+        logger.debug(f"Predicting {kind} for text: '{text[:30]}...'")
+    logger.trace(f"Review ID {review_id} processed. Lang: en, Stars: 5")
+
+
+def review_hot_path(review_id: int, text: str):
+    _log_review_start("Processing review ID: {}, Text: '{:.30}...'", review_id, text)
+    for kind in KINDS:
+        _log_predict("Predicting {} for text: '{:.30}...'", kind, text)
+    _log_review_done("Review ID {} processed. Lang: {}, Stars: {}", review_id, "en", 5)
+
+
+def review_silent(review_id: int, text: str):
+    for kind in KINDS:
+        pass
+
+
+CALLS = {"fstring": review_fstring, "hot_path": review_hot_path}
+
+
+def configure(tmp: str, overrides: dict):
+    settings = {
+        "console_enabled": False,
+        "file_enabled": True,
+        "file_path": "bench.log",
+        "rotation": None,
+        "retention": None,
+        **overrides,
+    }
+    setup_logging(settings, Path(tmp))
+
+
+def timed(fn, num_reviews: int) -> float:
+    started = time.perf_counter()
+    for review_id in range(num_reviews):
+        fn(review_id, TEXT)
+    logger.complete()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--reviews", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'scenario':<46} {'us/review':>10} {'log MiB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        logger.remove()
+        baseline = statistics.median(
+            timed(review_silent, args.reviews) for _ in range(args.repeat)
+        )
+        for label, overrides, style in SCENARIOS:
+            log_file = Path(tmp) / "bench.log"
+            samples = []
+            for _ in range(args.repeat):
+                configure(tmp, overrides)
+                samples.append(timed(CALLS[style], args.reviews))
+                logger.remove()
+            size = log_file.stat().st_size / args.repeat if log_file.exists() else 0
+            log_file.unlink(missing_ok=True)
+            overhead = (statistics.median(samples) - baseline) / args.reviews
+            print(f"{label:<46} {overhead * 1e6:>10.2f} {size / 2**20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark API cold start: import time and time to first response.
+
+Usage (from the project root):
+    python benchmarks/bench_startup.py [--runs 5] [--port 8765]
+        [--import-budget-ms 1000] [--first-response-budget-ms 2500]
+
+``import`` is the time to import ``backend.app.main`` in a fresh interpreter,
+which is also what every ``reload=True`` restart pays. ``first response`` is
+the time from launching uvicorn until ``GET /`` answers, which includes the
+startup hook (models, prompts, loading the cached stats). ``dashboard`` is
+the time until the first dashboard page answers, after which the Dash app
+has been built. Medians over ``--runs`` are compared with the budgets and the
+script exits with status 1 if any is exceeded, so it can guard against
+startup regressions in CI. Run it once beforehand so the stats cache exists;
+otherwise the first run includes a full analysis.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+IMPORT_BUDGET_MS = 1000.0
+FIRST_RESPONSE_BUDGET_MS = 2500.0
+POLL_INTERVAL_SECONDS = 0.02
+STARTUP_TIMEOUT_SECONDS = 120.0
+
+_IMPORT_SNIPPET = """
+import time
+started = time.perf_counter()
+import backend.app.main
+print((time.perf_counter() - started) * 1000)
+"""
+
+
+def measure_import() -> float:
+    output = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SNIPPET],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def wait_for(url: str, started: float, process: subprocess.Popen) -> float:
+    deadline = started + STARTUP_TIMEOUT_SECONDS
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}.")
+        try:
+            if httpx.get(url, timeout=STARTUP_TIMEOUT_SECONDS).status_code < 500:
+                return (time.perf_counter() - started) * 1000
+        except httpx.TransportError:
+            pass
+        time.sleep(POLL_INTERVAL_SECONDS)
+    raise RuntimeError(f"No response from {url} within {STARTUP_TIMEOUT_SECONDS}s.")
+
+
+def measure_server(port: int, dashboard_path: str) -> tuple:
+    """Milliseconds until the API and then the dashboard first answer."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "backend.app.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        first_response = wait_for(f"{base_url}/", started, process)
+        dashboard = wait_for(f"{base_url}{dashboard_path}", started, process)
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    return first_response, dashboard
+
+
+def report(label: str, samples: list, budget_ms: float = None) -> bool:
+    median = statistics.median(samples)
+    within = budget_ms is None or median <= budget_ms
+    budget = (
+        "" if budget_ms is None else f"{budget_ms:>10.0f} {'ok' if within else 'OVER'}"
+    )
+    print(
+        f"{label:<16} {median:>10.0f} {min(samples):>10.0f} {max(samples):>10.0f} {budget}"
+    )
+    return within
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--dashboard-path", default="/dashboard/")
+    parser.add_argument("--import-budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument(
+        "--first-response-budget-ms", type=float, default=FIRST_RESPONSE_BUDGET_MS
+    )
+    args = parser.parse_args()
+
+    imports, first_responses, dashboards = [], [], []
+    for _ in range(args.runs):
+        imports.append(measure_import())
+        first_response, dashboard = measure_server(args.port, args.dashboard_path)
+        first_responses.append(first_response)
+        dashboards.append(dashboard)
+
+    print(f"{'stage':<16} {'median ms':>10} {'min':>10} {'max':>10} {'budget':>10}")
+    within = [
+        report("import", imports, args.import_budget_ms),
+        report("first response", first_responses, args.first_response_budget_ms),
+        report("dashboard", dashboards),
+    ]
+    if not all(within):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
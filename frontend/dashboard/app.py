@@ -60,8 +60,9 @@ except ImportError as e:
             print(f"Dash App (standalone): Failed to set up minimal logging: {log_e}")
 
 
-from .pages import overview, testing 
+from .pages import overview, testing, explorer
 from .layout import app_layout_definition
+from .components.background import background_callback_manager
 
 
 DASH_INTERNAL_URL_BASE = f'{DASH_MOUNT_URL_PREFIX_FROM_SETTINGS.rstrip("/")}/'
@@ -73,6 +74,7 @@ app = dash.Dash(
     # url_base_pathname=DASH_INTERNAL_URL_BASE,
     requests_pathname_prefix=DASH_INTERNAL_URL_BASE,
     assets_folder=str(Path(__file__).parent / "assets"),
+    background_callback_manager=background_callback_manager,
 )
 app.title = "Customer Review Analysis Dashboard"
 server = app.server
@@ -107,6 +109,11 @@ def display_page(pathname: str):
             f"[Dash Router] Matched testing page for '{pathname}'. Serving testing layout."
         )
         return testing.layout
+    elif pathname == app.config.requests_pathname_prefix + "reviews":
+        logger.info(
+            f"[Dash Router] Matched review explorer for '{pathname}'. Serving explorer layout."
+        )
+        return explorer.layout
 
     logger.warning(
         f"[Dash Router] Path '{pathname}' was NOT matched by Dash's display_page. Current requests_pathname_prefix: '{app.config.requests_pathname_prefix}'. Displaying Dash 404."
@@ -0,0 +1,214 @@
+// Clientside renderers for the overview page.
+// The server only ships the raw counts held in the `stats-data-store-overview`
+// dcc.Store; every figure and the language dropdown are built here in the browser.
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    overview: (function () {
+        const STAR_COLORS = {
+            "1": "#d9534f",
+            "2": "#f0ad4e",
+            "3": "#f0ad4e",
+            "4": "#5cb85c",
+            "5": "#5cb85c",
+        };
+        // Plotly's default qualitative palette, matching plotly express.
+        const QUALITATIVE_COLORS = [
+            "#636efa", "#EF553B", "#00cc96", "#ab63fa", "#FFA15A",
+            "#19d3f3", "#FF6692", "#B6E880", "#FF97FF", "#FECB52",
+        ];
+        const MARGIN = { t: 20, b: 0, l: 0, r: 0 };
+
+        function statusMessage(stats, fallback) {
+            if (!stats || stats.error || stats.status === "loading") {
+                if (stats && (stats.error || stats.message)) {
+                    return stats.error || stats.message;
+                }
+                return fallback;
+            }
+            return null;
+        }
+
+        function placeholderFigure(message) {
+            return {
+                data: [],
+                layout: {
+                    annotations: [
+                        {
+                            text: message,
+                            xref: "paper",
+                            yref: "paper",
+                            x: 0.5,
+                            y: 0.5,
+                            showarrow: false,
+                            font: { size: 16 },
+                        },
+                    ],
+                    xaxis: { visible: false },
+                    yaxis: { visible: false },
+                    paper_bgcolor: "rgba(0,0,0,0)",
+                    plot_bgcolor: "rgba(0,0,0,0)",
+                },
+            };
+        }
+
+        function starsFigure(distribution) {
+            const stars = Object.keys(distribution).sort();
+            const counts = stars.map((s) => distribution[s]);
+            return {
+                data: [
+                    {
+                        type: "bar",
+                        x: stars,
+                        y: counts,
+                        text: counts,
+                        textposition: "auto",
+                        marker: { color: stars.map((s) => STAR_COLORS[s] || "#636efa") },
+                        hovertemplate: "Stars=%{x}<br>Count=%{y}<extra></extra>",
+                    },
+                ],
+                layout: {
+                    margin: MARGIN,
+                    showlegend: false,
+                    xaxis: { title: { text: "Star Rating" }, type: "category" },
+                    yaxis: { title: { text: "Count" } },
+                },
+            };
+        }
+
+        return {
+            totalReviews: function (stats) {
+                const msg = statusMessage(stats, "Loading...");
+                if (msg !== null) {
+                    return ["Status", msg];
+                }
+                const processed = stats.total_reviews_processed ?? "N/A";
+                const total = stats.total_reviews_in_dataset ?? "N/A";
+                if (stats.approximate && stats.progress) {
+                    const pct = (stats.progress.fraction * 100).toFixed(1);
+                    return [
+                        `${processed} / ${total}`,
+                        `Approximate: ${pct}% analyzed, refining...`,
+                    ];
+                }
+                return [`${processed} / ${total}`, "Reviews Processed / In Dataset"];
+            },
+
+            languageChart: function (stats) {
+                const msg = statusMessage(stats, "Loading language data...");
+                if (msg !== null) {
+                    return placeholderFigure(msg);
+                }
+                const dist = stats.language_distribution;
+                if (!dist || Object.keys(dist).length === 0) {
+                    return placeholderFigure("No language data available");
+                }
+                const langs = Object.keys(dist).sort((a, b) => dist[b] - dist[a]);
+                const counts = langs.map((l) => dist[l]);
+                return {
+                    data: [
+                        {
+                            type: "bar",
+                            x: langs,
+                            y: counts,
+                            text: counts,
+                            textposition: "auto",
+                            marker: {
+                                color: langs.map(
+                                    (_, i) => QUALITATIVE_COLORS[i % QUALITATIVE_COLORS.length]
+                                ),
+                            },
+                            hovertemplate: "Language=%{x}<br>Count=%{y}<extra></extra>",
+                        },
+                    ],
+                    layout: {
+                        margin: MARGIN,
+                        showlegend: false,
+                        xaxis: { title: { text: "Language" }, type: "category" },
+                        yaxis: { title: { text: "Count" } },
+                    },
+                };
+            },
+
+            sentimentChart: function (stats) {
+                const msg = statusMessage(stats, "Loading sentiment data...");
+                if (msg !== null) {
+                    return placeholderFigure(msg);
+                }
+                const dist = stats.overall_sentiment_distribution;
+                if (!dist || Object.keys(dist).length === 0) {
+                    return placeholderFigure("No overall sentiment data");
+                }
+                return starsFigure(dist);
+            },
+
+            languageDropdown: function (stats, currentValue) {
+                if (statusMessage(stats, "") !== null) {
+                    return [[], null];
+                }
+                const langs = Object.keys(
+                    stats.sentiment_distribution_by_language || {}
+                ).sort();
+                const options = langs.map((lang) => ({
+                    label: lang ? lang.toUpperCase() : "Unknown",
+                    value: lang,
+                }));
+                // Keep the user's selection across refreshes when it still exists.
+                const value = langs.includes(currentValue)
+                    ? currentValue
+                    : langs.length ? langs[0] : null;
+                return [options, value];
+            },
+
+            sentimentByLanguageChart: function (stats, selectedLanguage) {
+                const msg = statusMessage(stats, "Loading data...");
+                if (msg !== null) {
+                    return placeholderFigure(msg);
+                }
+                if (!selectedLanguage) {
+                    return placeholderFigure("Please select a language");
+                }
+                const byLang = stats.sentiment_distribution_by_language || {};
+                const langData = byLang[selectedLanguage];
+                if (!langData || Object.keys(langData).length === 0) {
+                    return placeholderFigure(
+                        `No sentiment data for ${selectedLanguage.toUpperCase()}`
+                    );
+                }
+                return starsFigure(langData);
+            },
+
+            trendChart: function (trend) {
+                if (!trend || trend.error || trend.status) {
+                    return placeholderFigure(
+                        (trend && (trend.error || trend.message)) || "Loading trend data..."
+                    );
+                }
+                const series = trend.series || [];
+                if (series.length === 0) {
+                    return placeholderFigure("No reviews in the trend window");
+                }
+                return {
+                    data: [
+                        {
+                            type: "scatter",
+                            mode: "lines+markers",
+                            x: series.map((b) => b.value),
+                            y: series.map((b) => b.mean_rating),
+                            customdata: series.map((b) => [b.count, b.rated]),
+                            line: { color: QUALITATIVE_COLORS[0] },
+                            hovertemplate:
+                                "Time (UTC)=%{x}<br>Mean Stars=%{y}" +
+                                "<br>count=%{customdata[0]}<br>rated=%{customdata[1]}<extra></extra>",
+                        },
+                    ],
+                    layout: {
+                        margin: MARGIN,
+                        showlegend: false,
+                        xaxis: { title: { text: "Time (UTC)" } },
+                        yaxis: { title: { text: "Mean Stars" }, range: [1, 5] },
+                    },
+                };
+            },
+        };
+    })(),
+});
@@ -0,0 +1,25 @@
+from pathlib import Path
+from loguru import logger
+
+try:
+    from backend.app.config import settings as backend_settings_background
+
+    BACKGROUND_CACHE_DIR = (
+        Path(backend_settings_background.backend.cache_dir) / "dash_background"
+    )
+except ImportError:
+    BACKGROUND_CACHE_DIR = Path(__file__).resolve().parent.parent / ".dash_background"
+
+try:
+    import diskcache
+    from dash import DiskcacheManager
+
+    background_callback_manager = DiskcacheManager(
+        diskcache.Cache(str(BACKGROUND_CACHE_DIR))
+    )
+    logger.debug(f"Dash background callbacks use diskcache at {BACKGROUND_CACHE_DIR}")
+except ImportError as e:
+    background_callback_manager = None
+    logger.warning(
+        f"Dash background callbacks unavailable (install 'dash[diskcache]'): {e}. Bulk jobs will run in the request worker."
+    )
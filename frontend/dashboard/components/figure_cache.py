@@ -0,0 +1,64 @@
+import hashlib
+import json
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from loguru import logger
+
+from backend.app.core.cache_backends import CacheBackend, MemoryCacheBackend
+
+
+def stats_version(stats_data: Optional[Dict[str, Any]]) -> str:
+    """Return the version tag of a stats payload.
+
+    The backend stamps ``stats_version`` on every analysis run; payloads
+    without one (e.g. an older cache file) fall back to a content hash.
+    """
+    if not stats_data:
+        return "empty"
+    version = stats_data.get("stats_version")
+    if version:
+        return str(version)
+    payload = json.dumps(stats_data, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(payload).hexdigest()
+
+
+class FigureCache:
+    """Cache of serialized plotly figures on top of a cache backend.
+
+    Keys are ``(stats_version, chart_name, *chart_params)`` so a figure is
+    built once per analysis run and parameter set, then shared by every
+    client and refresh tick until the stats change. Size bounds and eviction
+    come from the backend (``caches.figures`` in settings.yaml); without one
+    an in-memory LRU of ``max_entries`` figures is used.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, max_entries: int = 64):
+        self.backend = backend or MemoryCacheBackend(
+            "figures", policy="lru", max_entries=max(1, max_entries)
+        )
+
+    @staticmethod
+    def _key(key: Tuple[Hashable, ...]) -> str:
+        return "|".join(str(part) for part in key)
+
+    def get_or_build(
+        self, key: Tuple[Hashable, ...], builder: Callable[[], Any]
+    ) -> Dict[str, Any]:
+        cache_key = self._key(key)
+        cached = self.backend.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # A concurrent miss on the same key only costs a duplicate build,
+        # never a stale figure.
+        figure = builder()
+        figure_dict = figure.to_dict() if hasattr(figure, "to_dict") else figure
+        self.backend.set(cache_key, figure_dict)
+        logger.trace(f"FigureCache: built {cache_key}")
+        return figure_dict
+
+    def clear(self):
+        self.backend.clear()
+
+    def info(self) -> Dict[str, Any]:
+        return self.backend.info()
@@ -22,6 +22,7 @@ navbar = dbc.NavbarSimple(
         dbc.NavItem(
             dbc.NavLink("Test Models", href=f"{base_url_stripped}/test-models")
         ),
+        dbc.NavItem(dbc.NavLink("Reviews", href=f"{base_url_stripped}/reviews")),
     ],
     brand="Review Analysis Dashboard",
     brand_href=f"{base_url_stripped}/",
@@ -0,0 +1,221 @@
+from dash import html, dcc, callback, callback_context, dash_table, Input, Output, State
+import dash_bootstrap_components as dbc
+import httpx
+import sys
+from pathlib import Path
+from loguru import logger
+
+DASH_EXPLORER_DIR = Path(__file__).resolve().parent
+DASH_APP_DIR_E = DASH_EXPLORER_DIR.parent
+FRONTEND_DIR_E = DASH_APP_DIR_E.parent
+PROJECT_ROOT_FOR_DASH_EXPLORER = FRONTEND_DIR_E.parent
+
+if str(PROJECT_ROOT_FOR_DASH_EXPLORER) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT_FOR_DASH_EXPLORER))
+
+try:
+    from backend.app.config import settings as backend_settings_explorer
+
+    api_host = backend_settings_explorer.backend.host
+    if api_host == "0.0.0.0":
+        api_host = "127.0.0.1"
+
+    API_BASE_URL = f"http://{api_host}:{backend_settings_explorer.backend.port}/api/v1"
+    logger.trace(
+        f"Explorer Page: API_BASE_URL set to {API_BASE_URL} from backend settings."
+    )
+except ImportError as e:
+    API_BASE_URL = "http://127.0.0.1:8000/api/v1"  # Fallback
+    logger.warning(
+        f"Explorer Page: Could not import backend_settings. Defaulting API_BASE_URL to {API_BASE_URL}. Error: {e}"
+    )
+
+PAGE_SIZE = 25
+
+# DataTable column id -> sort_by value accepted by /api/v1/reviews
+TABLE_COLUMNS = [
+    {"name": "Review ID", "id": "review_id", "sort_by": "review_id"},
+    {"name": "Product", "id": "product_id", "sort_by": "product_id"},
+    {"name": "Language", "id": "detected_language", "sort_by": "language"},
+    {"name": "Lang. Conf.", "id": "language_confidence", "sort_by": "language_confidence"},
+    {"name": "Stars", "id": "predicted_sentiment_stars", "sort_by": "stars"},
+    {"name": "Sent. Conf.", "id": "sentiment_confidence", "sort_by": "sentiment_confidence"},
+    {"name": "Review", "id": "text_preview", "sort_by": None},
+]
+SORT_KEYS = {c["id"]: c["sort_by"] for c in TABLE_COLUMNS}
+
+
+layout = dbc.Container(
+    [
+        dbc.Row(dbc.Col(html.H3("Review Explorer"), width=12, className="mb-3 mt-3")),
+        dbc.Row(
+            [
+                dbc.Col(
+                    [
+                        dbc.Label("Language", html_for="explorer-language-filter"),
+                        dcc.Dropdown(
+                            id="explorer-language-filter",
+                            multi=True,
+                            placeholder="All languages",
+                        ),
+                    ],
+                    md=4,
+                ),
+                dbc.Col(
+                    [
+                        dbc.Label("Stars", html_for="explorer-stars-filter"),
+                        dcc.Checklist(
+                            id="explorer-stars-filter",
+                            options=[{"label": f" {s}", "value": s} for s in range(1, 6)],
+                            value=[],
+                            inline=True,
+                            inputClassName="me-1",
+                            labelClassName="me-3",
+                        ),
+                    ],
+                    md=4,
+                ),
+                dbc.Col(
+                    [
+                        dbc.Label(
+                            "Min. Sentiment Confidence",
+                            html_for="explorer-confidence-filter",
+                        ),
+                        dcc.Slider(
+                            id="explorer-confidence-filter",
+                            min=0,
+                            max=1,
+                            step=0.05,
+                            value=0,
+                            marks={0: "0", 0.5: "0.5", 1: "1"},
+                        ),
+                    ],
+                    md=4,
+                ),
+            ],
+            className="mb-3",
+        ),
+        dbc.Row(dbc.Col(html.Div(id="explorer-total-text", className="mb-2 text-muted"))),
+        dbc.Row(
+            dbc.Col(
+                dash_table.DataTable(
+                    id="explorer-table",
+                    columns=[
+                        {"name": c["name"], "id": c["id"]} for c in TABLE_COLUMNS
+                    ],
+                    data=[],
+                    page_current=0,
+                    page_size=PAGE_SIZE,
+                    page_action="custom",
+                    sort_action="custom",
+                    sort_mode="single",
+                    sort_by=[],
+                    style_cell={
+                        "textAlign": "left",
+                        "maxWidth": "400px",
+                        "overflow": "hidden",
+                        "textOverflow": "ellipsis",
+                    },
+                    style_table={"overflowX": "auto"},
+                ),
+                md=12,
+            )
+        ),
+        # Cursor of each visited page for the current filter/sort combination.
+        dcc.Store(id="explorer-cursor-store", data={"query": None, "cursors": {}}),
+    ],
+    fluid=True,
+)
+
+
+@callback(
+    Output("explorer-language-filter", "options"),
+    Input("explorer-table", "id"),
+)
+def load_language_options(_):
+    try:
+        response = httpx.get(f"{API_BASE_URL}/stats", timeout=10.0)
+        if response.status_code != 200:
+            return []
+        langs = sorted(
+            (response.json().get("stats") or {}).get("language_distribution", {})
+        )
+        return [{"label": lang.upper(), "value": lang} for lang in langs]
+    except Exception as e:
+        logger.warning(f"Explorer: could not load language options: {e}")
+        return []
+
+
+@callback(
+    [
+        Output("explorer-table", "data"),
+        Output("explorer-table", "page_count"),
+        Output("explorer-table", "page_current"),
+        Output("explorer-cursor-store", "data"),
+        Output("explorer-total-text", "children"),
+    ],
+    [
+        Input("explorer-table", "page_current"),
+        Input("explorer-table", "sort_by"),
+        Input("explorer-language-filter", "value"),
+        Input("explorer-stars-filter", "value"),
+        Input("explorer-confidence-filter", "value"),
+    ],
+    State("explorer-cursor-store", "data"),
+    State("explorer-total-text", "children"),
+)
+def fetch_review_page(
+    page_current, sort_by, languages, stars, min_confidence, cursor_state, total_text
+):
+    params = {"limit": PAGE_SIZE}
+    if languages:
+        params["language"] = languages
+    if stars:
+        params["stars"] = stars
+    if min_confidence:
+        params["min_confidence"] = min_confidence
+    if sort_by and SORT_KEYS.get(sort_by[0]["column_id"]):
+        params["sort_by"] = SORT_KEYS[sort_by[0]["column_id"]]
+        params["sort_dir"] = sort_by[0]["direction"]
+
+    query_key = repr(sorted((k, v) for k, v in params.items()))
+    cursor_state = cursor_state or {"query": None, "cursors": {}}
+    if (
+        cursor_state.get("query") != query_key
+        or callback_context.triggered_id != "explorer-table"
+        or not page_current
+    ):
+        # New query: restart from the first page with a fresh cursor map.
+        page_current = 0
+        cursor_state = {"query": query_key, "cursors": {"0": None}}
+
+    cursors = cursor_state["cursors"]
+    if str(page_current) not in cursors:
+        logger.warning(f"Explorer: no cursor for page {page_current}, resetting.")
+        page_current = 0
+    cursor = cursors.get(str(page_current))
+    if cursor:
+        params["cursor"] = cursor
+    if page_current == 0:
+        params["include_total"] = True
+
+    logger.debug(f"Explorer: fetching page {page_current} with params {params}")
+    try:
+        response = httpx.get(f"{API_BASE_URL}/reviews", params=params, timeout=15.0)
+        response.raise_for_status()
+        page = response.json()
+    except Exception as e:
+        logger.error(f"Explorer: error fetching reviews page: {e}", exc_info=True)
+        return [], 1, 0, cursor_state, f"Could not load reviews: {e}"
+
+    next_cursor = page.get("next_cursor")
+    if next_cursor:
+        cursors[str(page_current + 1)] = next_cursor
+    # Only pages whose cursor is known are reachable.
+    page_count = max(int(k) for k in cursors) + 1
+    if not next_cursor:
+        page_count = page_current + 1
+
+    if page.get("total") is not None:
+        total_text = f"{page['total']:,} matching reviews"
+    return page.get("items", []), page_count, page_current, cursor_state, total_text
@@ -1,13 +1,22 @@
-from dash import html, dcc, callback, Input, Output, State
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
+from dash import (
+    html,
+    dcc,
+    callback,
+    callback_context,
+    clientside_callback,
+    ClientsideFunction,
+    Input,
+    Output,
+    State,
+)
 import httpx
 import dash_bootstrap_components as dbc
 import sys
 from pathlib import Path
 from loguru import logger
 
+from ..components.figure_cache import FigureCache, stats_version
+
 DASH_OVERVIEW_DIR = Path(__file__).resolve().parent
 DASH_APP_DIR_O = DASH_OVERVIEW_DIR.parent
 FRONTEND_DIR_O = DASH_APP_DIR_O.parent
@@ -18,17 +27,21 @@ if str(PROJECT_ROOT_FOR_DASH_OVERVIEW) not in sys.path:
 
 try:
     from backend.app.config import settings as backend_settings_overview
+    from backend.app.core.cache_backends import get_cache
 
     api_host = backend_settings_overview.backend.host
     if api_host == "0.0.0.0":
         api_host = "127.0.0.1"
 
     API_BASE_URL = f"http://{api_host}:{backend_settings_overview.backend.port}/api/v1"
+    RENDER_MODE = backend_settings_overview.dashboard.render_mode
     logger.trace(
         f"Overview Page: API_BASE_URL set to {API_BASE_URL} from backend settings."
     )
 except ImportError as e:
     API_BASE_URL = "http://127.0.0.1:8000/api/v1"  # Fallback
+    RENDER_MODE = "clientside"
+    get_cache = None
     logger.warning(
         f"Overview Page: Could not import backend_settings. Defaulting API_BASE_URL to {API_BASE_URL}. Error: {e}"
     )
@@ -40,7 +53,25 @@ layout = dbc.Container(
         dbc.Row(
             [
                 dbc.Col(
-                    dcc.Loading(dbc.Card(dbc.CardBody(id="total-reviews-card"))),
+                    dcc.Loading(
+                        dbc.Card(
+                            dbc.CardBody(
+                                [
+                                    html.H4(
+                                        "Status",
+                                        id="total-reviews-title",
+                                        className="card-title display-6",
+                                    ),
+                                    html.P(
+                                        "Loading...",
+                                        id="total-reviews-subtitle",
+                                        className="card-text",
+                                    ),
+                                ],
+                                id="total-reviews-card",
+                            )
+                        )
+                    ),
                     md=4,
                     className="mb-3",
                 ),
@@ -105,6 +136,22 @@ layout = dbc.Container(
                 ),
             ]
         ),
+        dbc.Row(
+            dbc.Col(
+                dcc.Loading(
+                    dbc.Card(
+                        dbc.CardBody(
+                            [
+                                html.H5("Sentiment Trend", className="card-title"),
+                                dcc.Graph(id="sentiment-trend-chart"),
+                            ]
+                        )
+                    )
+                ),
+                width=12,
+                className="mb-3",
+            )
+        ),
         dcc.Interval(
             id="interval-component-overview", interval=30 * 1000, n_intervals=0
         ),
@@ -114,34 +161,17 @@ layout = dbc.Container(
             color="primary",
             className="mt-2 mb-4",
         ),
-        html.Div(id="stats-data-store-overview", style={"display": "none"}),
+        # Raw counts only; figures are rendered clientside (assets/overview_charts.js).
+        dcc.Store(id="stats-data-store-overview"),
+        # Pre-aggregated trend buckets from /stats/trends.
+        dcc.Store(id="trend-data-store-overview"),
     ],
     fluid=True,
 )
 
 
-def create_placeholder_figure(message="Loading data..."):
-    fig = go.Figure()
-    fig.add_annotation(
-        text=message,
-        xref="paper",
-        yref="paper",
-        x=0.5,
-        y=0.5,
-        showarrow=False,
-        font=dict(size=16),
-    )
-    fig.update_layout(
-        xaxis_visible=False,
-        yaxis_visible=False,
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-    )
-    return fig
-
-
 @callback(
-    Output("stats-data-store-overview", "children"),
+    Output("stats-data-store-overview", "data"),
     [
         Input("refresh-stats-button-overview", "n_clicks"),
         Input("interval-component-overview", "n_intervals"),
@@ -184,60 +214,91 @@ def fetch_stats_data_overview(n_clicks, n_intervals):
 
 
 @callback(
-    Output("total-reviews-card", "children"),
-    Input("stats-data-store-overview", "children"),
+    Output("trend-data-store-overview", "data"),
+    [
+        Input("refresh-stats-button-overview", "n_clicks"),
+        Input("interval-component-overview", "n_intervals"),
+    ],
 )
-def update_total_reviews_card(stats_data):
-    if (
-        not stats_data
-        or stats_data.get("error")
-        or stats_data.get("status") == "loading"
-    ):
-        msg = "Loading..."
-        if stats_data and (stats_data.get("error") or stats_data.get("message")):
-            msg = stats_data.get("error") or stats_data.get("message")
-        logger.debug(f"Updating total reviews card with status/error: {msg}")
-        return [
-            html.H4("Status", className="card-title"),
-            html.P(msg, className="card-text"),
-        ]
+def fetch_trend_data_overview(n_clicks, n_intervals):
+    try:
+        response = httpx.get(f"{API_BASE_URL}/stats/trends", timeout=10.0)
+        logger.trace(
+            f"API response status code: {response.status_code} for /stats/trends"
+        )
+        if response.status_code in (202, 404):
+            return {"status": "unavailable", "message": response.json().get("detail")}
+        response.raise_for_status()
+        return response.json()
+    except httpx.RequestError as e:
+        logger.error(f"API Connection Error fetching trends: {e}")
+        return {"error": f"API Connection Error: {e}"}
+    except httpx.HTTPStatusError as e:
+        logger.error(
+            f"API HTTP Status Error {e.response.status_code} fetching trends: {e.response.text}"
+        )
+        return {"error": f"API Error {e.response.status_code}: {e.response.text}"}
 
-    total_processed = stats_data.get("total_reviews_processed", "N/A")
-    total_dataset = stats_data.get("total_reviews_in_dataset", "N/A")
-    logger.trace(
-        f"Updating total reviews card. Processed: {total_processed}, Dataset: {total_dataset}"
-    )
-    return [
-        html.H4(
-            f"{total_processed} / {total_dataset}", className="card-title display-6"
-        ),
-        html.P("Reviews Processed / In Dataset", className="card-text"),
-    ]
 
+STAR_COLOR_MAP = {
+    "1": "#d9534f",
+    "2": "#f0ad4e",
+    "3": "#f0ad4e",
+    "4": "#5cb85c",
+    "5": "#5cb85c",
+}
 
-@callback(
-    Output("language-distribution-chart", "figure"),
-    Input("stats-data-store-overview", "children"),
+figure_cache = FigureCache(
+    get_cache("figures") if RENDER_MODE == "server" and get_cache else None
 )
-def update_language_chart(stats_data):
+
+
+def _stats_status_message(stats_data, default_msg):
     if (
         not stats_data
         or stats_data.get("error")
         or stats_data.get("status") == "loading"
     ):
-        msg = "Loading language data..."
         if stats_data and (stats_data.get("error") or stats_data.get("message")):
-            msg = stats_data.get("error") or stats_data.get("message")
-        logger.debug(f"Language chart cannot be updated: {msg}")
-        return create_placeholder_figure(msg)
-
-    lang_dist = stats_data.get("language_distribution")
-    if not lang_dist:
-        logger.debug(
-            "Language chart: No language distribution data available in stats."
-        )
-        return create_placeholder_figure("No language data available")
-    logger.trace(f"Updating language chart with data: {lang_dist}")
+            return stats_data.get("error") or stats_data.get("message")
+        return default_msg
+    return None
+
+
+# plotly and pandas are imported inside the figure builders: only the
+# "server" render mode uses them, and they dominate the page's import time.
+def create_placeholder_figure(message="Loading data..."):
+    import plotly.graph_objects as go
+
+    fig = go.Figure()
+    fig.add_annotation(
+        text=message,
+        xref="paper",
+        yref="paper",
+        x=0.5,
+        y=0.5,
+        showarrow=False,
+        font=dict(size=16),
+    )
+    fig.update_layout(
+        xaxis_visible=False,
+        yaxis_visible=False,
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+    )
+    return fig
+
+
+def cached_placeholder_figure(message):
+    return figure_cache.get_or_build(
+        ("placeholder", message), lambda: create_placeholder_figure(message)
+    )
+
+
+def build_language_figure(lang_dist):
+    import pandas as pd
+    import plotly.express as px
+
     df = pd.DataFrame(
         list(lang_dist.items()), columns=["Language", "Count"]
     ).sort_values("Count", ascending=False)
@@ -246,30 +307,11 @@ def update_language_chart(stats_data):
     return fig
 
 
-@callback(
-    Output("sentiment-distribution-chart", "figure"),
-    Input("stats-data-store-overview", "children"),
-)
-def update_sentiment_chart(stats_data):
-    if (
-        not stats_data
-        or stats_data.get("error")
-        or stats_data.get("status") == "loading"
-    ):
-        msg = "Loading sentiment data..."
-        if stats_data and (stats_data.get("error") or stats_data.get("message")):
-            msg = stats_data.get("error") or stats_data.get("message")
-        logger.debug(f"Sentiment chart cannot be updated: {msg}")
-        return create_placeholder_figure(msg)
-
-    sent_dist = stats_data.get("overall_sentiment_distribution")
-    if not sent_dist:
-        logger.debug(
-            "Sentiment chart: No overall sentiment distribution data available."
-        )
-        return create_placeholder_figure("No overall sentiment data")
-    logger.trace(f"Updating sentiment chart with data: {sent_dist}")
-    df = pd.DataFrame(list(sent_dist.items()), columns=["Stars", "Count"])
+def build_stars_figure(star_dist):
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame(list(star_dist.items()), columns=["Stars", "Count"])
     df["Stars"] = df["Stars"].astype(str)
     df = df.sort_values("Stars")
     fig = px.bar(
@@ -278,101 +320,208 @@ def update_sentiment_chart(stats_data):
         y="Count",
         color="Stars",
         text_auto=True,
-        color_discrete_map={
-            "1": "#d9534f",
-            "2": "#f0ad4e",
-            "3": "#f0ad4e",
-            "4": "#5cb85c",
-            "5": "#5cb85c",
-        },
+        color_discrete_map=STAR_COLOR_MAP,
     )
     fig.update_layout(margin=dict(t=20, b=0, l=0, r=0), xaxis_title="Star Rating")
     return fig
 
 
-@callback(
-    [
-        Output("lang-dropdown-for-sentiment", "options"),
-        Output("lang-dropdown-for-sentiment", "value"),
-    ],
-    Input("stats-data-store-overview", "children"),
-)
-def update_lang_dropdown(stats_data):
-    if (
-        not stats_data
-        or stats_data.get("error")
-        or stats_data.get("status") == "loading"
-    ):
-        logger.debug(
-            "Language dropdown cannot be updated due to missing/error in stats data."
+def build_trend_figure(trend_data):
+    import pandas as pd
+    import plotly.express as px
+
+    df = pd.DataFrame(trend_data["series"])
+    fig = px.line(
+        df,
+        x="value",
+        y="mean_rating",
+        markers=True,
+        hover_data={"count": True, "rated": True},
+        labels={"value": "Time (UTC)", "mean_rating": "Mean Stars"},
+    )
+    fig.update_layout(margin=dict(t=20, b=0, l=0, r=0), yaxis_range=[1, 5])
+    return fig
+
+
+if RENDER_MODE == "server":
+    logger.info(
+        f"Overview Page: server-side rendering with figure cache {figure_cache.info()}."
+    )
+
+    @callback(
+        [
+            Output("total-reviews-title", "children"),
+            Output("total-reviews-subtitle", "children"),
+        ],
+        Input("stats-data-store-overview", "data"),
+    )
+    def update_total_reviews_card(stats_data):
+        msg = _stats_status_message(stats_data, "Loading...")
+        if msg is not None:
+            logger.debug(f"Updating total reviews card with status/error: {msg}")
+            return "Status", msg
+        total_processed = stats_data.get("total_reviews_processed", "N/A")
+        total_dataset = stats_data.get("total_reviews_in_dataset", "N/A")
+        progress = stats_data.get("progress")
+        if stats_data.get("approximate") and progress:
+            return (
+                f"{total_processed} / {total_dataset}",
+                f"Approximate: {progress['fraction']:.1%} analyzed, refining...",
+            )
+        return f"{total_processed} / {total_dataset}", "Reviews Processed / In Dataset"
+
+    @callback(
+        Output("language-distribution-chart", "figure"),
+        Input("stats-data-store-overview", "data"),
+    )
+    def update_language_chart(stats_data):
+        msg = _stats_status_message(stats_data, "Loading language data...")
+        if msg is not None:
+            logger.debug(f"Language chart cannot be updated: {msg}")
+            return cached_placeholder_figure(msg)
+
+        lang_dist = stats_data.get("language_distribution")
+        if not lang_dist:
+            return cached_placeholder_figure("No language data available")
+        return figure_cache.get_or_build(
+            (stats_version(stats_data), "language_distribution"),
+            lambda: build_language_figure(lang_dist),
         )
-        return [], None
-    sent_by_lang = stats_data.get("sentiment_distribution_by_language", {})
-    langs = sorted(list(sent_by_lang.keys()))
-    options = [
-        {"label": lang.upper() if lang else "Unknown", "value": lang} for lang in langs
-    ]
-    default_value = langs[0] if langs else None
-    logger.trace(
-        f"Updating language dropdown. Options: {len(options)}, Default: {default_value}"
+
+    @callback(
+        Output("sentiment-distribution-chart", "figure"),
+        Input("stats-data-store-overview", "data"),
     )
-    return options, default_value
+    def update_sentiment_chart(stats_data):
+        msg = _stats_status_message(stats_data, "Loading sentiment data...")
+        if msg is not None:
+            logger.debug(f"Sentiment chart cannot be updated: {msg}")
+            return cached_placeholder_figure(msg)
 
+        sent_dist = stats_data.get("overall_sentiment_distribution")
+        if not sent_dist:
+            return cached_placeholder_figure("No overall sentiment data")
+        return figure_cache.get_or_build(
+            (stats_version(stats_data), "overall_sentiment"),
+            lambda: build_stars_figure(sent_dist),
+        )
 
-@callback(
-    Output("sentiment-by-language-chart", "figure"),
-    [
-        Input("stats-data-store-overview", "children"),
-        Input("lang-dropdown-for-sentiment", "value"),
-    ],
-)
-def update_sentiment_by_lang_chart(stats_data, selected_language):
-    if (
-        not stats_data
-        or stats_data.get("error")
-        or stats_data.get("status") == "loading"
-    ):
-        msg = "Loading data..."
-        if stats_data and (stats_data.get("error") or stats_data.get("message")):
-            msg = stats_data.get("error") or stats_data.get("message")
-        logger.debug(f"Sentiment by language chart cannot be updated: {msg}")
-        return create_placeholder_figure(msg)
-    if not selected_language:
-        logger.debug("Sentiment by language chart: No language selected.")
-        return create_placeholder_figure("Please select a language")
-
-    sent_by_lang = stats_data.get("sentiment_distribution_by_language", {})
-    lang_data = sent_by_lang.get(selected_language)
-    if not lang_data:
-        logger.debug(
-            f"Sentiment by language chart: No data for selected language '{selected_language}'."
+    @callback(
+        [
+            Output("lang-dropdown-for-sentiment", "options"),
+            Output("lang-dropdown-for-sentiment", "value"),
+        ],
+        Input("stats-data-store-overview", "data"),
+        State("lang-dropdown-for-sentiment", "value"),
+    )
+    def update_lang_dropdown(stats_data, current_value):
+        if _stats_status_message(stats_data, "") is not None:
+            return [], None
+        sent_by_lang = stats_data.get("sentiment_distribution_by_language", {})
+        langs = sorted(sent_by_lang.keys())
+        options = [
+            {"label": lang.upper() if lang else "Unknown", "value": lang}
+            for lang in langs
+        ]
+        if current_value in langs:
+            return options, current_value
+        return options, langs[0] if langs else None
+
+    @callback(
+        Output("sentiment-by-language-chart", "figure"),
+        [
+            Input("stats-data-store-overview", "data"),
+            Input("lang-dropdown-for-sentiment", "value"),
+        ],
+    )
+    def update_sentiment_by_lang_chart(stats_data, selected_language):
+        msg = _stats_status_message(stats_data, "Loading data...")
+        if msg is not None:
+            logger.debug(f"Sentiment by language chart cannot be updated: {msg}")
+            return cached_placeholder_figure(msg)
+        if not selected_language:
+            return cached_placeholder_figure("Please select a language")
+
+        sent_by_lang = stats_data.get("sentiment_distribution_by_language", {})
+        lang_data = sent_by_lang.get(selected_language)
+        if not lang_data:
+            return cached_placeholder_figure(
+                f"No sentiment data for {selected_language.upper()}"
+            )
+        return figure_cache.get_or_build(
+            (stats_version(stats_data), "sentiment_by_language", selected_language),
+            lambda: build_stars_figure(lang_data),
         )
-        return create_placeholder_figure(
-            f"No sentiment data for {selected_language.upper()}"
+
+    @callback(
+        Output("sentiment-trend-chart", "figure"),
+        Input("trend-data-store-overview", "data"),
+    )
+    def update_trend_chart(trend_data):
+        if not trend_data or trend_data.get("error") or trend_data.get("status"):
+            msg = (trend_data or {}).get("error") or (trend_data or {}).get("message")
+            return cached_placeholder_figure(msg or "Loading trend data...")
+        if not trend_data.get("series"):
+            return cached_placeholder_figure("No reviews in the trend window")
+        series = trend_data["series"]
+        return figure_cache.get_or_build(
+            (
+                "sentiment_trend",
+                trend_data["granularity"],
+                series[0]["value"],
+                series[-1]["value"],
+                trend_data["total"]["count"],
+                trend_data["total"]["mean_rating"],
+            ),
+            lambda: build_trend_figure(trend_data),
         )
 
-    logger.trace(
-        f"Updating sentiment by language chart for '{selected_language}'. Data: {lang_data}"
+else:
+    # Clientside rendering (see assets/overview_charts.js)
+    clientside_callback(
+        ClientsideFunction(namespace="overview", function_name="totalReviews"),
+        [
+            Output("total-reviews-title", "children"),
+            Output("total-reviews-subtitle", "children"),
+        ],
+        Input("stats-data-store-overview", "data"),
     )
-    df = pd.DataFrame(list(lang_data.items()), columns=["Stars", "Count"])
-    df["Stars"] = df["Stars"].astype(str)
-    df = df.sort_values("Stars")
-    fig = px.bar(
-        df,
-        x="Stars",
-        y="Count",
-        color="Stars",
-        text_auto=True,
-        color_discrete_map={
-            "1": "#d9534f",
-            "2": "#f0ad4e",
-            "3": "#f0ad4e",
-            "4": "#5cb85c",
-            "5": "#5cb85c",
-        },
+
+    clientside_callback(
+        ClientsideFunction(namespace="overview", function_name="languageChart"),
+        Output("language-distribution-chart", "figure"),
+        Input("stats-data-store-overview", "data"),
     )
-    fig.update_layout(margin=dict(t=20, b=0, l=0, r=0), xaxis_title="Star Rating")
-    return fig
 
+    clientside_callback(
+        ClientsideFunction(namespace="overview", function_name="sentimentChart"),
+        Output("sentiment-distribution-chart", "figure"),
+        Input("stats-data-store-overview", "data"),
+    )
+
+    clientside_callback(
+        ClientsideFunction(namespace="overview", function_name="languageDropdown"),
+        [
+            Output("lang-dropdown-for-sentiment", "options"),
+            Output("lang-dropdown-for-sentiment", "value"),
+        ],
+        Input("stats-data-store-overview", "data"),
+        State("lang-dropdown-for-sentiment", "value"),
+    )
 
-from dash import callback_context  # Import callback_context
+    clientside_callback(
+        ClientsideFunction(
+            namespace="overview", function_name="sentimentByLanguageChart"
+        ),
+        Output("sentiment-by-language-chart", "figure"),
+        [
+            Input("stats-data-store-overview", "data"),
+            Input("lang-dropdown-for-sentiment", "value"),
+        ],
+    )
+
+    clientside_callback(
+        ClientsideFunction(namespace="overview", function_name="trendChart"),
+        Output("sentiment-trend-chart", "figure"),
+        Input("trend-data-store-overview", "data"),
+    )
@@ -1,10 +1,17 @@
-from dash import html, dcc, callback, Input, Output, State  
+from dash import html, dcc, callback, dash_table, Input, Output, State
 import dash_bootstrap_components as dbc
 import httpx
+import base64
+import csv
+import io
 import json
+import statistics
 import sys
+import time
 from pathlib import Path
-from loguru import logger  
+from loguru import logger
+
+from ..components.background import background_callback_manager
 
 DASH_TESTING_DIR = Path(__file__).resolve().parent
 DASH_APP_DIR_T = DASH_TESTING_DIR.parent
@@ -28,6 +35,13 @@ except ImportError as e:
     )
 
 
+MAX_BULK_REVIEWS = 2000
+MAX_UPLOAD_BYTES = 2 * 1024 * 1024
+BULK_CHUNK_SIZE = 25
+# Times a chunk is resent after a 429, waiting Retry-After seconds each time.
+BULK_MAX_RETRIES = 5
+
+
 layout = dbc.Container(
     [
         dbc.Row(dbc.Col(html.H3("Test Models"), width=12, className="mb-3 mt-3")),
@@ -63,6 +77,110 @@ layout = dbc.Container(
                 md=12,
             )
         ),
+        html.Hr(className="my-4"),
+        dbc.Row(dbc.Col(html.H4("Bulk Mode"), width=12, className="mb-3")),
+        dbc.Row(
+            [
+                dbc.Col(
+                    [
+                        dbc.Label(
+                            "Paste one review per line:",
+                            html_for="bulk-input-text-testing",
+                        ),
+                        dcc.Textarea(
+                            id="bulk-input-text-testing",
+                            placeholder="One customer review per line...",
+                            style={"width": "100%", "height": 160},
+                            className="mb-2 form-control",
+                        ),
+                    ],
+                    md=8,
+                ),
+                dbc.Col(
+                    [
+                        dbc.Label("...or upload a .txt / .csv file:"),
+                        dcc.Upload(
+                            id="bulk-upload-testing",
+                            children=html.Div(
+                                ["Drag and drop or ", html.A("select a file")]
+                            ),
+                            max_size=MAX_UPLOAD_BYTES,
+                            style={
+                                "width": "100%",
+                                "height": "60px",
+                                "lineHeight": "60px",
+                                "borderWidth": "1px",
+                                "borderStyle": "dashed",
+                                "borderRadius": "5px",
+                                "textAlign": "center",
+                            },
+                        ),
+                        html.Small(
+                            f"CSV files use the 'review_text' column (or the first column). Max {MAX_BULK_REVIEWS} reviews.",
+                            className="text-muted",
+                        ),
+                        html.Div(id="bulk-upload-filename-testing", className="mt-1"),
+                    ],
+                    md=4,
+                ),
+            ]
+        ),
+        dbc.Row(
+            dbc.Col(
+                [
+                    dbc.Button(
+                        "Run Bulk Analysis",
+                        id="bulk-run-button-testing",
+                        color="success",
+                        n_clicks=0,
+                        className="mt-2 me-2",
+                    ),
+                    dbc.Button(
+                        "Cancel",
+                        id="bulk-cancel-button-testing",
+                        color="secondary",
+                        disabled=True,
+                        className="mt-2",
+                    ),
+                    dbc.Progress(
+                        id="bulk-progress-testing",
+                        value=0,
+                        striped=True,
+                        className="mt-3",
+                    ),
+                    html.Div(id="bulk-stats-testing", className="mt-2"),
+                ],
+                md=12,
+            ),
+            className="mb-3",
+        ),
+        dbc.Row(
+            dbc.Col(
+                dash_table.DataTable(
+                    id="bulk-results-table-testing",
+                    columns=[
+                        {"name": "#", "id": "index"},
+                        {"name": "Review", "id": "text"},
+                        {"name": "Language", "id": "language"},
+                        {"name": "Lang. Conf.", "id": "language_confidence"},
+                        {"name": "Stars", "id": "stars"},
+                        {"name": "Sent. Conf.", "id": "sentiment_confidence"},
+                        {"name": "Latency (ms)", "id": "latency_ms"},
+                    ],
+                    data=[],
+                    page_size=25,
+                    style_cell={
+                        "textAlign": "left",
+                        "maxWidth": "400px",
+                        "overflow": "hidden",
+                        "textOverflow": "ellipsis",
+                    },
+                    style_table={"overflowX": "auto"},
+                ),
+                md=12,
+            ),
+            className="mb-4",
+        ),
     ],
     fluid=True,
 )
@@ -197,3 +315,163 @@ def handle_analyze_review_testing(n_clicks, review_text):
         return dbc.Alert(
             f"An unexpected error occurred: {str(e)}", color="danger", className="mt-3"
         )
+
+
+# --- Bulk mode ---
+def _parse_bulk_input(text, upload_contents, upload_filename):
+    """Return the list of non-empty reviews from the textarea and/or upload."""
+    reviews = [line.strip() for line in (text or "").splitlines() if line.strip()]
+    if upload_contents:
+        _, content_string = upload_contents.split(",", 1)
+        decoded = base64.b64decode(content_string).decode("utf-8", errors="replace")
+        if (upload_filename or "").lower().endswith(".csv"):
+            reader = csv.reader(io.StringIO(decoded))
+            header = next(reader, [])
+            column = header.index("review_text") if "review_text" in header else 0
+            if "review_text" not in header and header:
+                reviews.append(header[0].strip())
+            reviews.extend(
+                row[column].strip()
+                for row in reader
+                if len(row) > column and row[column].strip()
+            )
+        else:
+            reviews.extend(
+                line.strip() for line in decoded.splitlines() if line.strip()
+            )
+    return reviews[:MAX_BULK_REVIEWS]
+
+
+def _bulk_stats_summary(rows, total, wall_seconds, batch_ms):
+    if not rows:
+        return "No results yet."
+    latencies = sorted(r["latency_ms"] for r in rows)
+    p95_index = min(len(latencies) - 1, int(round(0.95 * (len(latencies) - 1))))
+    throughput = len(rows) / wall_seconds if wall_seconds > 0 else 0.0
+    return [
+        html.Strong(f"{len(rows)} / {total} reviews analyzed. "),
+        f"Throughput: {throughput:.1f} reviews/s · ",
+        f"Latency per review p50: {statistics.median(latencies):.1f} ms, ",
+        f"p95: {latencies[p95_index]:.1f} ms · ",
+        f"Mean batch round trip: {statistics.mean(batch_ms):.0f} ms",
+    ]
+
+
+def _to_table_row(index, item):
+    lang_info = item.get("language") or {}
+    sent_info = item.get("sentiment") or {}
+    return {
+        "index": index,
+        "text": item.get("text", ""),
+        "language": str(lang_info.get("language", "N/A")).upper(),
+        "language_confidence": lang_info.get("confidence"),
+        "stars": sent_info.get("stars"),
+        "sentiment_confidence": sent_info.get("confidence"),
+        "latency_ms": round(item.get("latency_ms", 0.0), 2),
+    }
+
+
+def _post_with_backoff(client: httpx.Client, url: str, payload) -> httpx.Response:
+    for _ in range(BULK_MAX_RETRIES):
+        response = client.post(url, json=payload)
+        if response.status_code != 429:
+            return response
+        delay = float(response.headers.get("Retry-After", 1))
+        logger.info(f"Backend overloaded; retrying chunk in {delay:.0f}s.")
+        time.sleep(delay)
+    return client.post(url, json=payload)
+
+
+def run_bulk_analysis(set_progress, n_clicks, text, upload_contents, upload_filename):
+    reviews = _parse_bulk_input(text, upload_contents, upload_filename)
+    logger.info(
+        f"Bulk analysis started (n_clicks: {n_clicks}) with {len(reviews)} reviews."
+    )
+    if not reviews:
+        return [], dbc.Alert("Please paste or upload some reviews.", color="warning"), 0
+
+    rows, batch_ms = [], []
+    started = time.perf_counter()
+    with httpx.Client(timeout=60.0) as client:
+        for offset in range(0, len(reviews), BULK_CHUNK_SIZE):
+            chunk = reviews[offset : offset + BULK_CHUNK_SIZE]
+            batch_started = time.perf_counter()
+            try:
+                response = _post_with_backoff(
+                    client, f"{API_BASE_URL}/analyze_reviews", {"texts": chunk}
+                )
+                response.raise_for_status()
+            except httpx.HTTPError as e:
+                logger.error(f"Bulk analysis aborted at offset {offset}: {e}")
+                summary = _bulk_stats_summary(
+                    rows, len(reviews), time.perf_counter() - started, batch_ms or [0]
+                )
+                return (
+                    rows,
+                    [dbc.Alert(f"Bulk analysis stopped: {e}", color="danger"), summary],
+                    100 * len(rows) // len(reviews),
+                )
+            batch_ms.append((time.perf_counter() - batch_started) * 1000)
+            rows.extend(
+                _to_table_row(offset + i + 1, item)
+                for i, item in enumerate(response.json().get("results", []))
+            )
+            set_progress(
+                (
+                    rows,
+                    _bulk_stats_summary(
+                        rows, len(reviews), time.perf_counter() - started, batch_ms
+                    ),
+                    100 * len(rows) // len(reviews),
+                )
+            )
+
+    wall_seconds = time.perf_counter() - started
+    logger.success(
+        f"Bulk analysis finished: {len(rows)} reviews in {wall_seconds:.2f}s."
+    )
+    return rows, _bulk_stats_summary(rows, len(reviews), wall_seconds, batch_ms), 100
+
+
+_bulk_outputs = [
+    Output("bulk-results-table-testing", "data"),
+    Output("bulk-stats-testing", "children"),
+    Output("bulk-progress-testing", "value"),
+]
+_bulk_inputs = [
+    Input("bulk-run-button-testing", "n_clicks"),
+    State("bulk-input-text-testing", "value"),
+    State("bulk-upload-testing", "contents"),
+    State("bulk-upload-testing", "filename"),
+]
+
+if background_callback_manager is not None:
+    callback(
+        *_bulk_outputs,
+        *_bulk_inputs,
+        background=True,
+        manager=background_callback_manager,
+        progress=_bulk_outputs,
+        running=[
+            (Output("bulk-run-button-testing", "disabled"), True, False),
+            (Output("bulk-cancel-button-testing", "disabled"), False, True),
+        ],
+        cancel=[Input("bulk-cancel-button-testing", "n_clicks")],
+        prevent_initial_call=True,
+    )(run_bulk_analysis)
+else:
+
+    @callback(*_bulk_outputs, *_bulk_inputs, prevent_initial_call=True)
+    def run_bulk_analysis_sync(n_clicks, text, upload_contents, upload_filename):
+        return run_bulk_analysis(
+            lambda _: None, n_clicks, text, upload_contents, upload_filename
+        )
+
+
+@callback(
+    Output("bulk-upload-filename-testing", "children"),
+    Input("bulk-upload-testing", "filename"),
+    prevent_initial_call=True,
+)
+def show_bulk_upload_filename(filename):
+    return html.Small(f"Loaded file: {filename}") if filename else None
@@ -0,0 +1,58 @@
+import json
+
+import pytest
+from fastapi import HTTPException
+from pydantic import SecretStr
+
+from backend.app.config import ModelConfig, settings
+from backend.app.main import require_admin
+from backend.app.services.model_service import MODELS_STATE_KEY, ModelService
+from backend.app.storage.state_store import SharedStateStore
+
+
+def test_admin_endpoints_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(settings.backend, "admin_token", None)
+    for header in (None, "", "anything"):
+        with pytest.raises(HTTPException) as exc:
+            require_admin(header)
+        assert exc.value.status_code == 403
+
+
+def test_admin_token_must_match(monkeypatch):
+    monkeypatch.setattr(settings.backend, "admin_token", SecretStr("s3cret"))
+    for header in (None, "", "s3cre", "s3cret2"):
+        with pytest.raises(HTTPException) as exc:
+            require_admin(header)
+        assert exc.value.status_code == 403
+    require_admin("s3cret")
+
+
+def test_empty_admin_token_disables_endpoints(monkeypatch):
+    monkeypatch.setattr(settings.backend, "admin_token", SecretStr(""))
+    with pytest.raises(HTTPException) as exc:
+        require_admin("")
+    assert exc.value.status_code == 403
+
+
+def test_secrets_are_masked_in_settings_dump(monkeypatch):
+    monkeypatch.setattr(settings.backend, "admin_token", SecretStr("s3cret"))
+    config = ModelConfig(type="api", **{"class": "X"}, api_key="key-123")
+    monkeypatch.setattr(settings.models, "sentiment", config)
+    dump = settings.model_dump_json()
+    assert "s3cret" not in dump and "key-123" not in dump
+
+
+def test_published_model_override_omits_api_key(tmp_path, monkeypatch):
+    configured = ModelConfig(type="api", **{"class": "X"}, api_key="configured")
+    monkeypatch.setattr(settings.models, "sentiment", configured)
+    service = ModelService.__new__(ModelService)
+    service.state_store = SharedStateStore(str(tmp_path / "state.sqlite3"))
+    swapped = ModelConfig(type="api", **{"class": "Y"}, api_key="swapped-key")
+    service._publish_override("sentiment", swapped)
+
+    stored = service.state_store.get(MODELS_STATE_KEY)["value"]
+    assert "api_key" not in stored["sentiment"]["config"]
+    assert "swapped-key" not in json.dumps(stored)
+    shared = service._shared_overrides()["sentiment"]
+    assert shared.class_name == "Y"
+    assert shared.api_key.get_secret_value() == "configured"
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.admission import AdmissionController, Overloaded
+
+
+def controller(**overrides):
+    options = dict(
+        max_in_flight=1,
+        max_queue=1,
+        max_queue_wait_seconds=5.0,
+        initial_service_seconds=0.01,
+    )
+    options.update(overrides)
+    return AdmissionController("test", **options)
+
+
+async def hold(admission, gate, log, name):
+    try:
+        async with admission.admit():
+            log.append(name)
+            await gate.wait()
+    except Overloaded as exc:
+        log.append((name, exc.reason, exc.retry_after))
+
+
+def test_full_queue_rejects_newcomer():
+    async def scenario():
+        admission = controller()
+        gate, log = asyncio.Event(), []
+        tasks = [asyncio.create_task(hold(admission, gate, log, n)) for n in "abc"]
+        await asyncio.sleep(0)
+        assert log == ["a", ("c", "queue_full", 1)]
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert log[-1] == "b"
+        assert admission.stats()["rejected"] == {"queue_full": 1}
+        assert admission.in_flight == 0 and admission.admitted == 2
+
+    asyncio.run(scenario())
+
+
+def test_drop_oldest_sheds_the_longest_waiter():
+    async def scenario():
+        admission = controller(shed_policy="drop_oldest")
+        gate, log = asyncio.Event(), []
+        tasks = [asyncio.create_task(hold(admission, gate, log, n)) for n in "abc"]
+        await asyncio.sleep(0.01)
+        assert log == ["a", ("b", "dropped", 1)]
+        gate.set()
+        await asyncio.gather(*tasks)
+        assert log[-1] == "c"
+
+    asyncio.run(scenario())
+
+
+def test_predicted_wait_and_timeout_reject():
+    async def scenario():
+        slow = controller(max_queue=5, initial_service_seconds=10.0)
+        gate, log = asyncio.Event(), []
+        tasks = [asyncio.create_task(hold(slow, gate, log, n)) for n in "ab"]
+        await asyncio.sleep(0)
+        assert log == ["a", ("b", "predicted_wait", 10)]
+
+        waiting = controller(max_queue=5, max_queue_wait_seconds=0.05)
+        other_log = []
+        tasks += [asyncio.create_task(hold(waiting, gate, other_log, n)) for n in "xy"]
+        await asyncio.sleep(0.2)
+        assert other_log == ["x", ("y", "timeout", 1)]
+        assert waiting.stats()["queued"] == 0
+        gate.set()
+        await asyncio.gather(*tasks)
+
+    asyncio.run(scenario())
+
+
+def test_service_time_moving_average():
+    async def scenario():
+        admission = controller(initial_service_seconds=1.0)
+        async with admission.admit():
+            pass
+        assert admission.service_seconds == pytest.approx(0.8, abs=0.01)
+        assert admission.estimated_wait(2) == pytest.approx(1.6, abs=0.02)
+
+    asyncio.run(scenario())
+
+
+def test_unknown_shed_policy():
+    with pytest.raises(ValueError):
+        controller(shed_policy="random")
@@ -0,0 +1,144 @@
+import time
+
+import pytest
+
+from backend.app.core import cache_backends
+from backend.app.core.cache_backends import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    NullCacheBackend,
+    _EvictionIndex,
+)
+
+
+def fill(cache, keys):
+    for key in keys:
+        cache.set(key, key.upper())
+
+
+def test_lru_evicts_least_recently_used():
+    cache = MemoryCacheBackend("t", policy="lru", max_entries=3)
+    fill(cache, "abc")
+    assert cache.get("a") == "A"
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+    assert cache.evictions == 1
+
+
+def test_lfu_evicts_least_frequently_used():
+    cache = MemoryCacheBackend("t", policy="lfu", max_entries=3)
+    fill(cache, "abc")
+    for key, hits in (("a", 3), ("b", 1), ("c", 2)):
+        for _ in range(hits):
+            cache.get(key)
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    cache.set("e", "E")
+    # "d" has no hits but was just added before "e": it is the next victim.
+    assert cache.get("d") is None
+    assert [cache.get(k) for k in "ace"] == ["A", "C", "E"]
+
+
+def test_lfu_ties_go_to_the_oldest_entry():
+    cache = MemoryCacheBackend("t", policy="lfu", max_entries=2)
+    fill(cache, "ab")
+    cache.set("c", "C")
+    assert cache.get("a") is None
+    assert cache.get("b") == "B"
+
+
+def test_lfu_keeps_the_entry_just_added():
+    cache = MemoryCacheBackend("t", policy="lfu", max_entries=3)
+    fill(cache, "abc")
+    for key in "abc":
+        cache.get(key)
+    cache.set("d", "D")
+    assert cache.get("d") == "D"
+    assert sum(cache.get(k) is not None for k in "abc") == 2
+
+
+def test_lfu_index_tracks_minimum_through_removals():
+    index = _EvictionIndex("lfu")
+    for key in "abc":
+        index.add(key)
+    for key, hits in (("a", 2), ("b", 3), ("c", 5)):
+        for _ in range(hits):
+            index.touch(key)
+    assert index.victim() == "a"
+    index.remove("a")
+    assert index.victim() == "b"
+    index.add("b")  # Re-adding resets the count
+    assert index.victim() == "b"
+    index.clear()
+    assert index.victim() is None
+
+
+def test_lfu_set_is_constant_time_when_full():
+    max_entries = 50000
+    cache = MemoryCacheBackend("t", policy="lfu", max_entries=max_entries)
+    for i in range(max_entries):
+        cache.set(str(i), i)
+        cache.get(str(i))
+    started = time.perf_counter()
+    for i in range(max_entries, max_entries + 2000):
+        cache.set(str(i), i)
+    per_set = (time.perf_counter() - started) / 2000
+    assert per_set < 1e-3
+    assert cache.info()["entries"] == max_entries
+
+
+def test_ttl_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_backends.time, "time", lambda: now[0])
+    cache = MemoryCacheBackend("t", policy="ttl", ttl_seconds=10, max_entries=2)
+    cache.set("a", 1)
+    now[0] += 5
+    cache.set("b", 2)
+    now[0] += 3
+    cache.set("c", 3)
+    assert cache.get("a") is None  # Oldest evicted first
+    now[0] += 8
+    assert cache.get("b") is None  # Expired
+    assert cache.get("c") == 3
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        MemoryCacheBackend("t", policy="fifo")
+
+
+def test_null_backend_stores_nothing():
+    cache = NullCacheBackend("t")
+    cache.set("a", 1)
+    assert cache.get("a") is None
+    assert cache.misses == 1
+
+
+def test_disk_backend_round_trip_and_byte_limit(tmp_path):
+    cache = DiskCacheBackend("t", directory=str(tmp_path), policy="lru")
+    cache.set("a", {"x": [1, 2, 3]})
+    cache.set("weird/key with spaces", "v")
+    assert cache.get("a") == {"x": [1, 2, 3]}
+    assert cache.get("weird/key with spaces") == "v"
+    assert cache.delete("a") and cache.get("a") is None
+
+    size = cache.info()["bytes"]
+    bounded = DiskCacheBackend(
+        "b", directory=str(tmp_path / "b"), policy="lfu", max_bytes=size * 2
+    )
+    for key in "abc":
+        bounded.set(key, "v")
+    assert bounded.info()["bytes"] <= size * 2
+    assert bounded.get("c") == "v"
+    # A second instance on the same directory sees the surviving files.
+    reopened = DiskCacheBackend("b", directory=str(tmp_path / "b"))
+    assert reopened.info()["entries"] == bounded.info()["entries"]
+
+
+def test_disk_backend_quarantines_corrupt_files(tmp_path):
+    cache = DiskCacheBackend("t", directory=str(tmp_path))
+    cache.set("a", 1)
+    cache.path_for("a").write_bytes(b"garbage")
+    assert cache.get("a") is None
+    assert (tmp_path / "a.corrupt").exists()
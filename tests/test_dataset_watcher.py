@@ -0,0 +1,35 @@
+from backend.app.services.dataset_watcher import file_state, is_replaced, read_csv_rows
+from backend.app.storage.results_store import ROW_KEY_FIELD, row_key
+
+
+def test_appended_rows_continue_the_row_keys_of_the_file(tmp_path):
+    path = tmp_path / "reviews.csv"
+    path.write_text("review_id,review_text\n1,first\n,second\n")
+    records, end = read_csv_rows(path)
+    assert [r[ROW_KEY_FIELD] for r in records] == [
+        row_key(str(path), 0),
+        row_key(str(path), 1),
+    ]
+    state = file_state(path, end, len(records))
+
+    with open(path, "a") as f:
+        f.write("1,third\n")
+    assert not is_replaced(path, state)
+    appended, _ = read_csv_rows(path, state["offset"], first_row=state["rows"])
+    assert [r["review_text"] for r in appended] == ["third"]
+    assert appended[0][ROW_KEY_FIELD] == row_key(str(path), 2)
+
+
+def test_rewritten_file_is_detected_as_replaced(tmp_path):
+    path = tmp_path / "reviews.csv"
+    path.write_text("review_id,review_text\n1,first\n2,second\n")
+    records, end = read_csv_rows(path)
+    state = file_state(path, end, len(records))
+    path.write_text("review_id,review_text\n9,other\n")
+    assert is_replaced(path, state)
+
+
+def test_file_without_review_text_is_rejected(tmp_path):
+    path = tmp_path / "reviews.csv"
+    path.write_text("review_id,body\n1,first\n")
+    assert read_csv_rows(path)[0] is None
@@ -0,0 +1,94 @@
+import random
+
+import numpy as np
+
+from backend.app.config import DedupConfig
+from backend.app.core.dedup import (
+    Deduplicator,
+    MinHasher,
+    deduplicate,
+    lsh_params,
+    normalize_text,
+)
+
+BASE = (
+    "I bought this blender last month and it has worked perfectly every "
+    "single morning, crushing ice and frozen fruit without any trouble at all."
+)
+
+
+def random_text(rng: random.Random) -> str:
+    words = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf"]
+    return " ".join(f"{rng.choice(words)}{rng.randint(0, 999)}" for _ in range(15))
+
+
+def test_normalize_text():
+    assert normalize_text("  Good   PRODUCT!! ") == "good product"
+
+
+def test_symbol_only_texts_keep_their_symbols():
+    assert normalize_text(" 😡  😡 ") == "😡 😡"
+    assert normalize_text("!!!") == "!!!"
+    result = deduplicate(["😡😡", "❤️", "!!!", "😡😡", "?"], DedupConfig())
+    assert result.groups == [[0, 3], [1], [2], [4]]
+
+
+def test_exact_duplicates_after_normalization():
+    result = deduplicate(
+        ["Good product!", "Awful", "good product", "GOOD PRODUCT."],
+        DedupConfig(near_duplicates=False),
+    )
+    assert result.groups == [[0, 2, 3], [1]]
+    assert result.exact_duplicates == 2
+    assert result.near_duplicates == 0
+    assert result.rows == 4
+
+
+def test_near_duplicates_join_the_first_seen_text():
+    texts = [
+        "Totally unrelated review about shipping delays.",
+        BASE,
+        BASE.replace("perfectly", "perfecty"),
+        BASE + " Recommended!",
+    ]
+    result = deduplicate(texts, DedupConfig())
+    assert result.groups == [[0], [1, 2, 3]]
+    assert result.near_duplicates == 2
+
+
+def test_unrelated_texts_are_never_merged():
+    rng = random.Random(7)
+    texts = [random_text(rng) for _ in range(300)]
+    result = deduplicate(texts, DedupConfig())
+    assert len(result.groups) == 300
+    assert result.near_duplicates == 0
+
+
+def test_disabled_dedup_keeps_every_row():
+    texts = ["same", "same", "same"]
+    assert deduplicate(texts, DedupConfig(enabled=False)).groups == [[0], [1], [2]]
+    assert deduplicate(texts).groups == [[0], [1], [2]]
+
+
+def test_similarity_estimates_jaccard():
+    hasher = MinHasher(num_perm=256)
+    a = normalize_text(BASE)
+    b = normalize_text(BASE.replace("every single morning", "most mornings"))
+    shingles = lambda t: {t[i : i + 5] for i in range(len(t) - 4)}  # noqa: E731
+    jaccard = len(shingles(a) & shingles(b)) / len(shingles(a) | shingles(b))
+    estimate = Deduplicator.similarity(hasher.signature(a), hasher.signature(b))
+    assert abs(estimate - jaccard) < 0.1
+
+
+def test_signatures_are_deterministic_and_handle_short_texts():
+    hasher = MinHasher(num_perm=32)
+    assert np.array_equal(hasher.signature("abc"), MinHasher(32).signature("abc"))
+    assert hasher.signature("").shape == (32,)
+    assert not np.array_equal(hasher.signature("abc"), hasher.signature("abd"))
+
+
+def test_lsh_params_fit_the_permutations_and_threshold():
+    for threshold in (0.5, 0.85, 0.95):
+        bands, rows = lsh_params(threshold, 128)
+        assert bands * rows <= 128
+        assert abs((1 / bands) ** (1 / rows) - threshold) < 0.1
@@ -0,0 +1,49 @@
+import multiprocessing
+
+from backend.app.core.process_lock import ProcessLock
+
+
+def _try_acquire(lock_path, result):
+    result.put(ProcessLock(lock_path).acquire())
+
+
+def _acquire_in_child(lock_path) -> bool:
+    result = multiprocessing.Queue()
+    child = multiprocessing.Process(target=_try_acquire, args=(lock_path, result))
+    child.start()
+    child.join(10)
+    return result.get(timeout=5)
+
+
+def test_lock_is_exclusive_within_a_process(tmp_path):
+    path = str(tmp_path / "run.lock")
+    first, second = ProcessLock(path), ProcessLock(path)
+    assert first.acquire()
+    assert not second.acquire()
+    first.release()
+    assert second.acquire()
+    second.release()
+
+
+def test_lock_is_not_reentrant(tmp_path):
+    lock = ProcessLock(str(tmp_path / "run.lock"))
+    assert lock.acquire()
+    assert not lock.acquire()
+    assert lock.held
+    lock.release()
+    assert not lock.held
+    assert lock.acquire()
+    lock.release()
+
+
+def test_lock_is_exclusive_across_processes(tmp_path):
+    path = str(tmp_path / "leader.lock")
+    lock = ProcessLock(path)
+    assert lock.acquire()
+    assert not _acquire_in_child(path)
+    lock.release()
+    assert _acquire_in_child(path)
+
+
+def test_release_without_acquire_is_a_no_op(tmp_path):
+    ProcessLock(str(tmp_path / "run.lock")).release()
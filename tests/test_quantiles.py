@@ -0,0 +1,81 @@
+import random
+
+import pytest
+
+from backend.app.core import quantiles
+from backend.app.core.quantiles import KLLSketch, percentile_label
+
+
+@pytest.fixture(autouse=True)
+def seeded_rng(monkeypatch):
+    monkeypatch.setattr(quantiles, "_rng", random.Random(7))
+
+
+def sketch_of(values, k=50):
+    sketch = KLLSketch(k=k)
+    for value in values:
+        sketch.update(value)
+    return sketch
+
+
+def total_weight(sketch):
+    return sum(len(items) << level for level, items in enumerate(sketch.compactors))
+
+
+def test_quantiles_within_rank_error():
+    values = list(range(20000))
+    random.Random(1).shuffle(values)
+    sketch = sketch_of(values, k=200)
+    assert sketch.size < 1000
+    for q in (0.1, 0.5, 0.9, 0.99):
+        assert abs(sketch.quantile(q) / len(values) - q) < 0.02
+    assert sketch.quantile(0) == 0 and sketch.quantile(1) == 19999
+
+
+def test_merge_is_associative_and_commutative():
+    rng = random.Random(2)
+    parts = [[rng.random() for _ in range(3000)] for _ in range(3)]
+
+    def shard(i):
+        # merge works in place, so every grouping starts from fresh shards
+        return sketch_of(parts[i])
+
+    left = shard(0).merge(shard(1)).merge(shard(2))
+    right = shard(0).merge(shard(1).merge(shard(2)))
+    reordered = shard(2).merge(shard(0)).merge(shard(1))
+    everything = sorted(v for part in parts for v in part)
+    for merged in (left, right, reordered):
+        assert merged.n == 9000
+        assert total_weight(merged) == 9000
+        assert (merged.min, merged.max) == (everything[0], everything[-1])
+        for q in (0.25, 0.5, 0.75):
+            rank = sum(v <= merged.quantile(q) for v in everything) / 9000
+            assert abs(rank - q) < 0.05
+
+
+def test_small_merges_are_exact():
+    a, b, c = sketch_of([3, 1]), sketch_of([2]), sketch_of([5, 4])
+    left = KLLSketch(k=50).merge(a).merge(b).merge(c)
+    right = KLLSketch(k=50).merge(c).merge(KLLSketch(k=50).merge(b).merge(a))
+    assert sorted(left.compactors[0]) == sorted(right.compactors[0]) == [1, 2, 3, 4, 5]
+    assert left.quantile(0.5) == right.quantile(0.5) == 3
+
+
+def test_merge_with_empty_sketch_is_identity():
+    sketch = sketch_of([1.0, 2.0])
+    assert sketch.merge(KLLSketch()).to_dict() == sketch_of([1.0, 2.0]).to_dict()
+    assert KLLSketch().quantiles([0.5, 0.9]) == [None, None]
+
+
+def test_dict_round_trip():
+    sketch = sketch_of(random.Random(3).random() for _ in range(5000))
+    restored = KLLSketch.from_dict(sketch.to_dict())
+    assert restored.to_dict() == sketch.to_dict()
+    assert restored.quantiles([0.1, 0.5]) == sketch.quantiles([0.1, 0.5])
+    restored.update(0.5)
+    assert restored.n == 5001
+
+
+def test_percentile_label():
+    assert percentile_label(0.5) == "p50"
+    assert percentile_label(0.995) == "p99.5"
@@ -0,0 +1,172 @@
+import sqlite3
+
+import pytest
+
+from backend.app.storage.results_store import (
+    ROW_KEY_FIELD,
+    ReviewResultsStore,
+    SQLResultsStore,
+    decode_cursor,
+    encode_cursor,
+    row_key,
+)
+
+
+def review(i, **overrides):
+    return {
+        ROW_KEY_FIELD: row_key("reviews.csv", i),
+        "review_id": f"R{i}",
+        "product_id": f"P{i % 3}",
+        "text_preview": f"text {i}...",
+        "detected_language": "en" if i % 2 else "fr",
+        "language_confidence": 0.9,
+        "predicted_sentiment_stars": i % 5 + 1,
+        "sentiment_confidence": round(0.5 + (i % 10) / 20, 2),
+        **overrides,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ReviewResultsStore(str(tmp_path / "results.db"), batch_size=7)
+
+
+def test_rows_without_review_id_are_all_kept(store):
+    rows = [review(i) for i in range(50)]
+    for row in rows:
+        del row["review_id"]
+    assert store.replace_all(rows) == 50
+    assert store.count() == 50
+    # Without row keys either, each row still gets its own key.
+    assert store.replace_all([{"review_id": float("nan")} for _ in range(20)]) == 20
+    assert store.count() == 20
+
+
+def test_review_ids_repeated_across_files_are_all_kept(store):
+    rows = [review(i) for i in range(5)]
+    rows += [
+        review(i, **{ROW_KEY_FIELD: row_key("drop/batch.csv", i)}) for i in range(5)
+    ]
+    store.replace_all(rows)
+    assert store.count() == 10
+    page = store.query(limit=100)
+    assert [item["review_id"] for item in page["items"]] == [
+        f"R{i}" for i in range(5)
+    ] * 2
+
+
+def test_upsert_updates_rows_in_place_and_appends_new_ones(store):
+    store.replace_all([review(i) for i in range(10)])
+    store.upsert([review(3, predicted_sentiment_stars=5), review(10)])
+    assert store.count() == 11
+    items = store.query(limit=100)["items"]
+    assert items[3]["predicted_sentiment_stars"] == 5
+    assert items[-1]["review_id"] == "R10"
+
+
+def test_replace_all_replaces_everything(store):
+    store.replace_all([review(i) for i in range(10)])
+    store.replace_all([review(i) for i in range(3)])
+    assert store.count() == 3
+
+
+@pytest.mark.parametrize(
+    "sort_by,sort_dir",
+    [("row", "asc"), ("stars", "desc"), ("sentiment_confidence", "asc")],
+)
+def test_keyset_pages_cover_every_row_once_in_order(store, sort_by, sort_dir):
+    store.replace_all([review(i) for i in range(53)])
+    seen, cursor = [], None
+    while True:
+        page = store.query(sort_by=sort_by, sort_dir=sort_dir, cursor=cursor, limit=10)
+        seen.extend(page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert sorted(item["review_id"] for item in seen) == sorted(
+        f"R{i}" for i in range(53)
+    )
+    column = {
+        "row": None,
+        "stars": "predicted_sentiment_stars",
+        "sentiment_confidence": "sentiment_confidence",
+    }[sort_by]
+    if column:
+        values = [item[column] for item in seen]
+        assert values == sorted(values, reverse=sort_dir == "desc")
+    else:
+        assert [item["review_id"] for item in seen] == [f"R{i}" for i in range(53)]
+
+
+def test_query_filters_and_total(store):
+    store.replace_all([review(i) for i in range(30)])
+    page = store.query(
+        languages=["en"], stars=[2, 4], min_confidence=0.6, include_total=True
+    )
+    assert page["total"] == len(page["items"]) > 0
+    for item in page["items"]:
+        assert item["detected_language"] == "en"
+        assert item["predicted_sentiment_stars"] in (2, 4)
+        assert item["sentiment_confidence"] >= 0.6
+
+
+def test_query_rejects_bad_arguments(store):
+    with pytest.raises(ValueError):
+        store.query(sort_by="text_preview")
+    with pytest.raises(ValueError):
+        store.query(sort_dir="up")
+    with pytest.raises(ValueError):
+        store.query(cursor="not-a-cursor")
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(0.75, 42)) == (0.75, 42)
+
+
+def test_iter_batches_streams_matching_rows(store):
+    store.replace_all([review(i) for i in range(25)])
+    batches = list(store.iter_batches(batch_size=10))
+    assert [len(b) for b in batches] == [10, 10, 5]
+    french = [r for b in store.iter_batches(batch_size=4, languages=["fr"]) for r in b]
+    assert len(french) == 13
+
+
+def test_version_1_database_is_migrated(tmp_path):
+    db_path = tmp_path / "results.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("""
+        CREATE TABLE review_results (
+            id INTEGER PRIMARY KEY,
+            review_id TEXT NOT NULL,
+            product_id TEXT NOT NULL DEFAULT '',
+            text_preview TEXT NOT NULL DEFAULT '',
+            detected_language TEXT NOT NULL DEFAULT 'unknown',
+            language_confidence REAL NOT NULL DEFAULT 0,
+            predicted_sentiment_stars INTEGER NOT NULL DEFAULT 0,
+            sentiment_confidence REAL NOT NULL DEFAULT 0
+        )
+        """)
+    conn.execute(
+        "CREATE UNIQUE INDEX idx_review_results_review_id ON review_results (review_id)"
+    )
+    conn.executemany(
+        "INSERT INTO review_results (review_id) VALUES (?)", [("A",), ("B",)]
+    )
+    conn.execute("PRAGMA user_version=1")
+    conn.commit()
+    conn.close()
+
+    store = ReviewResultsStore(str(db_path))
+    assert store.count() == 2
+    store.upsert([{"review_id": "A", "predicted_sentiment_stars": 4}])
+    store.upsert([review(0, review_id="A")])
+    assert store.count() == 3
+
+
+def test_store_without_dialect_hooks_cannot_be_instantiated():
+    class Incomplete(SQLResultsStore):
+        def _connect(self):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
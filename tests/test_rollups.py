@@ -0,0 +1,81 @@
+import pytest
+
+from backend.app.config import RollupDimensionConfig
+from backend.app.core.rollups import RollupIndex, dimension_values, summarize
+
+ROLLUPS = {
+    "product": {
+        "P1": {5: 3, 4: 1},
+        "P2": {1: 2, 0: 1},
+        "P3": {0: 2},
+        "P4": {3: 6},
+    }
+}
+
+
+def test_dimension_values_bucket_dates_and_mark_missing():
+    dims = [
+        RollupDimensionConfig(name="product", column="product_id"),
+        RollupDimensionConfig(name="month", column="date", bucket="month"),
+        RollupDimensionConfig(name="week", column="date", bucket="week"),
+    ]
+    row = {"product_id": 42, "date": "2024-01-01T10:00:00"}
+    assert dimension_values(row, dims) == {
+        "product": "42",
+        "month": "2024-01",
+        "week": "2024-W01",
+    }
+    assert dimension_values({"date": "not a date"}, dims) == {
+        "product": "unknown",
+        "month": "unknown",
+        "week": "unknown",
+    }
+
+
+def test_summarize_excludes_unrated_rows_from_mean():
+    summary = summarize("P2", {"1": 2, "0": 1, "5": 1})
+    assert summary["count"] == 4
+    assert summary["rated"] == 3
+    assert summary["star_histogram"] == {1: 2, 5: 1}
+    assert summary["mean_rating"] == round(7 / 3, 4)
+    assert summarize("P3", {0: 2})["mean_rating"] is None
+
+
+def test_top_by_count_and_rating():
+    index = RollupIndex(ROLLUPS)
+    assert [s["value"] for s in index.top("product", k=2)] == ["P4", "P1"]
+    assert [s["value"] for s in index.top("product", by="mean_rating")] == [
+        "P1",
+        "P4",
+        "P2",
+    ]
+    worst = index.top("product", k=1, by="mean_rating", ascending=True)
+    assert worst[0]["value"] == "P2"
+
+
+def test_top_min_count_and_value_filter():
+    index = RollupIndex(ROLLUPS)
+    assert [s["value"] for s in index.top("product", min_count=3)] == [
+        "P4",
+        "P1",
+        "P2",
+    ]
+    assert [s["value"] for s in index.top("product", ascending=True, min_count=3)] == [
+        "P2",
+        "P1",
+        "P4",
+    ]
+    picked = index.top("product", by="mean_rating", values=["P3", "P2", "missing"])
+    assert [s["value"] for s in picked] == ["P2", "P3"]
+
+
+def test_lookup_and_errors():
+    index = RollupIndex(ROLLUPS)
+    assert index.dimensions() == ["product"]
+    assert index.size("product") == 4
+    assert index.get("product", "P4")["mean_rating"] == 3.0
+    assert index.get("product", "nope") is None
+    with pytest.raises(ValueError):
+        index.top("region")
+    with pytest.raises(ValueError):
+        index.top("product", by="median")
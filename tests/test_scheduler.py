@@ -0,0 +1,126 @@
+import asyncio
+
+import pytest
+
+from backend.app.core.scheduler import BULK, INTERACTIVE, InferenceScheduler
+
+
+def make(capacity=2, interactive=3.0, bulk=1.0, reserved=None):
+    return InferenceScheduler(
+        capacity, {INTERACTIVE: interactive, BULK: bulk}, reserved=reserved
+    )
+
+
+def test_reserved_slots_are_held_back_from_bulk():
+    async def scenario():
+        scheduler = make(capacity=3, reserved={INTERACTIVE: 1})
+        release = asyncio.Event()
+        running = []
+
+        async def call(cls):
+            async with scheduler.slot(cls):
+                running.append(cls)
+                await release.wait()
+
+        tasks = [asyncio.create_task(call(BULK)) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert running == [BULK, BULK]
+        assert scheduler.stats()["classes"][BULK]["queued"] == 1
+        tasks.append(asyncio.create_task(call(INTERACTIVE)))
+        await asyncio.sleep(0)
+        assert running == [BULK, BULK, INTERACTIVE]
+        release.set()
+        await asyncio.gather(*tasks)
+        assert scheduler.in_use == 0
+        assert dict(scheduler.granted) == {BULK: 3, INTERACTIVE: 1}
+
+    asyncio.run(scenario())
+
+
+def test_contended_slots_follow_weights():
+    async def scenario():
+        scheduler = make(capacity=1)
+        order = []
+        gate = asyncio.Event()
+
+        async def call(cls):
+            async with scheduler.slot(cls):
+                order.append(cls)
+                await gate.wait()
+
+        blocker = asyncio.create_task(call(BULK))
+        await asyncio.sleep(0)
+        order.clear()
+        tasks = [asyncio.create_task(call(c)) for c in [BULK] * 8 + [INTERACTIVE] * 8]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(blocker, *tasks)
+        # 3:1 weights: interactive gets three of every four contended slots.
+        assert order[:8].count(INTERACTIVE) == 6
+        assert scheduler.stats()["classes"][INTERACTIVE]["waited"] == 8
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_leaves_the_queue():
+    async def scenario():
+        scheduler = make(capacity=1)
+        gate = asyncio.Event()
+
+        async def call(cls):
+            async with scheduler.slot(cls):
+                await gate.wait()
+
+        holder = asyncio.create_task(call(BULK))
+        waiter = asyncio.create_task(call(BULK))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.stats()["classes"][BULK]["queued"] == 0
+        gate.set()
+        await holder
+        assert scheduler.in_use == 0
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("cancel_first", [True, False])
+def test_cancel_racing_a_grant_does_not_leak_the_slot(cancel_first):
+    async def scenario():
+        scheduler = make(capacity=1)
+
+        async def call():
+            async with scheduler.slot(BULK):
+                await asyncio.sleep(0)
+
+        holder = scheduler.slot(BULK)
+        await holder.__aenter__()
+        waiter = asyncio.create_task(call())
+        await asyncio.sleep(0)
+        # Release and cancel in the same loop step, in either order.
+        if cancel_first:
+            waiter.cancel()
+        await holder.__aexit__(None, None, None)
+        if not cancel_first:
+            waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert scheduler.in_use == 0
+        assert scheduler.stats()["classes"][BULK]["queued"] == 0
+        async with scheduler.slot(BULK):
+            assert scheduler.in_use == 1
+
+    asyncio.run(scenario())
+
+
+def test_invalid_configuration():
+    with pytest.raises(ValueError):
+        make(capacity=2, reserved={INTERACTIVE: 2})
+
+    async def unknown():
+        async with make().slot("batch"):
+            pass
+
+    with pytest.raises(ValueError):
+        asyncio.run(unknown())
@@ -0,0 +1,85 @@
+import os
+
+import pytest
+
+from backend.app.core import serialization
+from backend.app.core.serialization import (
+    SERIALIZERS,
+    decode,
+    encode,
+    read_cache_file,
+    write_cache_file,
+)
+
+PAYLOAD = {
+    "sentiment_distribution": {1: 3, 5: 9},
+    "nested": {"pair": (1, 2), "values": [0.5, None, True]},
+    "label": "positive",
+}
+JSON_TYPED = {
+    "sentiment_distribution": {"1": 3, "5": 9},
+    "nested": {"pair": [1, 2], "values": [0.5, None, True]},
+    "label": "positive",
+}
+
+
+def serializer_of(frame):
+    return frame[len(serialization.CACHE_MAGIC)]
+
+
+def test_small_payload_uses_json():
+    frame = encode(PAYLOAD, binary_threshold_bytes=1 << 20)
+    assert serializer_of(frame) == SERIALIZERS["json"]
+    assert decode(frame) == JSON_TYPED
+
+
+def test_large_payload_uses_pickle_with_json_types():
+    frame = encode(PAYLOAD, binary_threshold_bytes=16)
+    assert serializer_of(frame) == SERIALIZERS["pickle"]
+    assert decode(frame) == JSON_TYPED
+
+
+def test_explicit_pickle_keeps_python_types():
+    frame = encode(PAYLOAD, serializer="pickle")
+    assert decode(frame) == PAYLOAD
+
+
+def test_non_json_payload_falls_back_to_pickle():
+    data = {"tags": {"a", "b"}}
+    frame = encode(data)
+    assert serializer_of(frame) == SERIALIZERS["pickle"]
+    assert decode(frame) == data
+
+
+@pytest.mark.parametrize("compression", ["none", "gzip", "zstd"])
+def test_compression_round_trip(compression):
+    data = {"text": "great product " * 200}
+    frame = encode(data, compression=compression)
+    assert decode(frame) == data
+    if compression != "none":
+        assert len(frame) < len(encode(data))
+
+
+def test_decode_rejects_unframed_bytes():
+    with pytest.raises(ValueError):
+        decode(b'{"a": 1}')
+
+
+def test_cache_file_write_is_atomic(tmp_path, monkeypatch):
+    path = tmp_path / "stats.json"
+    write_cache_file(path, {"v": 1})
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(serialization.os, "replace", fail_replace)
+    with pytest.raises(OSError):
+        write_cache_file(path, {"v": 2})
+    assert read_cache_file(path) == {"v": 1}
+    assert os.listdir(tmp_path) == ["stats.json"]
+
+
+def test_reads_legacy_plain_json(tmp_path):
+    path = tmp_path / "legacy.json"
+    path.write_text('{"a": [1, 2]}')
+    assert read_cache_file(path) == {"a": [1, 2]}
@@ -0,0 +1,94 @@
+import random
+
+from backend.app.core.sketches import StatsSketch, wilson_interval
+
+
+def shard(seed, rows=50):
+    rng = random.Random(seed)
+    sketch = StatsSketch()
+    for _ in range(rows):
+        lang = rng.choice(["en", "de", "fr"])
+        stars = rng.choice([0, 1, 2, 3, 4, 5])
+        sketch.add(
+            lang,
+            stars,
+            dimensions={"product_id": rng.choice(["P1", "P2"])},
+            language_confidence=rng.random(),
+            sentiment_confidence=rng.random(),
+            trend_buckets={"day": rng.choice(["2024-01-01", "2024-01-02"])},
+        )
+    sketch.add_failure(seed % 3)
+    sketch.add_scored(rows - seed % 5)
+    sketch.add_duplicates(exact=seed % 5)
+    sketch.add_token_usage({"sentiment": {"calls": rows, "input_tokens": 10 * rows}})
+    return sketch
+
+
+def canonical(sketch):
+    """State with confidence sketches reduced to their sorted values, which
+    is exact while the sketches are too small to compact."""
+    state = sketch.to_state()
+    for keys in state["confidence"].values():
+        for metrics in keys.values():
+            for metric, data in metrics.items():
+                metrics[metric] = (
+                    data["n"],
+                    sorted(v for level in data["compactors"] for v in level),
+                )
+    return state
+
+
+def test_merge_is_associative_and_commutative():
+    a, b, c = (shard(seed) for seed in (1, 2, 3))
+    left = StatsSketch.merge_all([StatsSketch.merge_all([a, b]), c])
+    right = StatsSketch.merge_all([a, StatsSketch.merge_all([b, c])])
+    reordered = StatsSketch.merge_all([c, a, b])
+    assert canonical(left) == canonical(right) == canonical(reordered)
+    assert left.processed == a.processed + b.processed + c.processed
+    assert left.failed == 1 + 2 + 0
+
+
+def test_merge_matches_single_pass():
+    combined = StatsSketch()
+    for seed in (1, 2):
+        rng = random.Random(seed)
+        for _ in range(50):
+            combined.add(
+                rng.choice(["en", "de", "fr"]),
+                rng.choice([0, 1, 2, 3, 4, 5]),
+                dimensions={"product_id": rng.choice(["P1", "P2"])},
+                language_confidence=rng.random(),
+                sentiment_confidence=rng.random(),
+                trend_buckets={"day": rng.choice(["2024-01-01", "2024-01-02"])},
+            )
+    merged = StatsSketch.merge_all([shard(1), shard(2)])
+    assert merged.to_stats()["overall_sentiment_distribution"] == dict(
+        combined.star_counts
+    )
+    assert merged.rollups_payload() == combined.rollups_payload()
+    assert merged.trends_payload() == combined.trends_payload()
+
+
+def test_state_round_trip_through_json_keys():
+    sketch = shard(4)
+    state = sketch.to_state()
+    state["star_counts"] = {str(k): v for k, v in state["star_counts"].items()}
+    restored = StatsSketch.from_state(state)
+    assert canonical(restored) == canonical(sketch)
+    assert all(isinstance(k, int) for k in restored.star_counts)
+
+
+def test_unrated_rows_are_counted_but_not_in_star_distribution():
+    sketch = StatsSketch()
+    sketch.add("en", 0)
+    sketch.add("en", 4)
+    stats = sketch.to_stats()
+    assert stats["total_reviews_processed"] == 2
+    assert stats["overall_sentiment_distribution"] == {4: 1}
+    assert sketch.rollups_payload() == {}
+
+
+def test_wilson_interval_bounds():
+    assert wilson_interval(0, 0, 1.96) == (0.0, 1.0)
+    low, high = wilson_interval(50, 100, 1.96)
+    assert 0.39 < low < 0.5 < high < 0.61
@@ -0,0 +1,114 @@
+import pytest
+
+from backend.app.core.tokens import (
+    ELISION,
+    HeuristicTokenizer,
+    Tokenizer,
+    TokenUsage,
+    current_run_usage,
+    fit_to_budget,
+    get_tokenizer,
+    normalize_whitespace,
+    track_token_usage,
+)
+
+LONG_TEXT = " ".join(f"word{i}" for i in range(200))
+
+
+class FixedTokenizer(HeuristicTokenizer):
+    def __init__(self):
+        super().__init__(chars_per_token=2.0)
+
+
+class HalfTokenizer(Tokenizer):
+    # Missing head and tail: cannot be instantiated.
+    def count(self, text):
+        return len(text)
+
+
+def test_normalize_whitespace():
+    assert normalize_whitespace("  a\n\tb  c  ") == "a b c"
+
+
+def test_heuristic_count_and_cuts_on_word_boundaries():
+    tokenizer = HeuristicTokenizer(4.0)
+    assert tokenizer.count("") == 0
+    assert tokenizer.count("abcde") == 2
+    head = tokenizer.head(LONG_TEXT, 10)
+    tail = tokenizer.tail(LONG_TEXT, 10)
+    assert len(head) <= 40 and LONG_TEXT.startswith(head)
+    assert len(tail) <= 40 and LONG_TEXT.endswith(tail)
+    assert head.split()[-1] in LONG_TEXT.split()
+    assert tail.split()[0] in LONG_TEXT.split()
+    assert tokenizer.head("short", 10) == "short"
+
+
+@pytest.mark.parametrize("strategy", ["truncate", "head_tail"])
+@pytest.mark.parametrize("budget", [5, 20, 100])
+def test_fit_to_budget_stays_within_budget(strategy, budget):
+    tokenizer = HeuristicTokenizer(4.0)
+    fitted = fit_to_budget(LONG_TEXT, tokenizer, budget, strategy)
+    assert tokenizer.count(fitted) <= budget + 1
+    assert LONG_TEXT.startswith(fitted.split(ELISION)[0])
+
+
+def test_head_tail_keeps_start_and_end():
+    tokenizer = HeuristicTokenizer(4.0)
+    fitted = fit_to_budget(LONG_TEXT, tokenizer, 60, "head_tail")
+    head, tail = fitted.split(ELISION)
+    assert head.startswith("word0 ")
+    assert tail.endswith("word199")
+    assert len(head) > len(tail)
+
+
+def test_head_tail_falls_back_to_truncate_for_tiny_budgets():
+    tokenizer = HeuristicTokenizer(4.0)
+    assert fit_to_budget(LONG_TEXT, tokenizer, 1, "head_tail") == tokenizer.head(
+        LONG_TEXT, 1
+    )
+
+
+def test_get_tokenizer_builtin_specs():
+    assert isinstance(get_tokenizer("heuristic"), HeuristicTokenizer)
+    assert get_tokenizer("heuristic:3").chars_per_token == 3.0
+    assert isinstance(get_tokenizer(f"{__name__}:FixedTokenizer"), Tokenizer)
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "unknown",
+        "heuristic:abc",
+        "heuristic:0",
+        "os:abort",
+        "os:getcwd",
+        "builtins:object",
+        "no_such_module_xyz:Tokenizer",
+        "backend.app.core.tokens:NoSuchClass",
+        "backend.app.core.tokens:Tokenizer.count",
+        "backend.app.core.tokens:Tokenizer",
+        f"{__name__}:HalfTokenizer",
+    ],
+)
+def test_get_tokenizer_rejects_anything_but_tokenizer_subclasses(spec):
+    with pytest.raises(ValueError):
+        get_tokenizer(spec)
+
+
+def test_token_usage_is_tracked_per_context():
+    assert current_run_usage() is None
+    with track_token_usage() as usage:
+        current_run_usage().record("sentiment", 10)
+        current_run_usage().record("sentiment", 30, dropped_tokens=5)
+        current_run_usage().record("language", 4)
+    assert current_run_usage() is None
+    assert usage.to_dict() == {
+        "sentiment": {
+            "calls": 2,
+            "input_tokens": 40,
+            "truncated": 1,
+            "dropped_tokens": 5,
+        },
+        "language": {"calls": 1, "input_tokens": 4},
+    }
+    assert str(TokenUsage()) == "no model calls"
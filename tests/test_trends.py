@@ -0,0 +1,85 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from backend.app.core.sketches import StatsSketch
+from backend.app.core.trends import TrendIndex, trend_buckets
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def index():
+    sketch = StatsSketch()
+    rows = [
+        ("2024-03-01T09:15:00Z", 5),
+        ("2024-03-01T09:45:00Z", 4),
+        ("2024-03-01T11:00:00Z", 1),
+        ("2024-03-02T08:00:00Z", 0),
+        ("2024-03-05T12:00:00Z", 3),
+    ]
+    for ts, stars in rows:
+        sketch.add("en", stars, trend_buckets=trend_buckets(ts))
+    return TrendIndex(sketch.trends_payload())
+
+
+def test_trend_buckets_are_utc():
+    assert trend_buckets("2024-03-01T23:30:00-02:00") == {
+        "hour": "2024-03-02T01:00",
+        "day": "2024-03-02",
+    }
+    assert trend_buckets(None) is None
+    assert trend_buckets("garbage") is None
+
+
+def test_window_totals_match_buckets(index):
+    result = index.window(utc(2024, 3, 1, 9), utc(2024, 3, 1, 12))
+    assert result["granularity"] == "hour"
+    assert result["total"]["count"] == 3
+    assert result["total"]["star_histogram"] == {1: 1, 4: 1, 5: 1}
+    assert [s["value"] for s in result["series"]] == [
+        "2024-03-01T09:00",
+        "2024-03-01T11:00",
+    ]
+
+
+def test_window_end_is_exclusive(index):
+    result = index.window(utc(2024, 3, 1, 9), utc(2024, 3, 1, 11))
+    assert result["total"]["count"] == 2
+
+
+def test_auto_granularity_switches_to_days(index):
+    result = index.window(utc(2024, 3, 1), utc(2024, 3, 8))
+    assert result["granularity"] == "day"
+    assert [s["value"] for s in result["series"]] == [
+        "2024-03-01",
+        "2024-03-02",
+        "2024-03-05",
+    ]
+    assert result["total"]["count"] == 5
+    assert result["total"]["rated"] == 4
+
+
+def test_default_window_ends_after_latest_bucket(index):
+    assert index.latest() == utc(2024, 3, 5, 12)
+    result = index.window()
+    assert result["total"]["count"] == 5
+    assert result["end"] == utc(2024, 3, 5, 13).isoformat()
+
+
+def test_window_errors(index):
+    with pytest.raises(ValueError):
+        index.window(utc(2024, 3, 2), utc(2024, 3, 1))
+    with pytest.raises(ValueError):
+        index.window(granularity="week")
+    assert TrendIndex().is_empty()
+    assert TrendIndex().window(end=utc(2024, 1, 1))["total"]["count"] == 0
+
+
+def test_naive_datetimes_are_treated_as_utc(index):
+    naive = index.window(datetime(2024, 3, 1, 9), datetime(2024, 3, 1, 12))
+    aware = index.window(utc(2024, 3, 1, 9), utc(2024, 3, 1, 12))
+    assert naive == aware
+    assert naive["start"] == utc(2024, 3, 1, 9).isoformat()